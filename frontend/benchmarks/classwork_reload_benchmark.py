@@ -0,0 +1,109 @@
+# classwork_reload_benchmark.py
+"""
+Times opening the classworks page of a class with many classwork items (topic
+sections build their frames only once scrolled into view) and reloading it, as
+after creating a post or a topic, with the topic widgets and frames recycled
+through their pools and with the pools disabled (every widget rebuilt).
+
+Run from the repository root:
+    QT_QPA_PLATFORM=offscreen python -m frontend.benchmarks.classwork_reload_benchmark --items 1000 --topics 5 100
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from PyQt6.QtCore import QCoreApplication, QEvent
+from PyQt6.QtWidgets import QApplication
+
+from frontend.controller.classwork_controller import ClassworkController
+from frontend.services.classwork_service import ClassworkService
+from frontend.views.default.Academics.Classroom.Shared.classroom_classworks import ClassroomClassworks
+
+CLASS = {"id": 1, "code": "CS101", "title": "Benchmark Class", "section": "A", "schedule": "MWF 9:00"}
+
+
+def write_classwork(path, item_count, topic_count):
+    """Write a classroom data file with item_count posts spread over topic_count topics (and Untitled)."""
+    start = datetime(2025, 1, 1, 8, 0, 0)
+    topics = [
+        {"id": i + 1, "class_id": CLASS["id"], "title": f"Week {i + 1:02d}", "type": "material",
+         "created_at": start.strftime("%Y-%m-%d %H:%M:%S")}
+        for i in range(topic_count)
+    ]
+    posts = [
+        {
+            "id": i + 1,
+            "topic_id": None if i % (topic_count + 1) == 0 else i % (topic_count + 1),
+            "class_id": CLASS["id"],
+            "title": f"Classwork item {i}",
+            "content": "Details",
+            "type": "material" if i % 3 else "assessment",
+            "attachment": None,
+            "score": None,
+            "date": (start + timedelta(minutes=53 * i)).strftime("%Y-%m-%d %H:%M:%S"),
+            "author": "Faculty",
+        }
+        for i in range(item_count)
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"posts": posts, "topics": topics}, f)
+
+
+def flush(app):
+    """Run pending layouts, polishes and deferred deletes."""
+    app.processEvents()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+    app.processEvents()
+
+
+def time_reloads(app, view, repeat):
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        view.load_posts()
+        flush(app)
+        runs.append((time.perf_counter() - start) * 1000)
+    return runs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, nargs="+", default=[1000])
+    parser.add_argument("--topics", type=int, nargs="+", default=[5, 100])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    print(f"{'items':>6} {'topics':>6} {'mode':>9} {'open ms':>8} {'frames':>7} "
+          f"{'reload median ms':>17} {'created':>8} {'reused':>8}")
+    with tempfile.TemporaryDirectory() as data_dir:
+        for item_count, topic_count in ((items, topics) for items in args.items for topics in args.topics):
+            path = os.path.join(data_dir, f"classwork_{item_count}_{topic_count}.json")
+            write_classwork(path, item_count, topic_count)
+            for mode in ("rebuild", "recycle"):
+                start = time.perf_counter()
+                view = ClassroomClassworks(CLASS, "faculty", ClassworkController(ClassworkService(path)))
+                view.resize(1280, 800)
+                view.show()
+                flush(app)
+                open_ms = (time.perf_counter() - start) * 1000
+                frames = view.frame_pool.created
+                if mode == "rebuild":
+                    # A pool that keeps nothing deletes every released widget, as reloads did before.
+                    view.frame_pool.limit = view.topic_pool.limit = 0
+                runs = time_reloads(app, view, args.repeat)
+                stats = view.frame_pool.stats()
+                print(f"{item_count:6d} {topic_count:6d} {mode:>9} {open_ms:8.1f} {frames:7d} "
+                      f"{statistics.median(runs):17.1f} {stats['created']:8d} {stats['reused']:8d}")
+                view.close()
+                view.deleteLater()
+                flush(app)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# grade_audit_benchmark.py
+"""
+Writes a term's worth of synthetic grade edits to an audit log, then times
+indexing the log, reopening it from the saved index and reconstructing
+single students' histories.
+
+Run from the repository root:
+    python -m frontend.benchmarks.grade_audit_benchmark --edits 1000000 --students 5000
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from frontend.services.grade_audit_service import GradeAuditService
+from frontend.utils.component_catalog import ComponentCatalog, DEFAULT_COMPONENTS
+
+
+def synthetic_edits(edit_count, student_count, batch_size, seed=5):
+    """Yield batches of (timestamp, user, student_id, component_key, old_text, new_text) records."""
+    rng = random.Random(seed)
+    keys = ComponentCatalog(DEFAULT_COMPONENTS).keys
+    current = {}
+    timestamp = 1_700_000_000.0
+    batch = []
+    for _ in range(edit_count):
+        cell = (str(1000 + rng.randrange(student_count)), rng.choice(keys))
+        new_text = f"{rng.randint(10, 50)}/50" if rng.random() < 0.8 else str(rng.randint(40, 100))
+        timestamp += rng.random()
+        batch.append((timestamp, "faculty", cell[0], cell[1], current.get(cell, ""), new_text))
+        current[cell] = new_text
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--edits", type=int, default=1000000)
+    parser.add_argument("--students", type=int, default=5000)
+    parser.add_argument("--batch", type=int, default=200, help="records per write, as sent by one autosave")
+    parser.add_argument("--lookups", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as audit_dir:
+        service = GradeAuditService(os.path.join(audit_dir, "missing.json"), audit_dir)
+        start = time.perf_counter()
+        for batch in synthetic_edits(args.edits, args.students, args.batch):
+            service.append(1, batch)
+        write_s = time.perf_counter() - start
+        size = os.path.getsize(service.get_log_path(1))
+        print(f"{args.edits} edits of {args.students} students: written in {write_s:.2f} s "
+              f"({args.edits / write_s:,.0f} records/s), {size / 1024 / 1024:.1f} MiB, "
+              f"{size / args.edits:.0f} bytes/record")
+
+        start = time.perf_counter()
+        reader = service.open_reader(1)
+        print(f"{'cold open':>12}: {(time.perf_counter() - start) * 1000:9.1f} ms (index built from the log)")
+        start = time.perf_counter()
+        reader = service.open_reader(1)
+        print(f"{'warm open':>12}: {(time.perf_counter() - start) * 1000:9.1f} ms (saved index)")
+
+        rng = random.Random(9)
+        students = [str(1000 + rng.randrange(args.students)) for _ in range(args.lookups)]
+        start = time.perf_counter()
+        entries = sum(len(reader.history(student_id)) for student_id in students)
+        lookup_ms = (time.perf_counter() - start) * 1000 / len(students)
+        print(f"{'history':>12}: {lookup_ms:9.2f} ms per student ({entries / len(students):.0f} changes each)")
+
+
+if __name__ == "__main__":
+    main()
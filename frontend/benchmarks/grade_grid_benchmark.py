@@ -0,0 +1,88 @@
+# grade_grid_benchmark.py
+"""
+Measures how the virtualized grade grid scales with the roster: build time,
+resident memory added per table and the time to paint a frame while scrolling.
+
+Run from the repository root:
+    QT_QPA_PLATFORM=offscreen python -m frontend.benchmarks.grade_grid_benchmark --sizes 50 500 2000 10000
+"""
+import argparse
+import gc
+import sys
+import time
+
+from PyQt6.QtWidgets import QApplication
+
+from frontend.views.default.Academics.Classroom.Faculty.classroom_grades_view import (
+    GradeDataModel, GradeController, CollapsibleGradesTable
+)
+
+
+def resident_kib():
+    """Current resident set size in KiB (Linux only; None elsewhere)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return pages * 4
+
+
+def build_table(student_count):
+    """Create a fully expanded grade table with a synthetic, partly graded roster."""
+    model = GradeDataModel()
+    controller = GradeController(model)
+    students = [{'id': str(1000 + i), 'name': f"Student {i:05d}"} for i in range(student_count)]
+    grades = {s['id']: {'pt1_midterm': '45/50', 'quiz1_midterm': '8/10', 'prelimexam_midterm': '70'} for s in students}
+    model.load_gradebook(None, students, grades)
+    for key in model.column_states:
+        if key.endswith('_expanded'):
+            model.column_states[key] = True
+    table = CollapsibleGradesTable(model, controller)
+    return model, controller, table
+
+
+def scroll_frames(app, table, frames):
+    """Scroll diagonally through the table, repainting synchronously; return per-frame times in ms."""
+    vertical = table.verticalScrollBar()
+    horizontal = table.horizontalScrollBar()
+    times = []
+    for frame in range(frames):
+        vertical.setValue(vertical.maximum() * frame // max(frames - 1, 1))
+        horizontal.setValue(horizontal.maximum() * frame // max(frames - 1, 1))
+        start = time.perf_counter()
+        table.viewport().repaint()
+        table.frozen_view.viewport().repaint()
+        times.append((time.perf_counter() - start) * 1000)
+        app.processEvents()
+    return times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 500, 2000, 10000])
+    parser.add_argument("--frames", type=int, default=60)
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    print(f"{'students':>8} {'build ms':>9} {'memory KiB':>11} {'frame avg ms':>13} {'frame max ms':>13}")
+    for size in args.sizes:
+        gc.collect()
+        before = resident_kib()
+        start = time.perf_counter()
+        model, controller, table = build_table(size)
+        table.resize(1280, 720)
+        table.show()
+        app.processEvents()
+        build_ms = (time.perf_counter() - start) * 1000
+        after = resident_kib()
+        times = scroll_frames(app, table, args.frames)
+        memory = f"{after - before:11d}" if before is not None else f"{'n/a':>11}"
+        print(f"{size:8d} {build_ms:9.1f} {memory} {sum(times) / len(times):13.2f} {max(times):13.2f}")
+        table.close()
+        table.deleteLater()
+        app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# grade_input_benchmark.py
+"""
+Replays a scripted typing session on the grade sheet and compares the old
+per-keystroke recalculation with the debounced input handling.
+
+Run from the repository root:
+    QT_QPA_PLATFORM=offscreen python -m frontend.benchmarks.grade_input_benchmark
+"""
+import argparse
+import sys
+import time
+
+from PyQt6.QtWidgets import QApplication
+
+from frontend.views.default.Academics.Classroom.Faculty.classroom_grades_view import (
+    GradeDataModel, GradeController, CollapsibleGradesTable
+)
+
+
+def build_table(student_count):
+    """Create a grade table with a synthetic roster and the midterm quiz columns expanded."""
+    model = GradeDataModel()
+    controller = GradeController(model)
+    table = CollapsibleGradesTable(model, controller)
+    students = [{'id': str(1000 + i), 'name': f"Student {i:05d}"} for i in range(student_count)]
+    model.load_gradebook(None, students, {})
+    model.column_states['midterm_expanded'] = True
+    model.column_states['quiz_midterm_expanded'] = True
+    table.rebuild_table_structure()
+    return model, controller, table
+
+
+def count_recalculations(controller):
+    """Wrap the controller's grade calculations and return a counter dict."""
+    counter = {'recalculations': 0, 'row_recalculations': 0}
+    calculate_all_grades = controller.calculate_all_grades
+    calculate_grades_for_student = controller.calculate_grades_for_student
+
+    def counted():
+        counter['recalculations'] += 1
+        return calculate_all_grades()
+
+    def counted_row(student_id):
+        counter['row_recalculations'] += 1
+        return calculate_grades_for_student(student_id)
+
+    controller.calculate_all_grades = counted
+    controller.calculate_grades_for_student = counted_row
+    return counter
+
+
+def grade_cells(table, cell_count):
+    """Return the first cell_count (student_id, component_key, model index) grade cells."""
+    cells = []
+    grid_model = table.grid_model
+    for row in range(grid_model.rowCount()):
+        for col, info in table.column_info_map.items():
+            if info.get('type') == 'grade_input':
+                cells.append((grid_model.student_id(row), info['component_key'], grid_model.index(row, col)))
+                if len(cells) == cell_count:
+                    return cells
+    return cells
+
+
+def run_typing(app, student_count, cell_count, text, per_keystroke):
+    """Feed the same keystrokes through the table's input handler into the model.
+
+    Neither mode shows the table, so both time the same model and recalculation
+    code. per_keystroke reproduces the legacy behaviour: every keystroke is
+    committed to the model and the whole table is recalculated. Otherwise the
+    keystrokes are debounced, committed once per cell as on editingFinished, and
+    only the edited student's row is recalculated by the scheduled refresh.
+    """
+    model, controller, table = build_table(student_count)
+    app.processEvents()
+    counter = count_recalculations(controller)
+    cells = grade_cells(table, cell_count)
+    start = time.perf_counter()
+    for student_id, component_key, _ in cells:
+        for i in range(1, len(text) + 1):
+            table.on_grade_input_changed(student_id, component_key, text[:i])
+            if per_keystroke:
+                table.commit_pending_edits()
+                table.refresh_data_display(full=True)
+            app.processEvents()
+        # Tabbing out of the field finishes the edit.
+        table.commit_pending_edits()
+        app.processEvents()
+    elapsed = time.perf_counter() - start
+    return counter, elapsed
+
+
+def run_before(app, student_count, cell_count, text):
+    """Legacy behaviour: every keystroke updates the model and recalculates the whole table."""
+    return run_typing(app, student_count, cell_count, text, per_keystroke=True)
+
+
+def run_after(app, student_count, cell_count, text):
+    """Debounced behaviour: each cell is committed once and only its row is recalculated."""
+    return run_typing(app, student_count, cell_count, text, per_keystroke=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--students", type=int, default=200)
+    parser.add_argument("--cells", type=int, default=20)
+    parser.add_argument("--text", default="100/100")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    keystrokes = args.cells * len(args.text)
+    print(f"Typing {args.text!r} into {args.cells} cells ({keystrokes} keystrokes), {args.students} students")
+    for label, run in (("before", run_before), ("after", run_after)):
+        counter, elapsed = run(app, args.students, args.cells, args.text)
+        print(f"{label:>6}: {counter['recalculations']:5d} table recalculations, "
+              f"{counter['row_recalculations']:5d} row recalculations, {elapsed * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
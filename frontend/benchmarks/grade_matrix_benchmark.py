@@ -0,0 +1,156 @@
+# grade_matrix_benchmark.py
+"""
+Compares the memory and access time of the sparse GradeMatrix with the
+dict-of-dicts gradebook it replaced.
+
+Run from the repository root:
+    python -m frontend.benchmarks.grade_matrix_benchmark --students 5000 --fill 0.6
+"""
+import argparse
+import json
+import random
+import time
+import tracemalloc
+
+from frontend.utils.grade_matrix import GradeMatrix
+
+TERMS = ("midterm", "finalterm")
+ITEMS = ("pt1", "pt2", "pt3", "quiz1", "quiz2", "quiz3", "quiz4", "prelimexam", "finalexam")
+
+
+def component_keys():
+    return [f"{item}_{term}" for term in TERMS for item in ITEMS]
+
+
+def synthetic_cells(student_count, fill, seed=7):
+    """Return [(student_id, component_key, grade_text)] with roughly fill of the cells filled."""
+    rng = random.Random(seed)
+    keys = component_keys()
+    cells = []
+    for i in range(student_count):
+        student_id = str(1000 + i)
+        for key in keys:
+            if rng.random() < fill:
+                score = rng.randint(20, 50)
+                cells.append((student_id, key, f"{score}/50" if rng.random() < 0.7 else str(score * 2)))
+    return cells
+
+
+def journal_lines(cells):
+    """Encode cells as gradebook journal lines, as GradeService stores them."""
+    return [json.dumps({"student_id": s, "component": k, "grade": t}) for s, k, t in cells]
+
+
+def build_dicts(student_ids, lines):
+    grades = {student_id: {} for student_id in student_ids}
+    for line in lines:
+        record = json.loads(line)
+        grades[record["student_id"]][record["component"]] = record["grade"]
+    return grades
+
+
+def build_matrix(student_ids, lines):
+    grades = GradeMatrix(component_keys())
+    for student_id in student_ids:
+        grades.add_student(student_id)
+    for line in lines:
+        record = json.loads(line)
+        grades.set(record["student_id"], record["component"], record["grade"])
+    return grades
+
+
+def fill_dicts(student_ids, cells):
+    grades = {student_id: {} for student_id in student_ids}
+    for student_id, component_key, grade_text in cells:
+        grades[student_id][component_key] = grade_text
+    return grades
+
+
+def fill_matrix(student_ids, cells):
+    grades = GradeMatrix(component_keys())
+    for student_id in student_ids:
+        grades.add_student(student_id)
+    for student_id, component_key, grade_text in cells:
+        grades.set(student_id, component_key, grade_text)
+    return grades
+
+
+def measure_memory(build, *args):
+    """Return (object, bytes allocated by build) using tracemalloc."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build(*args)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def time_call(function):
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--students", type=int, default=5000)
+    parser.add_argument("--fill", type=float, default=0.6)
+    args = parser.parse_args(argv)
+
+    keys = component_keys()
+    student_ids = [str(1000 + i) for i in range(args.students)]
+    cells = synthetic_cells(args.students, args.fill)
+    # Both layouts are built from a parsed journal, so each keeps whatever strings it retains.
+    lines = journal_lines(cells)
+    print(f"{args.students} students x {len(keys)} components, {len(cells)} filled cells")
+
+    dicts, dict_bytes = measure_memory(build_dicts, student_ids, lines)
+    matrix, matrix_bytes = measure_memory(build_matrix, student_ids, lines)
+    print(f"{'memory':>12}: dict-of-dicts {dict_bytes / 1024:9.1f} KiB, "
+          f"GradeMatrix {matrix_bytes / 1024:9.1f} KiB ({matrix_bytes / max(dict_bytes, 1):.2f}x)")
+
+    lookups = [(s, k) for s, k, _ in cells]
+    # Cells are visited in random order so lookups do not just walk each row front to back.
+    shuffled = random.Random(11).sample(cells, len(cells))
+    # label: (dict-of-dicts run, GradeMatrix run, single cell operations per run or None)
+    timings = {
+        "get": (
+            lambda: [dicts[s].get(k, "") for s, k in lookups],
+            lambda: [matrix.get(s, k) for s, k in lookups],
+            len(lookups),
+        ),
+        "percentage": (
+            None,
+            lambda: [matrix.percentage(s, k) for s, k in lookups],
+            len(lookups),
+        ),
+        "set": (
+            lambda: [dicts[s].__setitem__(k, t) for s, k, t in cells],
+            lambda: [matrix.set(s, k, t) for s, k, t in cells],
+            len(cells),
+        ),
+        "insert": (
+            lambda: fill_dicts(student_ids, shuffled),
+            lambda: fill_matrix(student_ids, shuffled),
+            len(cells),
+        ),
+        "row scan": (
+            lambda: [[dicts[s].get(k, "") for k in keys] for s in student_ids],
+            lambda: [matrix.text_row(s) for s in student_ids],
+            None,
+        ),
+        "column scan": (
+            lambda: [[(s, row[k]) for s, row in dicts.items() if k in row] for k in keys],
+            lambda: [list(matrix.column_items(k)) for k in keys],
+            None,
+        ),
+    }
+    for label, (dict_run, matrix_run, operations) in timings.items():
+        dict_text = f"{time_call(dict_run):9.1f} ms" if dict_run else f"{'-':>9}   "
+        matrix_ms = time_call(matrix_run)
+        per_cell = f" ({matrix_ms * 1000 / operations:.2f} us/cell)" if operations else ""
+        print(f"{label:>12}: dict-of-dicts {dict_text}, GradeMatrix {matrix_ms:9.1f} ms{per_cell}")
+
+
+if __name__ == "__main__":
+    main()
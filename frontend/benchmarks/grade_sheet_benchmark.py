@@ -0,0 +1,199 @@
+# grade_sheet_benchmark.py
+"""
+Headless benchmark suite for the grade sheet. For each synthetic roster size it
+times rebuilding the table structure, populating it, refreshing the calculated
+grades, expanding and collapsing header groups and a scripted typing session,
+and writes the results as JSON so runs can be compared for regressions.
+
+Run from the repository root:
+    QT_QPA_PLATFORM=offscreen python -m frontend.benchmarks.grade_sheet_benchmark --sizes 50 500 5000 --output grade_sheet_results.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import PYQT_VERSION_STR, QT_VERSION_STR
+from PyQt6.QtWidgets import QApplication
+
+from frontend.views.default.Academics.Classroom.Faculty.classroom_grades_view import (
+    GradeDataModel, GradeController, CollapsibleGradesTable
+)
+
+# Header groups clicked during the expand/collapse run, in click order (collapsed again in reverse).
+HEADER_GROUPS = (
+    ('expandable_main', None, 'midterm'),
+    ('expandable_component', 'quiz', 'midterm'),
+    ('expandable_component', 'performance_task', 'midterm'),
+)
+
+
+def random_grade(rng):
+    """A score string as a teacher might type it: mostly fractions, some plain numbers, a few typos."""
+    roll = rng.random()
+    if roll < 0.6:
+        return f"{rng.randint(0, 50)}/50"
+    if roll < 0.95:
+        return str(rng.randint(40, 100))
+    return rng.choice(("abc", "7/", "/10", "1O0"))
+
+
+def synthetic_gradebook(model, student_count, fill, seed):
+    """Return (students, grades) with roughly fill of every student's components graded."""
+    rng = random.Random(seed)
+    keys = model.get_all_component_keys()
+    students = [{'id': str(1000 + i), 'name': f"Student {i:05d}"} for i in range(student_count)]
+    grades = {
+        student['id']: {key: random_grade(rng) for key in keys if rng.random() < fill}
+        for student in students
+    }
+    return students, grades
+
+
+def build_table(app, student_count, fill, seed):
+    """Create a shown grade table loaded with a synthetic roster, every column group collapsed."""
+    model = GradeDataModel()
+    controller = GradeController(model)
+    students, grades = synthetic_gradebook(model, student_count, fill, seed)
+    model.load_gradebook(None, students, grades)
+    table = CollapsibleGradesTable(model, controller)
+    table.resize(1280, 720)
+    table.show()
+    app.processEvents()
+    return model, controller, table
+
+
+def set_all_expanded(model, expanded):
+    for key in model.column_states:
+        if key.endswith('_expanded'):
+            model.column_states[key] = expanded
+
+
+def header_section(table, col_type, component, term):
+    """Logical index of the header that toggles a column group, or None."""
+    for index, info in table.column_info_map.items():
+        if info.get('type') != col_type:
+            continue
+        if col_type == 'expandable_main' and info.get('target') == term:
+            return index
+        if col_type == 'expandable_component' and info.get('component') == component and info.get('term') == term:
+            return index
+    return None
+
+
+def click_headers(app, table, groups):
+    for group in groups:
+        index = header_section(table, *group)
+        if index is not None:
+            table.on_header_section_clicked(index)
+            app.processEvents()
+
+
+def typing_session(app, table, cell_count, text):
+    """Type text into the first cell_count grade cells through their editors, committing each one."""
+    grid_model = table.grid_model
+    cells = []
+    for row in range(grid_model.rowCount()):
+        for col, info in table.column_info_map.items():
+            if info.get('type') == 'grade_input' and not table.isColumnHidden(col):
+                cells.append(grid_model.index(row, col))
+        if len(cells) >= cell_count:
+            break
+    for index in cells[:cell_count]:
+        table.setCurrentIndex(index)
+        line_edit = table.indexWidget(index)
+        if line_edit is None:
+            continue
+        for i in range(1, len(text) + 1):
+            line_edit.setText(text[:i])
+            app.processEvents()
+        line_edit.editingFinished.emit()
+        app.processEvents()
+
+
+def time_ms(function):
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1000
+
+
+def summarize(runs):
+    return {
+        "runs_ms": [round(run, 3) for run in runs],
+        "min_ms": round(min(runs), 3),
+        "median_ms": round(statistics.median(runs), 3),
+        "mean_ms": round(statistics.fmean(runs), 3),
+        "max_ms": round(max(runs), 3),
+    }
+
+
+def benchmark_size(app, student_count, repeat, fill, cells, text, seed):
+    """Time every operation on one roster size; returns {operation: summary}."""
+    model, controller, table = build_table(app, student_count, fill, seed)
+    runs = {name: [] for name in ("rebuild_table_structure", "populate_table_with_data",
+                                  "refresh_data_display", "header_expand", "header_collapse", "typing_session")}
+    for _ in range(repeat):
+        # Structure work is measured on the fully expanded sheet, the widest it gets.
+        set_all_expanded(model, True)
+        runs["rebuild_table_structure"].append(time_ms(table.rebuild_table_structure))
+        runs["populate_table_with_data"].append(time_ms(table.populate_table_with_data))
+        runs["refresh_data_display"].append(time_ms(lambda: table.refresh_data_display(full=True)))
+        app.processEvents()
+
+        set_all_expanded(model, False)
+        table.rebuild_table_structure()
+        app.processEvents()
+        runs["header_expand"].append(time_ms(lambda: click_headers(app, table, HEADER_GROUPS)))
+        runs["typing_session"].append(time_ms(lambda: typing_session(app, table, cells, text)))
+        runs["header_collapse"].append(time_ms(lambda: click_headers(app, table, reversed(HEADER_GROUPS))))
+    table.close()
+    table.deleteLater()
+    app.processEvents()
+    return {name: summarize(values) for name, values in runs.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 500, 5000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--fill", type=float, default=0.7, help="share of grade cells that are filled")
+    parser.add_argument("--cells", type=int, default=10, help="cells typed into per typing session")
+    parser.add_argument("--text", default="100/100")
+    parser.add_argument("--seed", type=int, default=3)
+    parser.add_argument("--output", default="grade_sheet_results.json")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    results = {
+        "benchmark": "grade_sheet",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "environment": {
+            "python": platform.python_version(),
+            "qt": QT_VERSION_STR,
+            "pyqt": PYQT_VERSION_STR,
+            "platform": platform.platform(),
+            "qpa": app.platformName(),
+        },
+        "parameters": {key: value for key, value in vars(args).items() if key != "output"},
+        "sizes": {},
+    }
+    print(f"{'students':>8} {'operation':>25} {'median ms':>10} {'min ms':>9} {'max ms':>9}")
+    for size in args.sizes:
+        operations = benchmark_size(app, size, args.repeat, args.fill, args.cells, args.text, args.seed)
+        results["sizes"][str(size)] = operations
+        for name, summary in operations.items():
+            print(f"{size:8d} {name:>25} {summary['median_ms']:10.1f} {summary['min_ms']:9.1f} {summary['max_ms']:9.1f}")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
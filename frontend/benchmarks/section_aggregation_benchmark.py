@@ -0,0 +1,74 @@
+# section_aggregation_benchmark.py
+"""
+Times the department rollup over many synthetic sections with one worker
+and with up to a worker per core, and checks that both give the same report.
+Each worker count is timed twice on the same service: the first rollup
+includes spawning the worker processes, the second reuses them.
+
+Run from the repository root:
+    python -m frontend.benchmarks.section_aggregation_benchmark --sections 200 --students 45
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from frontend.services.grade_aggregation_service import GradeAggregationService
+from frontend.services.grade_service import GradeService
+from frontend.services.rubric_service import RubricService
+from frontend.utils.component_catalog import ComponentCatalog, DEFAULT_COMPONENTS
+
+
+def write_sections(grades_dir, section_count, student_count, seed=11):
+    """Write one synthetic gradebook journal per section and return the class ids."""
+    rng = random.Random(seed)
+    service = GradeService(os.path.join(grades_dir, "missing.json"), grades_dir)
+    keys = ComponentCatalog(DEFAULT_COMPONENTS).keys
+    class_ids = list(range(1, section_count + 1))
+    for class_id in class_ids:
+        students = [{"id": f"{class_id}-{i:03d}", "name": f"Student {i:03d}"} for i in range(student_count)]
+        service.save_roster(class_id, students)
+        service.save_grades(class_id, [
+            (student["id"], key, f"{rng.randint(15, 50)}/50")
+            for student in students for key in keys if rng.random() < 0.9
+        ])
+    return class_ids
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sections", type=int, default=200)
+    parser.add_argument("--students", type=int, default=45)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    rubric_service = RubricService(os.path.join(tempfile.gettempdir(), "missing_rubrics.json"))
+    rubric = rubric_service.get_rubric(rubric_service.DEFAULT_RUBRIC)
+    with tempfile.TemporaryDirectory() as grades_dir:
+        class_ids = write_sections(grades_dir, args.sections, args.students)
+        print(f"{args.sections} sections x {args.students} students, {os.cpu_count()} cores")
+
+        reports = {}
+        for workers in sorted({1, args.workers}):
+            service = GradeAggregationService(os.path.join(grades_dir, "missing.json"), grades_dir)
+            timings = []
+            for _ in range(2):
+                start = time.perf_counter()
+                reports[workers] = service.aggregate(class_ids, rubric, max_workers=workers)
+                timings.append(time.perf_counter() - start)
+            service.close()
+            print(f"{workers:3d} worker(s) requested, {reports[workers]['workers']:3d} used: "
+                  f"{timings[0] * 1000:9.1f} ms first, {timings[1] * 1000:9.1f} ms reused")
+
+        department = reports[1]["department"]["final_grade"]
+        matches = all(report["department"]["final_grade"]["count"] == department["count"]
+                      and abs(report["department"]["final_grade"]["mean"] - department["mean"]) < 1e-9
+                      for report in reports.values())
+        print(f"department: {department['count']} final grades, mean {department['mean']:.2f}, "
+              f"median {department['median']:.2f}, pass rate {department['pass_rate']:.1f}%"
+              f"{'' if matches else '  (MISMATCH between worker counts)'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# stream_feed_benchmark.py
+"""
+Times opening the classroom stream for classes with large feeds (until the view
+is shown, and until every post has been loaded in the background and rendered),
+painting frames while scrolling through them and adding new posts.
+
+Run from the repository root:
+    QT_QPA_PLATFORM=offscreen python -m frontend.benchmarks.stream_feed_benchmark --posts 100 1000 5000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from frontend.controller.stream_controller import StreamController
+from frontend.services.stream_service import StreamService
+from frontend.utils.icon_cache import icon_cache
+from frontend.views.default.Academics.Classroom.Shared.classroom_stream import ClassroomStream
+
+CLASS = {"id": 1, "code": "CS101", "title": "Benchmark Class", "section": "A", "schedule": "MWF 9:00"}
+
+
+def write_feed(path, post_count):
+    """Write a classroom data file with post_count announcements for CLASS."""
+    start = datetime(2025, 1, 1, 8, 0, 0)
+    posts = [
+        {
+            "id": i + 1,
+            "class_id": CLASS["id"],
+            "title": f"Announcement {i}: " + "please read the updated guidelines " * (1 + i % 3),
+            "content": "Details",
+            "author": "Faculty",
+            "date": (start + timedelta(minutes=37 * i)).strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        for i in range(post_count)
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"posts": posts, "topics": []}, f)
+
+
+def wait_loaded(app, stream):
+    """Process events until the background load has rendered every post; return the time taken in ms."""
+    start = time.perf_counter()
+    while stream.is_loading():
+        app.processEvents()
+        time.sleep(0.001)
+    return (time.perf_counter() - start) * 1000
+
+
+def settle(app, view, quiet_ms=500):
+    """Let the deferred row layout finish; return when it last changed, in ms (the view stays responsive meanwhile)."""
+    start = changed = time.perf_counter()
+    bar = view.verticalScrollBar()
+    last = bar.maximum()
+    while (time.perf_counter() - changed) * 1000 < quiet_ms:
+        app.processEvents()
+        time.sleep(0.002)
+        if bar.maximum() != last:
+            last, changed = bar.maximum(), time.perf_counter()
+    return (changed - start) * 1000
+
+
+def scroll_frames(app, view, frames):
+    """Scroll through the feed, repainting synchronously; return per-frame times in ms."""
+    bar = view.verticalScrollBar()
+    times = []
+    for frame in range(frames):
+        bar.setValue(bar.maximum() * frame // max(frames - 1, 1))
+        start = time.perf_counter()
+        view.viewport().repaint()
+        times.append((time.perf_counter() - start) * 1000)
+        app.processEvents()
+    return times
+
+
+def post_updates(app, stream, count):
+    """Publish count new posts to the open stream and return the average ms per post until repainted."""
+    service = stream.controller.service
+    newest = max((post["date"] for post in stream.post_model.posts), default="2025-01-01 00:00:00")
+    start = time.perf_counter()
+    for i in range(count):
+        post = {"id": 10_000_000 + i, "class_id": CLASS["id"], "title": f"New announcement {i}",
+                "content": "", "author": "Faculty", "date": newest}
+        # Publish directly: saving the JSON file is the service's cost, not the view's.
+        service.publish("post_added", post)
+        stream.post_list.viewport().repaint()
+        app.processEvents()
+    return (time.perf_counter() - start) * 1000 / count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--posts", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--new-posts", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    print(f"{'posts':>6} {'open ms':>9} {'loaded ms':>10} {'layout ms':>10} {'widgets':>8} {'frame avg ms':>13} {'frame max ms':>13} {'new post ms':>12}")
+    with tempfile.TemporaryDirectory() as data_dir:
+        for count in args.posts:
+            path = os.path.join(data_dir, f"feed_{count}.json")
+            write_feed(path, count)
+            controller = StreamController(StreamService(path))
+            start = time.perf_counter()
+            stream = ClassroomStream(CLASS, controller)
+            stream.resize(1100, 700)
+            stream.show()
+            app.processEvents()
+            open_ms = (time.perf_counter() - start) * 1000
+            loaded_ms = open_ms + wait_loaded(app, stream)
+            widgets = len(stream.findChildren(QWidget))
+            layout_ms = settle(app, stream.post_list)
+            times = scroll_frames(app, stream.post_list, args.frames)
+            stream.post_list.verticalScrollBar().setValue(0)
+            post_ms = post_updates(app, stream, args.new_posts)
+            print(f"{count:6d} {open_ms:9.1f} {loaded_ms:10.1f} {layout_ms:10.1f} {widgets:8d} {sum(times) / len(times):13.2f} "
+                  f"{max(times):13.2f} {post_ms:12.2f}")
+            stream.close()
+            stream.deleteLater()
+            app.processEvents()
+    stats = icon_cache.stats()
+    print(f"icon cache: {stats['entries']} entries, {stats['hits']} hits, {stats['misses']} misses "
+          f"({stats['hit_rate']:.1%} hit rate)")
+
+
+if __name__ == "__main__":
+    main()
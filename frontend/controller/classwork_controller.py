@@ -1,5 +1,5 @@
 # classwork_controller.py (refactored)
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from frontend.services.classwork_service import ClassworkService
 
 class ClassworkController:
@@ -39,6 +39,13 @@ class ClassworkController:
             topic_name=self.topic_name
         )
     
+    def get_classwork_index(self) -> List[Tuple[str, List[Dict]]]:
+        """Get the classwork of the current class as ordered (topic_title, posts) groups."""
+        if self.class_id is None:
+            return []
+        
+        return self.service.get_classwork_index(self.class_id)
+    
     def create_topic(self, title: str, type_: str) -> bool:
         """Create a new topic."""
         if not title or self.class_id is None:
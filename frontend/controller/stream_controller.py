@@ -1,5 +1,5 @@
 # stream_controller.py (refactored)
-from typing import List, Dict
+from typing import Callable, List, Dict
 from frontend.services.stream_service import StreamService
 
 class StreamController:
@@ -29,4 +29,19 @@ class StreamController:
             "author": author
         }
         
-        return self.service.add_post(self.current_class_id, post_data)
\ No newline at end of file
+        return self.service.add_post(self.current_class_id, post_data)
+    
+    def edit_post(self, post_id: int, updates: Dict) -> bool:
+        """Edit an existing post."""
+        return self.service.update_post(post_id, updates)
+    
+    def delete_post(self, post_id: int) -> bool:
+        """Delete a post."""
+        return self.service.delete_post(post_id)
+    
+    def subscribe(self, event: str, callback: Callable[[Dict], None]) -> None:
+        """Listen for post_added, post_updated or post_deleted events of the service."""
+        self.service.subscribe(event, callback)
+    
+    def unsubscribe(self, event: str, callback: Callable[[Dict], None]) -> None:
+        self.service.unsubscribe(event, callback)
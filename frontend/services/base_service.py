@@ -1,13 +1,17 @@
 # base_service.py
 import json
 import logging
+import os
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 class BaseService(ABC):
     def __init__(self, json_path: str):
         self.json_path = json_path
         self.logger = logging.getLogger(self.__class__.__name__)
+        # Bumped whenever the data is re-read from disk
+        self.version = 0
+        self._signature = self.data_signature()
         self.data = self.load_data()
     
     def load_data(self) -> Dict[str, Any]:
@@ -22,6 +26,28 @@ class BaseService(ABC):
             self.logger.error(f"Error decoding JSON from {self.json_path}: {e}")
             return self.get_default_data()
     
+    def data_signature(self) -> Optional[Tuple[int, int]]:
+        """Modification time and size of the data file, or None if it does not exist."""
+        try:
+            stat = os.stat(self.json_path)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+    
+    def reload_if_changed(self) -> bool:
+        """Re-read the data file if it changed on disk since it was loaded or saved."""
+        signature = self.data_signature()
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        self.data = self.load_data()
+        self.version += 1
+        self.on_data_reloaded()
+        return True
+    
+    def on_data_reloaded(self) -> None:
+        """Drop state derived from the previous data; called after reload_if_changed() re-reads the file."""
+    
     def get_default_data(self) -> Dict[str, Any]:
         """Return default data structure when file doesn't exist."""
         return {"posts": [], "topics": []}
@@ -31,6 +57,8 @@ class BaseService(ABC):
         try:
             with open(self.json_path, 'w', encoding='utf-8') as f:
                 json.dump(self.data, f, indent=4, ensure_ascii=False)
+            # Our own write is not a change to reload
+            self._signature = self.data_signature()
             return True
         except Exception as e:
             self.logger.error(f"Error saving data to {self.json_path}: {e}")
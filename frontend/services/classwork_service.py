@@ -1,11 +1,24 @@
 # classwork_service.py (refactored)
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from .base_service import BaseService
 
+UNTITLED = "Untitled"
+
+# Classwork of a class as (topic_title, posts) groups, in display order.
+ClassworkIndex = List[Tuple[str, List[Dict]]]
+
+def _date_key(post: Dict) -> datetime:
+    try:
+        # fromisoformat parses "%Y-%m-%d %H:%M:%S" far faster than strptime
+        return datetime.fromisoformat(post["date"])
+    except (KeyError, TypeError, ValueError):
+        return datetime.min
+
 class ClassworkService(BaseService):
     def __init__(self, json_path: str):
         super().__init__(json_path)
+        self._indexes: Dict[int, ClassworkIndex] = {}
     
     def get_classwork_by_class_id(self, class_id: int) -> List[Dict]:
         """Get all posts for a specific class."""
@@ -15,28 +28,76 @@ class ClassworkService(BaseService):
         """Get all topics for a specific class."""
         return [t for t in self.data.get("topics", []) if t.get("class_id") == class_id]
     
+    def get_classwork_index(self, class_id: int) -> ClassworkIndex:
+        """Classwork of a class grouped by topic: "Untitled" first, then topics alphabetically, newest first within each."""
+        index = self._indexes.get(class_id)
+        if index is None:
+            index = self._indexes[class_id] = self._build_index(class_id)
+        return index
+    
+    def _build_index(self, class_id: int) -> ClassworkIndex:
+        topics = {t["id"]: t["title"] for t in self.get_topics_by_class_id(class_id)}
+        groups: Dict[str, List[Dict]] = {}
+        for post in self.get_classwork_by_class_id(class_id):
+            item = self._index_item(post, topics)
+            groups.setdefault(item["topic"], []).append(item)
+        for posts in groups.values():
+            posts.sort(key=_date_key, reverse=True)
+        return sorted(groups.items(), key=lambda group: (group[0] != UNTITLED, group[0]))
+    
+    def _index_item(self, post: Dict, topics: Dict[int, str]) -> Dict:
+        """Copy of a post with its topic label added."""
+        topic_id = post.get("topic_id")
+        item = post.copy()
+        item["topic"] = topics.get(topic_id, UNTITLED) if topic_id is not None else UNTITLED
+        return item
+    
+    def _add_to_index(self, post: Dict) -> None:
+        """Insert a new post into the cached index of its class, if there is one."""
+        index = self._indexes.get(post.get("class_id"))
+        if index is None:
+            return
+        topics = {t["id"]: t["title"] for t in self.get_topics_by_class_id(post["class_id"])}
+        item = self._index_item(post, topics)
+        group_key = (item["topic"] != UNTITLED, item["topic"])
+        position = 0
+        while position < len(index) and (index[position][0] != UNTITLED, index[position][0]) < group_key:
+            position += 1
+        if position == len(index) or index[position][0] != item["topic"]:
+            index.insert(position, (item["topic"], []))
+        posts = index[position][1]
+        # Newest first; a new post normally lands in front after one comparison
+        date = _date_key(item)
+        low, high = 0, len(posts)
+        while low < high:
+            middle = (low + high) // 2
+            if _date_key(posts[middle]) >= date:
+                low = middle + 1
+            else:
+                high = middle
+        posts.insert(low, item)
+    
+    def invalidate_index(self, class_id: Optional[int] = None) -> None:
+        """Drop the cached index of a class (of every class if None); it is rebuilt on next use."""
+        if class_id is None:
+            self._indexes.clear()
+        else:
+            self._indexes.pop(class_id, None)
+    
+    def on_data_reloaded(self) -> None:
+        self.invalidate_index()
+    
     def filter_classwork(self, class_id: int, filter_type: Optional[str] = None, 
                         topic_name: Optional[str] = None) -> List[Dict]:
         """Filter classwork items with proper separation of concerns."""
-        posts = self.get_classwork_by_class_id(class_id)
-        topics = {t["id"]: t["title"] for t in self.get_topics_by_class_id(class_id)}
-        
         filtered_items = []
-        for post in posts:
-            # Determine topic label
-            topic_id = post.get("topic_id")
-            topic_label = topics.get(topic_id, "Untitled") if topic_id is not None else "Untitled"
-            
-            # Apply filters
-            if filter_type and post.get("type") != filter_type:
-                continue
+        for topic_label, posts in self.get_classwork_index(class_id):
             if topic_name and topic_label != topic_name:
                 continue
-            
-            # Add topic information to post
-            filtered_post = post.copy()
-            filtered_post["topic"] = topic_label
-            filtered_items.append(filtered_post)
+            for post in posts:
+                if filter_type and post.get("type") != filter_type:
+                    continue
+                filtered_items.append(post.copy())
         
         return filtered_items
     
@@ -59,6 +120,8 @@ class ClassworkService(BaseService):
                 self.data["topics"] = []
             
             self.data["topics"].append(topic_data)
+            # Posts pointing at this topic id were indexed as untitled until now
+            self.invalidate_index(class_id)
             
             if self.save_data():
                 return topic_data
@@ -100,6 +163,7 @@ class ClassworkService(BaseService):
                 self.data["posts"] = []
             
             self.data["posts"].append(post_data)
+            self._add_to_index(post_data)
             
             if self.save_data():
                 return post_data
@@ -115,6 +179,8 @@ class ClassworkService(BaseService):
             for i, post in enumerate(self.data.get("posts", [])):
                 if post.get("id") == post_id:
                     self.data["posts"][i].update(updates)
+                    # The update may move the post to another topic, date or class
+                    self.invalidate_index()
                     return self.save_data()
             return False
         except Exception as e:
@@ -125,6 +191,7 @@ class ClassworkService(BaseService):
         """Delete a post."""
         try:
             self.data["posts"] = [p for p in self.data.get("posts", []) if p.get("id") != post_id]
+            self.invalidate_index()
             return self.save_data()
         except Exception as e:
             self.logger.error(f"Error deleting post {post_id}: {e}")
@@ -0,0 +1,159 @@
+# grade_aggregation_service.py
+import csv
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional
+from .base_service import BaseService
+from .grade_service import GradeService
+from .grade_statistics_service import RunningStatistics, TERM_COLUMNS
+from .rubric_service import Rubric, parse_grade_text
+from ..utils.component_catalog import ComponentCatalog, DEFAULT_COMPONENTS
+
+# Summary fields written for each section in a department report.
+REPORT_FIELDS = ("count", "mean", "median", "stdev", "min", "max", "pass_rate")
+
+# Chunks handed to each worker process per rollup: a few per worker keep the cores evenly
+# loaded when sections differ in size, without paying a round trip for every section.
+CHUNKS_PER_WORKER = 4
+
+# Per-process grade service, created once by the pool initializer.
+_worker_grade_service: Optional[GradeService] = None
+
+
+def _init_worker(json_path: str, grades_dir: str) -> None:
+    global _worker_grade_service
+    _worker_grade_service = GradeService(json_path, grades_dir)
+
+
+def evaluate_section(class_id, rubric_data: Dict[str, Any], components: Dict[str, List[str]],
+                     passing_grade: float, bin_count: int,
+                     grade_service: Optional[GradeService] = None) -> Dict[str, Any]:
+    """Compute one section's term and final grades and their statistics.
+
+    Runs in a worker process, so it takes and returns only picklable values.
+    """
+    service = grade_service or _worker_grade_service
+    students, grades = service.load_gradebook(class_id, compact=False)
+    plan = Rubric.from_dict(rubric_data).compile(ComponentCatalog(components))
+    columns = {column: RunningStatistics(passing_grade, bin_count) for column in TERM_COLUMNS}
+    values = {column: [] for column in TERM_COLUMNS}
+    for student in students:
+        cells = grades.get(student["id"], {})
+        result = plan.evaluate_row([parse_grade_text(cells.get(key, "")) for key in plan.keys])
+        for column in TERM_COLUMNS:
+            if result.get(column) is not None:
+                values[column].append(result[column])
+    for column in TERM_COLUMNS:
+        columns[column].extend(values[column])
+    return {"class_id": class_id, "students": len(students), "statistics": columns}
+
+
+class GradeAggregationService(BaseService):
+    """Rolls final grades up across the sections of a course, in a pool of worker processes.
+
+    The pool is started on the first rollup and reused by later ones, so the cost of spawning
+    the processes is paid once per service; call close() when the service is no longer needed.
+    """
+
+    def __init__(self, json_path: str = "data/classroom_data.json", grades_dir: str = "data/grades",
+                 passing_grade: float = 75.0, bin_count: int = 10):
+        super().__init__(json_path)
+        self.grades_dir = grades_dir
+        self.passing_grade = passing_grade
+        self.bin_count = bin_count
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_workers = 0
+
+    def _get_executor(self, workers: int) -> ProcessPoolExecutor:
+        """The worker pool, started on first use and restarted only when a larger one is needed."""
+        if self._executor is None or self._executor_workers < workers:
+            self.close()
+            # Spawned, not forked: the caller is usually a thread of a running Qt application.
+            self._executor = ProcessPoolExecutor(max_workers=workers,
+                                                 mp_context=multiprocessing.get_context("spawn"),
+                                                 initializer=_init_worker,
+                                                 initargs=(self.json_path, self.grades_dir))
+            self._executor_workers = workers
+        return self._executor
+
+    def close(self) -> None:
+        """Shut the worker pool down; the next rollup starts a new one."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self.logger.info(f"Stopped {self._executor_workers} aggregation worker(s)")
+            self._executor = None
+            self._executor_workers = 0
+
+    def get_section_ids(self, course_code: str) -> List:
+        """Class ids of every section of a course."""
+        return [c.get("id") for c in self.data.get("classes", []) if c.get("code") == course_code]
+
+    def _section_names(self) -> Dict:
+        return {c.get("id"): c.get("section", "") for c in self.data.get("classes", [])}
+
+    def aggregate(self, class_ids: Iterable, rubric: Rubric,
+                  components: Optional[Dict[str, List[str]]] = None,
+                  max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """Evaluate every section and merge their statistics into a department report.
+
+        Runs for a while on large rollups, so call it off the GUI thread. Sections are spread
+        over max_workers processes (one per core by default), never more than there are sections.
+        """
+        class_ids = list(class_ids)
+        components = {category: list(items) for category, items in (components or DEFAULT_COMPONENTS).items()}
+        rubric_data = rubric.to_dict()
+        workers = min(max_workers or os.cpu_count() or 1, len(class_ids)) or 1
+        evaluate = partial(evaluate_section, rubric_data=rubric_data, components=components,
+                           passing_grade=self.passing_grade, bin_count=self.bin_count)
+
+        if workers == 1:
+            # One section or one core: there is nothing to run in parallel.
+            service = GradeService(self.json_path, self.grades_dir)
+            sections = [evaluate(class_id, grade_service=service) for class_id in class_ids]
+        else:
+            chunksize = math.ceil(len(class_ids) / (workers * CHUNKS_PER_WORKER))
+            sections = list(self._get_executor(workers).map(evaluate, class_ids, chunksize=chunksize))
+
+        department = {column: RunningStatistics(self.passing_grade, self.bin_count) for column in TERM_COLUMNS}
+        for column in TERM_COLUMNS:
+            department[column].merge(*(section["statistics"][column] for section in sections))
+
+        names = self._section_names()
+        self.logger.info(f"Aggregated {len(sections)} sections with {workers} worker(s)")
+        return {
+            "rubric": rubric.name,
+            "workers": workers,
+            "sections": [
+                {
+                    "class_id": section["class_id"],
+                    "section": names.get(section["class_id"], ""),
+                    "students": section["students"],
+                    **{column: section["statistics"][column].summary() for column in TERM_COLUMNS},
+                }
+                for section in sections
+            ],
+            "department": {
+                "students": sum(section["students"] for section in sections),
+                **{column: department[column].summary() for column in TERM_COLUMNS},
+            },
+        }
+
+    def write_report(self, report: Dict[str, Any], path: str, column: str = "final_grade") -> bool:
+        """Write one CSV row per section plus a department total row for a grade column."""
+        try:
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["Class", "Section", "Students", *(name.replace("_", " ").title() for name in REPORT_FIELDS)])
+                rows = [(s["class_id"], s["section"], s["students"], s[column]) for s in report["sections"]]
+                rows.append(("All sections", "", report["department"]["students"], report["department"][column]))
+                for class_id, section, students, summary in rows:
+                    writer.writerow([class_id, section, students, *(
+                        "" if summary[field] is None else round(summary[field], 2) for field in REPORT_FIELDS
+                    )])
+            return True
+        except OSError as e:
+            self.logger.error(f"Error writing department report to {path}: {e}")
+            return False
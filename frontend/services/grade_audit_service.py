@@ -0,0 +1,325 @@
+# grade_audit_service.py
+import getpass
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from .base_service import BaseService
+from ..utils.grade_matrix import encode_grade, decode_grade
+
+# One audit record: timestamp, user, student, component, value kinds, old (score, total), new (score, total).
+# Names and odd grade texts live once in a side string table, so every record has the same size.
+RECORD = struct.Struct("<dIIIIdddd")
+# A record read as 32-bit words; the student's string index is word 3.
+RECORD_WORDS = RECORD.size // 4
+STUDENT_WORD = 3
+# Kinds of a stored grade value; the old value uses the low two bits of the kinds field, the new one the next two.
+EMPTY, NUMBER, FRACTION, TEXT = range(4)
+# Index file header: magic, records covered, number of students.
+INDEX_HEADER = struct.Struct("<4sQI")
+INDEX_MAGIC = b"GAI1"
+# Records read per chunk while indexing the tail of a log.
+SCAN_CHUNK = 65536
+# The index is saved again once this many records were indexed since it was last written.
+INDEX_SAVE_MIN = 4096
+
+# Text shown for a string whose line in the table is damaged or missing.
+UNREADABLE = "?"
+
+# (timestamp, user, student_id, component_key, old_text, new_text) as passed to append().
+AuditRecord = Tuple[float, str, str, str, str, str]
+
+
+class AuditEntry(NamedTuple):
+    timestamp: float
+    user: str
+    student_id: str
+    component: str
+    old: str
+    new: str
+
+
+def current_user() -> str:
+    """Login name of the person running the app, recorded as the author of grade changes."""
+    try:
+        return getpass.getuser()
+    except Exception:
+        return "unknown"
+
+
+def _words(data: bytes) -> array:
+    words = array("I", data)
+    if sys.byteorder == "big":
+        words.byteswap()
+    return words
+
+
+class StringTable:
+    """Append-only table of strings referenced by index (one JSON string per line)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.strings: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.size = 0
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Read strings appended to the file since the last refresh."""
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(self.size)
+                data = f.read()
+        except FileNotFoundError:
+            return
+        # A partially written last line is left for the next refresh.
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].split(b"\n")[:-1]:
+            try:
+                text = json.loads(line)
+            except ValueError:
+                text = None
+            if not isinstance(text, str):
+                # A damaged line keeps its position so later indices stay right, but is never interned.
+                self.strings.append(UNREADABLE)
+                continue
+            self.index.setdefault(text, len(self.strings))
+            self.strings.append(text)
+        self.size += end
+
+    def get(self, position: int) -> str:
+        """String at an index, or UNREADABLE if the table does not have it."""
+        return self.strings[position] if position < len(self.strings) else UNREADABLE
+
+    def intern(self, text: str, pending: List[str]) -> int:
+        """Index of a string, adding it (and queuing it in pending) if it is new."""
+        position = self.index.get(text)
+        if position is None:
+            position = len(self.strings)
+            self.strings.append(text)
+            self.index[text] = position
+            pending.append(text)
+        return position
+
+    def write(self, pending: List[str]) -> None:
+        if not pending:
+            return
+        data = "".join(json.dumps(text, ensure_ascii=False) + "\n" for text in pending).encode("utf-8")
+        with open(self.path, "ab") as f:
+            # Drop a line cut short by an interrupted write so the new strings get their own lines.
+            if f.tell() > self.size:
+                f.truncate(self.size)
+            f.write(data)
+            f.flush()
+        self.size += len(data)
+
+
+class GradeAuditReader:
+    """Reconstructs grade histories from a class audit log through a per-student record index.
+
+    The index maps each student to the numbers of their records. It is saved next to the log
+    and extended on open with whatever was appended since, so reopening a log of millions of
+    records reads only its tail; a history lookup then reads just that student's records.
+    """
+
+    def __init__(self, log_path: str, strings_path: str, index_path: str):
+        self.log_path = log_path
+        self.index_path = index_path
+        self.strings = StringTable(strings_path)
+        self.postings: Dict[int, array] = {}
+        self.indexed = 0
+        self._saved = 0
+        self._load_index()
+        self.refresh()
+
+    def __len__(self) -> int:
+        return self.indexed
+
+    def _load_index(self) -> None:
+        try:
+            with open(self.index_path, "rb") as f:
+                data = f.read()
+            magic, indexed, student_count = INDEX_HEADER.unpack_from(data)
+            if magic != INDEX_MAGIC or indexed * RECORD.size > os.path.getsize(self.log_path):
+                return
+            words = _words(data[INDEX_HEADER.size:])
+            postings, position = {}, 0
+            for _ in range(student_count):
+                student, count = words[position], words[position + 1]
+                postings[student] = words[position + 2:position + 2 + count]
+                position += 2 + count
+        except (OSError, struct.error, IndexError, ValueError):
+            # A missing, stale or damaged index is rebuilt from the log.
+            return
+        self.postings, self.indexed, self._saved = postings, indexed, indexed
+
+    def save_index(self) -> bool:
+        """Write the index atomically so the next reader starts from it."""
+        words = array("I")
+        for student, records in self.postings.items():
+            words.extend((student, len(records)))
+            words.extend(records)
+        if sys.byteorder == "big":
+            words.byteswap()
+        try:
+            with open(self.index_path + ".tmp", "wb") as f:
+                f.write(INDEX_HEADER.pack(INDEX_MAGIC, self.indexed, len(self.postings)))
+                words.tofile(f)
+            os.replace(self.index_path + ".tmp", self.index_path)
+        except OSError:
+            return False
+        self._saved = self.indexed
+        return True
+
+    def refresh(self) -> int:
+        """Index records appended since the last refresh; returns how many were added."""
+        try:
+            total = os.path.getsize(self.log_path) // RECORD.size
+        except OSError:
+            return 0
+        start = self.indexed
+        if total <= start:
+            return 0
+        self.strings.refresh()
+        postings = self.postings
+        with open(self.log_path, "rb") as f:
+            f.seek(start * RECORD.size)
+            while self.indexed < total:
+                count = min(SCAN_CHUNK, total - self.indexed)
+                # Only the student word of each record is needed to index it.
+                students = _words(f.read(count * RECORD.size))[STUDENT_WORD::RECORD_WORDS]
+                for number, student in enumerate(students, self.indexed):
+                    records = postings.get(student)
+                    if records is None:
+                        records = postings[student] = array("I")
+                    records.append(number)
+                self.indexed += count
+        if self.indexed - self._saved >= INDEX_SAVE_MIN:
+            self.save_index()
+        return self.indexed - start
+
+    def student_ids(self) -> List[str]:
+        return [self.strings.get(student) for student in self.postings]
+
+    def _value(self, kind: int, score: float, total: float) -> str:
+        if kind == EMPTY:
+            return ""
+        if kind == TEXT:
+            return self.strings.get(int(score))
+        return decode_grade(score, total)
+
+    def _entry(self, record: tuple) -> AuditEntry:
+        timestamp, user, student, component, kinds, old_score, old_total, new_score, new_total = record
+        string = self.strings.get
+        return AuditEntry(timestamp, string(user), string(student), string(component),
+                          self._value(kinds & 3, old_score, old_total),
+                          self._value(kinds >> 2 & 3, new_score, new_total))
+
+    def history(self, student_id: str, component: Optional[str] = None) -> List[AuditEntry]:
+        """Every change to a student's grades (or to one component of them), oldest first."""
+        records = self.postings.get(self.strings.index.get(student_id))
+        if not records:
+            return []
+        wanted = self.strings.index.get(component) if component is not None else None
+        if component is not None and wanted is None:
+            return []
+        entries = []
+        with open(self.log_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as log:
+            for number in records:
+                record = RECORD.unpack_from(log, number * RECORD.size)
+                if wanted is None or record[3] == wanted:
+                    entries.append(self._entry(record))
+        return entries
+
+    def grades_at(self, student_id: str, timestamp: float) -> Dict[str, str]:
+        """A student's grades as they stood at a point in time, {component_key: grade_text}."""
+        grades: Dict[str, str] = {}
+        for entry in self.history(student_id):
+            if entry.timestamp > timestamp:
+                break
+            if entry.new:
+                grades[entry.component] = entry.new
+            else:
+                grades.pop(entry.component, None)
+        return grades
+
+
+class GradeAuditService(BaseService):
+    """Keeps an append-only audit log of grade changes per class (audit_dir/class_<id>.audit).
+
+    Each change is one fixed-width binary record; user names, student ids, component keys
+    and grade texts that are not plain numbers or fractions are stored once in a string
+    table (class_<id>.strings) and referenced by index.
+    """
+
+    def __init__(self, json_path: str = "data/classroom_data.json", audit_dir: str = "data/audit"):
+        super().__init__(json_path)
+        self.audit_dir = audit_dir
+        self._tables: Dict = {}
+
+    def get_log_path(self, class_id) -> str:
+        """Path of the binary audit log for a class."""
+        return os.path.join(self.audit_dir, f"class_{class_id}.audit")
+
+    def _strings_path(self, class_id) -> str:
+        return os.path.join(self.audit_dir, f"class_{class_id}.strings")
+
+    def _index_path(self, class_id) -> str:
+        return os.path.join(self.audit_dir, f"class_{class_id}.index")
+
+    def _table(self, class_id) -> StringTable:
+        table = self._tables.get(class_id)
+        if table is None:
+            table = self._tables[class_id] = StringTable(self._strings_path(class_id))
+        return table
+
+    def _encode_value(self, table: StringTable, text: str, pending: List[str]) -> Tuple[int, float, float]:
+        if not text:
+            return EMPTY, 0.0, 0.0
+        score, total = encode_grade(text)
+        if score == score and decode_grade(score, total) == text:
+            return (NUMBER if total != total else FRACTION), score, total
+        return TEXT, float(table.intern(text, pending)), 0.0
+
+    def append(self, class_id, records: Iterable[AuditRecord]) -> bool:
+        """Append (timestamp, user, student_id, component_key, old_text, new_text) records to a class log."""
+        records = list(records)
+        if not records:
+            return True
+        try:
+            os.makedirs(self.audit_dir, exist_ok=True)
+            table = self._table(class_id)
+            pending: List[str] = []
+            data = bytearray()
+            for timestamp, user, student_id, component, old_text, new_text in records:
+                old_kind, old_score, old_total = self._encode_value(table, old_text, pending)
+                new_kind, new_score, new_total = self._encode_value(table, new_text, pending)
+                data += RECORD.pack(timestamp, table.intern(user, pending), table.intern(student_id, pending),
+                                    table.intern(component, pending), old_kind | new_kind << 2,
+                                    old_score, old_total, new_score, new_total)
+            # Strings go first so that every record on disk can be resolved.
+            table.write(pending)
+            path = self.get_log_path(class_id)
+            with open(path, "ab") as f:
+                # Drop a record cut short by an interrupted write so later records stay aligned.
+                f.truncate(f.tell() - f.tell() % RECORD.size)
+                f.write(data)
+                f.flush()
+            return True
+        except (OSError, ValueError, struct.error) as e:
+            self.logger.error(f"Error writing audit log for class {class_id}: {e}")
+            # The cached table may now be ahead of the file; reload it on the next append.
+            self._tables.pop(class_id, None)
+            return False
+
+    def open_reader(self, class_id) -> GradeAuditReader:
+        """Reader over a class log, with its index brought up to date."""
+        return GradeAuditReader(self.get_log_path(class_id), self._strings_path(class_id),
+                                self._index_path(class_id))
+
+    def get_history(self, class_id, student_id: str, component: Optional[str] = None) -> List[AuditEntry]:
+        """Grade changes of one student in a class, oldest first."""
+        return self.open_reader(class_id).history(student_id, component)
@@ -0,0 +1,126 @@
+# grade_import_service.py
+import csv
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from .rubric_service import parse_grade_text
+
+# Header names accepted for the student id column.
+STUDENT_ID_HEADERS = ("no.", "no", "id", "student id", "student_id")
+# Rows between progress callbacks.
+PROGRESS_INTERVAL = 500
+
+
+def score_error(text: str) -> Optional[str]:
+    """Why a grade cell cannot be imported, or None if it is a valid score.
+
+    Fractions need a score and a positive total and may not exceed the total;
+    plain numbers are percentages and may not exceed 100.
+    """
+    value = parse_grade_text(text)
+    if value is None:
+        return "invalid score"
+    if "/" in text:
+        score_text, total_text = (part.strip() for part in text.split("/", 1))
+        if not score_text or not total_text:
+            return "score and total are both required"
+        score, total = float(score_text), float(total_text)
+        if total <= 0:
+            return "total must be above 0"
+        if score < 0:
+            return "negative score"
+        if score > total:
+            return "score above the total"
+        return None
+    if value < 0:
+        return "negative score"
+    if value > 100:
+        return "score above 100"
+    return None
+
+
+class GradeImportResult:
+    """Outcome of parsing a grade CSV: valid grades plus row-level errors."""
+
+    def __init__(self):
+        # {student_id: {component_key: grade_text}} for every valid cell.
+        self.grades: Dict[str, Dict[str, str]] = {}
+        # (row number, message) for every rejected row or cell; row 1 is the header.
+        self.errors: List[Tuple[int, str]] = []
+        self.rows_read = 0
+        self.cells_accepted = 0
+
+
+class GradeImportService:
+    """Parses and validates CSV files of student id x component scores."""
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def parse(self, path: str, student_ids: Iterable[str], columns: Dict[str, str],
+              progress: Optional[Callable[[int], None]] = None) -> GradeImportResult:
+        """Read path and validate each row against the roster and the component columns.
+
+        columns maps lower-cased header text (component keys or display labels) to component keys.
+        """
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            return self.parse_rows(csv.reader(f), student_ids, columns, progress)
+
+    def parse_rows(self, reader: Iterable[List[str]], student_ids: Iterable[str], columns: Dict[str, str],
+                   progress: Optional[Callable[[int], None]] = None) -> GradeImportResult:
+        """Validate already-split CSV rows; the first row must be the header."""
+        result = GradeImportResult()
+        known_ids = set(student_ids)
+        rows = iter(reader)
+        header = next(rows, None)
+        if not header:
+            result.errors.append((1, "File is empty"))
+            return result
+
+        # Locate the student id column and the component columns; other columns are ignored.
+        id_column = None
+        component_columns = []
+        for index, title in enumerate(header):
+            name = title.strip().lower()
+            if id_column is None and name in STUDENT_ID_HEADERS:
+                id_column = index
+            elif name in columns:
+                component_columns.append((index, columns[name]))
+        if id_column is None:
+            result.errors.append((1, "Missing student id column"))
+            return result
+        if not component_columns:
+            result.errors.append((1, "No grade component columns found"))
+            return result
+
+        grades = result.grades
+        # Row number of each student's row, to report repeated rows.
+        first_rows: Dict[str, int] = {}
+        for row_number, row in enumerate(rows, start=2):
+            result.rows_read += 1
+            if progress and result.rows_read % PROGRESS_INTERVAL == 0:
+                progress(result.rows_read)
+            if not any(cell.strip() for cell in row):
+                continue
+            student_id = row[id_column].strip() if id_column < len(row) else ""
+            if student_id not in known_ids:
+                result.errors.append((row_number, f"Unknown student id '{student_id}'"))
+                continue
+            if student_id in first_rows:
+                result.errors.append((row_number, f"Duplicate row for student id '{student_id}' "
+                                                  f"(first given in row {first_rows[student_id]})"))
+                continue
+            first_rows[student_id] = row_number
+            for index, component_key in component_columns:
+                text = row[index].strip() if index < len(row) else ""
+                if not text:
+                    continue
+                error = score_error(text)
+                if error:
+                    result.errors.append((row_number, f"{header[index].strip()}: {error} '{text}'"))
+                    continue
+                grades.setdefault(student_id, {})[component_key] = text
+                result.cells_accepted += 1
+
+        self.logger.info(f"Parsed {result.rows_read} rows, {result.cells_accepted} grades, "
+                         f"{len(result.errors)} errors")
+        return result
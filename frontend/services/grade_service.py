@@ -0,0 +1,115 @@
+# grade_service.py
+import json
+import os
+from typing import Dict, List, Tuple
+from .base_service import BaseService
+
+# A gradebook journal is compacted when it holds this many times more records than live entries.
+COMPACT_RATIO = 4
+
+
+class GradeService(BaseService):
+    """Stores one append-only journal per class (grades_dir/class_<id>.jsonl) keyed by student and component."""
+
+    def __init__(self, json_path: str = "data/classroom_data.json", grades_dir: str = "data/grades"):
+        super().__init__(json_path)
+        self.grades_dir = grades_dir
+
+    def get_gradebook_path(self, class_id) -> str:
+        """Path of the journal file for a class."""
+        return os.path.join(self.grades_dir, f"class_{class_id}.jsonl")
+
+    def get_roster_by_class_id(self, class_id) -> List[Dict]:
+        """Get enrolled students for a class from the classroom data, if it lists any."""
+        return [
+            {"id": str(s.get("id")), "name": s.get("name", "")}
+            for s in self.data.get("students", []) if s.get("class_id") == class_id
+        ]
+
+    def load_gradebook(self, class_id, compact: bool = True) -> Tuple[List[Dict], Dict[str, Dict[str, str]]]:
+        """Load (students, {student_id: {component_key: grade_text}}) for a class.
+
+        With compact=False the journal is only read, never rewritten (for readers outside the GUI).
+        """
+        path = self.get_gradebook_path(class_id)
+        students: Dict[str, Dict] = {}
+        grades: Dict[str, Dict[str, str]] = {}
+        records = 0
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A partially written last line is ignored.
+                        self.logger.warning(f"Skipping corrupt gradebook record in {path}")
+                        continue
+                    records += 1
+                    if "name" in record:
+                        students[record["student_id"]] = {"id": record["student_id"], "name": record["name"]}
+                        grades.setdefault(record["student_id"], {})
+                    elif record.get("grade"):
+                        grades.setdefault(record["student_id"], {})[record["component"]] = record["grade"]
+                    else:
+                        grades.get(record["student_id"], {}).pop(record["component"], None)
+        except FileNotFoundError:
+            # No saved gradebook yet: start from the classroom roster.
+            roster = self.get_roster_by_class_id(class_id)
+            return roster, {s["id"]: {} for s in roster}
+
+        roster = list(students.values())
+        live = len(roster) + sum(len(cells) for cells in grades.values())
+        if compact and records > COMPACT_RATIO * max(live, 16):
+            self.compact_gradebook(class_id, roster, grades)
+        return roster, grades
+
+    def _write_records(self, path: str, records, mode: str) -> bool:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, mode, encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False))
+                f.write("\n")
+            f.flush()
+        return True
+
+    def save_roster(self, class_id, students: List[Dict]) -> bool:
+        """Append roster entries for a class."""
+        try:
+            return self._write_records(
+                self.get_gradebook_path(class_id),
+                ({"student_id": s["id"], "name": s["name"]} for s in students),
+                "a",
+            )
+        except OSError as e:
+            self.logger.error(f"Error saving roster for class {class_id}: {e}")
+            return False
+
+    def save_grades(self, class_id, cells: List[Tuple[str, str, str]]) -> bool:
+        """Append changed cells as (student_id, component_key, grade_text); blank text clears a grade."""
+        if not cells:
+            return True
+        try:
+            return self._write_records(
+                self.get_gradebook_path(class_id),
+                ({"student_id": s, "component": c, "grade": g} for s, c, g in cells),
+                "a",
+            )
+        except OSError as e:
+            self.logger.error(f"Error saving grades for class {class_id}: {e}")
+            return False
+
+    def compact_gradebook(self, class_id, students: List[Dict], grades: Dict[str, Dict[str, str]]) -> bool:
+        """Rewrite a class journal with only its live roster and grade records."""
+        path = self.get_gradebook_path(class_id)
+        records = [{"student_id": s["id"], "name": s["name"]} for s in students]
+        for student_id, cells in grades.items():
+            records.extend({"student_id": student_id, "component": c, "grade": g} for c, g in cells.items())
+        try:
+            self._write_records(path + ".tmp", records, "w")
+            os.replace(path + ".tmp", path)
+            return True
+        except OSError as e:
+            self.logger.error(f"Error compacting gradebook {path}: {e}")
+            return False
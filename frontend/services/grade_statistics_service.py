@@ -0,0 +1,185 @@
+# grade_statistics_service.py
+import heapq
+import math
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional
+
+# Calculated columns tracked alongside the individual components.
+TERM_COLUMNS = ("midterm", "finalterm", "final_grade")
+
+
+class RunningStatistics:
+    """Aggregates for one column that support adding and removing single values."""
+
+    def __init__(self, passing_grade: float, bin_count: int):
+        self.passing_grade = passing_grade
+        self.bin_count = bin_count
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.passed = 0
+        self.histogram = [0] * bin_count
+        # Sorted values give min, max and median without rescanning.
+        self._sorted: List[float] = []
+
+    def _bin(self, value: float) -> int:
+        index = int(value * self.bin_count // 100)
+        return min(max(index, 0), self.bin_count - 1)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.total_sq += value * value
+        if value >= self.passing_grade:
+            self.passed += 1
+        self.histogram[self._bin(value)] += 1
+        insort(self._sorted, value)
+
+    def remove(self, value: float) -> None:
+        """Remove one value that was added before; raises KeyError if it is not present."""
+        index = bisect_left(self._sorted, value)
+        if index >= len(self._sorted) or self._sorted[index] != value:
+            raise KeyError(value)
+        del self._sorted[index]
+        self.count -= 1
+        self.total -= value
+        self.total_sq -= value * value
+        if value >= self.passing_grade:
+            self.passed -= 1
+        self.histogram[self._bin(value)] -= 1
+
+    def extend(self, values) -> None:
+        """Add many values at once; the sorted list is rebuilt once instead of per value."""
+        values = list(values)
+        for value in values:
+            self.count += 1
+            self.total += value
+            self.total_sq += value * value
+            if value >= self.passing_grade:
+                self.passed += 1
+            self.histogram[self._bin(value)] += 1
+        self._sorted.extend(values)
+        self._sorted.sort()
+
+    def merge(self, *others: "RunningStatistics") -> None:
+        """Fold other columns' aggregates (same passing grade and bins) into this one.
+
+        Pass every column at once: the sorted values are combined in a single sort of
+        the already sorted runs, instead of re-merging this column's values per column.
+        """
+        for other in others:
+            self.count += other.count
+            self.total += other.total
+            self.total_sq += other.total_sq
+            self.passed += other.passed
+            self.histogram = [a + b for a, b in zip(self.histogram, other.histogram)]
+        if len(others) == 1:
+            self._sorted = list(heapq.merge(self._sorted, others[0]._sorted))
+        elif others:
+            for other in others:
+                self._sorted.extend(other._sorted)
+            # Timsort finds the sorted runs and merges them.
+            self._sorted.sort()
+
+    def summary(self) -> Dict:
+        """Return mean, median, standard deviation, min, max, pass rate and histogram."""
+        if not self.count:
+            return {"count": 0, "mean": None, "median": None, "stdev": None, "min": None,
+                    "max": None, "pass_rate": None, "histogram": list(self.histogram)}
+        mean = self.total / self.count
+        variance = max(self.total_sq / self.count - mean * mean, 0.0)
+        middle = self.count // 2
+        if self.count % 2:
+            median = self._sorted[middle]
+        else:
+            median = (self._sorted[middle - 1] + self._sorted[middle]) / 2
+        return {
+            "count": self.count,
+            "mean": mean,
+            "median": median,
+            "stdev": math.sqrt(variance),
+            "min": self._sorted[0],
+            "max": self._sorted[-1],
+            "pass_rate": self.passed / self.count * 100,
+            "histogram": list(self.histogram),
+        }
+
+
+def _finite(value: Optional[float]) -> Optional[float]:
+    """The value, or None if it is missing, infinite or NaN (such values are not counted)."""
+    return value if value is not None and math.isfinite(value) else None
+
+
+class GradeStatisticsService:
+    """Class-wide statistics per component and per term, updated one cell at a time."""
+
+    def __init__(self, passing_grade: float = 75.0, bin_count: int = 10):
+        self.passing_grade = passing_grade
+        self.bin_count = bin_count
+        self.plan = None
+        self.columns: Dict[str, RunningStatistics] = {}
+        # Parsed component values and calculated term results per student.
+        self._rows: Dict[str, List[Optional[float]]] = {}
+        self._results: Dict[str, Dict[str, Optional[float]]] = {}
+
+    def _new_column(self) -> RunningStatistics:
+        return RunningStatistics(self.passing_grade, self.bin_count)
+
+    def reset(self, plan, rows: Dict[str, List[Optional[float]]]) -> None:
+        """Rebuild every aggregate from parsed rows aligned with plan.keys."""
+        self.plan = plan
+        self.columns = {key: self._new_column() for key in list(plan.keys) + list(TERM_COLUMNS)}
+        self._rows = {student_id: list(values) for student_id, values in rows.items()}
+        self._results = {}
+        for values in self._rows.values():
+            values[:] = [_finite(value) for value in values]
+        for student_id, values in self._rows.items():
+            for key, value in zip(plan.keys, values):
+                if value is not None:
+                    self.columns[key].add(value)
+            self._add_results(student_id, plan.evaluate_row(values))
+
+    def _add_results(self, student_id: str, result: Dict[str, Optional[float]]) -> None:
+        result = {column: _finite(value) for column, value in result.items()}
+        self._results[student_id] = result
+        for column in TERM_COLUMNS:
+            if result.get(column) is not None:
+                self.columns[column].add(result[column])
+
+    def _remove_results(self, student_id: str) -> None:
+        result = self._results.pop(student_id, None)
+        if not result:
+            return
+        for column in TERM_COLUMNS:
+            if result.get(column) is not None:
+                self.columns[column].remove(result[column])
+
+    def update_cell(self, student_id: str, component_key: str, value: Optional[float]) -> bool:
+        """Apply one changed grade; only this student's contributions are recalculated."""
+        if self.plan is None or student_id not in self._rows:
+            return False
+        column = self.plan.index.get(component_key)
+        if column is None:
+            return False
+        value = _finite(value)
+        values = self._rows[student_id]
+        old_value = values[column]
+        if old_value == value:
+            return False
+        values[column] = value
+        try:
+            if old_value is not None:
+                self.columns[component_key].remove(old_value)
+            if value is not None:
+                self.columns[component_key].add(value)
+            self._remove_results(student_id)
+            self._add_results(student_id, self.plan.evaluate_row(values))
+        except KeyError:
+            # The aggregates no longer match the stored rows; rebuild them from the rows.
+            self.reset(self.plan, self._rows)
+        return True
+
+    def summary(self, column: str) -> Optional[Dict]:
+        """Statistics for a component key or one of 'midterm', 'finalterm', 'final_grade'."""
+        stats = self.columns.get(column)
+        return stats.summary() if stats else None
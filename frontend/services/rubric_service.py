@@ -0,0 +1,304 @@
+# rubric_service.py
+import math
+from typing import Any, Dict, Iterable, List, Optional
+from .base_service import BaseService
+from ..utils.component_catalog import TERMS, ComponentCatalog
+
+
+def parse_grade_text(grade_text: str) -> Optional[float]:
+    """Parse a "score/total" or plain numeric grade into a percentage, or None if blank/invalid (or not finite)."""
+    if not grade_text:
+        return None
+    try:
+        if "/" in grade_text:
+            score_text, total_text = grade_text.split("/", 1)
+            score = float(score_text) if score_text else 0
+            total = float(total_text) if total_text else 1
+            value = score / total * 100 if total != 0 else 0
+        else:
+            value = float(grade_text)
+    except ValueError:
+        return None
+    return value if math.isfinite(value) else None
+
+
+class Rubric:
+    """Declarative grading rubric: term, category and component weights plus drop-lowest rules and caps."""
+
+    def __init__(self, name: str,
+                 term_weights: Optional[Dict[str, float]] = None,
+                 category_weights: Optional[Dict[str, float]] = None,
+                 component_weights: Optional[Dict[str, float]] = None,
+                 drop_lowest: Optional[Dict[str, int]] = None,
+                 caps: Optional[Dict[str, float]] = None):
+        self.name = name
+        # Share of the final grade per term; missing terms count as zero.
+        self.term_weights = term_weights or {"midterm": 1 / 3, "finalterm": 2 / 3}
+        # Share of the term grade per category; empty means all components are pooled equally.
+        self.category_weights = category_weights or {}
+        # Relative weight per component key ("quiz1_midterm") or item name ("Quiz 1"); default 1.0.
+        self.component_weights = component_weights or {}
+        # Number of lowest scores to drop per category in each term.
+        self.drop_lowest = drop_lowest or {}
+        # Maximum percentage per component key or category.
+        self.caps = caps or {}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Rubric":
+        """Build a rubric from its JSON representation."""
+        return cls(
+            name=data["name"],
+            term_weights=data.get("term_weights"),
+            category_weights=data.get("category_weights"),
+            component_weights=data.get("component_weights"),
+            drop_lowest=data.get("drop_lowest"),
+            caps=data.get("caps"),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the JSON representation of the rubric."""
+        return {
+            "name": self.name,
+            "term_weights": dict(self.term_weights),
+            "category_weights": dict(self.category_weights),
+            "component_weights": dict(self.component_weights),
+            "drop_lowest": dict(self.drop_lowest),
+            "caps": dict(self.caps),
+        }
+
+    def compile(self, catalog: ComponentCatalog) -> "EvaluationPlan":
+        """Resolve every weight, rule and cap against a component catalog once."""
+        term_plans = []
+        for term in catalog.terms:
+            groups = []
+            for category, _ in catalog.signature:
+                if self.category_weights and not self.category_weights.get(category):
+                    # Categories without a weight do not contribute to a weighted term.
+                    category_weight = 0.0
+                else:
+                    category_weight = self.category_weights.get(category, 1.0)
+                entries = []
+                for entry in catalog.items(term, category):
+                    weight = self.component_weights.get(entry.key, self.component_weights.get(entry.item, 1.0))
+                    cap = self.caps.get(entry.key, self.caps.get(category))
+                    entries.append((entry.column, weight, cap))
+                if category_weight > 0 and entries:
+                    groups.append((category_weight, self.drop_lowest.get(category, 0), tuple(entries)))
+            term_plans.append((term, self.term_weights.get(term, 0.0), tuple(groups)))
+        return EvaluationPlan(self.name, catalog.keys, term_plans, weighted=bool(self.category_weights))
+
+
+class EvaluationPlan:
+    """Compiled rubric applied to rows of parsed percentages aligned with ``keys``."""
+
+    def __init__(self, rubric_name: str, keys: List[str], term_plans, weighted: bool):
+        self.rubric_name = rubric_name
+        self.keys = keys
+        self.index = {key: i for i, key in enumerate(keys)}
+        self.term_plans = term_plans
+        self.weighted = weighted
+        # Where each graded column enters the final grade: (term, group, weight, cap) positions.
+        self.slots = {
+            column: (term_position, group_position, weight, cap)
+            for term_position, (_, _, groups) in enumerate(term_plans)
+            for group_position, (_, _, entries) in enumerate(groups)
+            for column, weight, cap in entries
+        }
+
+    def _group_sums(self, values: List[Optional[float]]) -> List[List[List[float]]]:
+        """Per term, [category weight, weighted score total, weight sum] of every group, after caps and drops."""
+        terms = []
+        for _, _, groups in self.term_plans:
+            sums = []
+            for category_weight, drop_count, entries in groups:
+                scored = []
+                for column, weight, cap in entries:
+                    value = values[column]
+                    if value is None:
+                        continue
+                    if cap is not None and value > cap:
+                        value = cap
+                    scored.append((value, weight))
+                if drop_count and scored:
+                    # Always keep at least one score in the category.
+                    scored.sort(key=lambda pair: pair[0])
+                    scored = scored[min(drop_count, len(scored) - 1):]
+                sums.append([category_weight,
+                             sum(value * weight for value, weight in scored),
+                             sum(weight for _, weight in scored)])
+            terms.append(sums)
+        return terms
+
+    def _term_average(self, sums: List[List[float]]) -> Optional[float]:
+        """Average of one term from its group sums, or None if it has no valid grade."""
+        if self.weighted:
+            weighted_total = weighted_sum = 0.0
+            for category_weight, total, weight_sum in sums:
+                if weight_sum > 0:
+                    weighted_total += category_weight * total / weight_sum
+                    weighted_sum += category_weight
+            return weighted_total / weighted_sum if weighted_sum > 0 else None
+        pooled_total = pooled_weight = 0.0
+        for _, total, weight_sum in sums:
+            if weight_sum > 0:
+                pooled_total += total
+                pooled_weight += weight_sum
+        return pooled_total / pooled_weight if pooled_weight > 0 else None
+
+    def evaluate_row(self, values: List[Optional[float]]) -> Dict[str, Optional[float]]:
+        """Return {term: average or None, 'final_grade': float or None} for one student."""
+        result = {}
+        final_grade = 0.0
+        any_term = False
+        for (term, term_weight, _), sums in zip(self.term_plans, self._group_sums(values)):
+            average = self._term_average(sums)
+            result[term] = average
+            if average is not None:
+                any_term = True
+                final_grade += average * term_weight
+        result["final_grade"] = final_grade if any_term else None
+        return result
+
+    def evaluate_matrix(self, rows: Dict[str, List[Optional[float]]]) -> Dict[str, Dict[str, Optional[float]]]:
+        """Evaluate every student row of a grade matrix in one pass."""
+        evaluate_row = self.evaluate_row
+        return {student_id: evaluate_row(values) for student_id, values in rows.items()}
+
+    def _final_with(self, values: List[Optional[float]], column: int, score: float) -> float:
+        filled = list(values)
+        filled[column] = score
+        return self.evaluate_row(filled)["final_grade"] or 0.0
+
+    def project_row(self, values: List[Optional[float]], target: float,
+                    columns: Iterable[int]) -> Dict[str, float]:
+        """Score each remaining column needs on its own for the final grade to reach target.
+
+        Each column is solved with the other remaining columns still ungraded. The group sums
+        of the row are computed once; a score x on one column only changes its own group,
+        whose sums grow by (weight * x, weight), so the final grade is linear in x and two
+        evaluations of that term give the answer. Only columns in a drop-lowest group are
+        bisected. Returns 0.0 if any score will do and math.inf if no score is enough.
+        """
+        sums = self._group_sums(values)
+        averages = [self._term_average(term_sums) for term_sums in sums]
+        term_weights = [term_weight for _, term_weight, _ in self.term_plans]
+        base = sum(weight * average for weight, average in zip(term_weights, averages) if average is not None)
+        required = {}
+        for column in columns:
+            slot = self.slots.get(column)
+            if slot is None:
+                # The column does not count towards the final grade.
+                continue
+            term_position, group_position, weight, cap = slot
+            if self.term_plans[term_position][2][group_position][1]:
+                required[self.keys[column]] = self._bisect(values, column, target)
+                continue
+            term_sums = [list(group) for group in sums[term_position]]
+            group = term_sums[group_position]
+            average = averages[term_position]
+            others = base - (term_weights[term_position] * average if average is not None else 0.0)
+            group[2] += weight
+            low = others + term_weights[term_position] * (self._term_average(term_sums) or 0.0)
+            group[1] += weight * 100.0
+            high = others + term_weights[term_position] * (self._term_average(term_sums) or 0.0)
+            if low >= target:
+                score = 0.0
+            elif high <= low:
+                score = math.inf
+            else:
+                score = (target - low) / ((high - low) / 100.0)
+                if cap is not None and score > cap:
+                    # Scores above the cap count as the cap.
+                    score = math.inf
+            required[self.keys[column]] = score
+        return required
+
+    def _bisect(self, values: List[Optional[float]], column: int, target: float) -> float:
+        if self._final_with(values, column, 0.0) >= target:
+            return 0.0
+        if self._final_with(values, column, 100.0) < target:
+            return math.inf
+        lower, upper = 0.0, 100.0
+        for _ in range(40):
+            middle = (lower + upper) / 2
+            if self._final_with(values, column, middle) >= target:
+                upper = middle
+            else:
+                lower = middle
+        return upper
+
+    def project_matrix(self, rows: Dict[str, List[Optional[float]]], target: float,
+                       remaining: Optional[List[str]] = None) -> Dict[str, Dict[str, float]]:
+        """Per student, the percentage each remaining component needs for the final grade to reach target.
+
+        remaining lists the component keys still to be graded; by default it is every empty cell of a row.
+        Returns {student_id: {component_key: required}} (see project_row); a student with nothing left
+        to grade gets an empty dict. Values above 100 mean the target cannot be reached that way.
+        """
+        fixed_columns = None if remaining is None else [self.index[key] for key in remaining if key in self.index]
+        project_row = self.project_row
+        results = {}
+        for student_id, values in rows.items():
+            if fixed_columns is None:
+                columns = [column for column, value in enumerate(values) if value is None]
+            else:
+                columns = fixed_columns
+            results[student_id] = project_row(values, target, columns)
+        return results
+
+
+class RubricService(BaseService):
+    """Stores rubric definitions and caches their compiled evaluation plans."""
+
+    DEFAULT_RUBRIC = "Standard (1/3 Midterm, 2/3 Final)"
+
+    def __init__(self, json_path: str = "data/rubrics.json"):
+        super().__init__(json_path)
+        self._plans = {}
+
+    def get_default_data(self) -> Dict[str, Any]:
+        """Built-in rubrics used when no rubric file exists."""
+        return {"rubrics": [
+            Rubric(self.DEFAULT_RUBRIC).to_dict(),
+            Rubric(
+                "Weighted Lecture (PT 40 / Quiz 30 / Exam 30)",
+                category_weights={"performance_tasks": 0.4, "quizzes": 0.3, "exams": 0.3},
+                drop_lowest={"quizzes": 1},
+                caps={"performance_tasks": 100, "quizzes": 100, "exams": 100},
+            ).to_dict(),
+            Rubric(
+                "Equal Terms (50 / 50)",
+                term_weights={"midterm": 0.5, "finalterm": 0.5},
+                category_weights={"performance_tasks": 0.4, "quizzes": 0.3, "exams": 0.3},
+            ).to_dict(),
+        ]}
+
+    def get_rubric_names(self) -> List[str]:
+        """Get the names of all available rubrics."""
+        return [r["name"] for r in self.data.get("rubrics", [])]
+
+    def get_rubric(self, name: str) -> Optional[Rubric]:
+        """Get a rubric by name; the default rubric is always available, even if the rubric file lacks it."""
+        for rubric_data in self.data.get("rubrics", []):
+            if rubric_data.get("name") == name:
+                return Rubric.from_dict(rubric_data)
+        if name == self.DEFAULT_RUBRIC:
+            return Rubric(self.DEFAULT_RUBRIC)
+        return None
+
+    def save_rubric(self, rubric: Rubric) -> bool:
+        """Create or replace a rubric definition."""
+        rubrics = [r for r in self.data.get("rubrics", []) if r.get("name") != rubric.name]
+        rubrics.append(rubric.to_dict())
+        self.data["rubrics"] = rubrics
+        self._plans = {k: v for k, v in self._plans.items() if k[0] != rubric.name}
+        return self.save_data()
+
+    def compile(self, rubric: Rubric, catalog: ComponentCatalog) -> EvaluationPlan:
+        """Return the evaluation plan for a rubric, compiling only when the structure changed."""
+        signature = (rubric.name, catalog.terms, catalog.signature)
+        plan = self._plans.get(signature)
+        if plan is None:
+            plan = rubric.compile(catalog)
+            self._plans[signature] = plan
+        return plan
@@ -1,19 +1,40 @@
 # stream_service.py (refactored)
 from datetime import datetime
-from typing import List, Dict
+from typing import Callable, List, Dict
 from .base_service import BaseService
 
+# Events published after a post was saved; listeners receive the post dict.
+POST_EVENTS = ("post_added", "post_updated", "post_deleted")
+
 class StreamService(BaseService):
     def __init__(self, json_path: str):
         super().__init__(json_path)
+        self.listeners: Dict[str, List[Callable[[Dict], None]]] = {event: [] for event in POST_EVENTS}
+    
+    def subscribe(self, event: str, callback: Callable[[Dict], None]) -> None:
+        """Call callback(post) whenever event happens."""
+        self.listeners[event].append(callback)
+    
+    def unsubscribe(self, event: str, callback: Callable[[Dict], None]) -> None:
+        """Stop calling a callback registered with subscribe."""
+        if callback in self.listeners.get(event, []):
+            self.listeners[event].remove(callback)
+    
+    def publish(self, event: str, post: Dict) -> None:
+        for callback in list(self.listeners[event]):
+            try:
+                callback(post)
+            except Exception as e:
+                self.logger.error(f"Error in {event} listener: {e}")
     
     def get_posts_by_class_id(self, class_id: int) -> List[Dict]:
         """Get posts for a class, sorted by date (newest first)."""
         posts = [p for p in self.data.get("posts", []) if p.get("class_id") == class_id]
         
         try:
+            # fromisoformat parses "%Y-%m-%d %H:%M:%S" far faster than strptime
             return sorted(posts, 
-                         key=lambda x: datetime.strptime(x["date"], "%Y-%m-%d %H:%M:%S"), 
+                         key=lambda x: datetime.fromisoformat(x["date"]), 
                          reverse=True)
         except (KeyError, ValueError):
             return posts  # Fallback to original order
@@ -29,8 +50,42 @@ class StreamService(BaseService):
                 self.data["posts"] = []
             
             self.data["posts"].append(post_data)
-            return self.save_data()
+            if not self.save_data():
+                return False
+            self.publish("post_added", post_data)
+            return True
             
         except Exception as e:
             self.logger.error(f"Error adding post: {e}")
+            return False
+    
+    def update_post(self, post_id: int, updates: Dict) -> bool:
+        """Update an existing post."""
+        try:
+            for post in self.data.get("posts", []):
+                if post.get("id") == post_id:
+                    post.update(updates)
+                    if not self.save_data():
+                        return False
+                    self.publish("post_updated", post)
+                    return True
+            return False
+        except Exception as e:
+            self.logger.error(f"Error updating post {post_id}: {e}")
+            return False
+    
+    def delete_post(self, post_id: int) -> bool:
+        """Delete a post."""
+        try:
+            posts = self.data.get("posts", [])
+            post = next((p for p in posts if p.get("id") == post_id), None)
+            if post is None:
+                return False
+            self.data["posts"] = [p for p in posts if p is not post]
+            if not self.save_data():
+                return False
+            self.publish("post_deleted", post)
+            return True
+        except Exception as e:
+            self.logger.error(f"Error deleting post {post_id}: {e}")
             return False
\ No newline at end of file
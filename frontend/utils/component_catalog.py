@@ -0,0 +1,79 @@
+"""
+Precomputed grade component keys and their term, category and column
+"""
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Grading terms, in column order.
+TERMS = ("midterm", "finalterm")
+# Suffix shown after an item name in column titles, e.g. "Quiz 1 (M)".
+TERM_SUFFIXES = {"midterm": "M", "finalterm": "F"}
+# Component categories and items of a standard lecture gradebook.
+DEFAULT_COMPONENTS = {
+    "performance_tasks": ["PT1", "PT2", "PT3"],
+    "quizzes": ["Quiz 1", "Quiz 2", "Quiz 3", "Quiz 4"],
+    "exams": ["Prelim Exam", "Final Exam"],
+}
+
+
+def component_key(item: str, term: str) -> str:
+    """Storage key of a component item in a term, e.g. ("Quiz 1", "midterm") -> "quiz1_midterm"."""
+    return f"{item.lower().replace(' ', '')}_{term}"
+
+
+class ComponentEntry(NamedTuple):
+    key: str
+    item: str
+    term: str
+    category: str
+    column: int
+    label: str
+
+
+class ComponentCatalog:
+    """Every component key of a component structure, resolved once.
+
+    Entries are ordered term by term, then by category and item, which is also the
+    column order of the grade matrix and of compiled evaluation plans.
+    """
+
+    def __init__(self, components: Dict[str, List[str]], terms: Tuple[str, ...] = TERMS):
+        self.terms = tuple(terms)
+        # Hashable snapshot of the structure; equal signatures mean equal catalogs.
+        self.signature = tuple((category, tuple(items)) for category, items in components.items())
+        self.entries: List[ComponentEntry] = []
+        self._groups: Dict[Tuple[str, str], List[ComponentEntry]] = {}
+        for term in self.terms:
+            suffix = TERM_SUFFIXES.get(term, term)
+            for category, items in self.signature:
+                group = self._groups.setdefault((term, category), [])
+                for item in items:
+                    entry = ComponentEntry(component_key(item, term), item, term, category,
+                                           len(self.entries), f"{item} ({suffix})")
+                    self.entries.append(entry)
+                    group.append(entry)
+        self.keys: List[str] = [entry.key for entry in self.entries]
+        self.by_key: Dict[str, ComponentEntry] = {entry.key: entry for entry in self.entries}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def matches(self, components: Dict[str, List[str]]) -> bool:
+        """Whether this catalog was built from the given component structure."""
+        return self.signature == tuple((category, tuple(items)) for category, items in components.items())
+
+    def get(self, key: str) -> Optional[ComponentEntry]:
+        return self.by_key.get(key)
+
+    def term_of(self, key: str) -> Optional[str]:
+        entry = self.by_key.get(key)
+        return entry.term if entry else None
+
+    def items(self, term: str, category: str) -> List[ComponentEntry]:
+        """Entries of one category in one term, in item order."""
+        return self._groups.get((term, category), [])
+
+    def for_term(self, term: str) -> List[ComponentEntry]:
+        return [entry for entry in self.entries if entry.term == term]
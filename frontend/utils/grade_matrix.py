@@ -0,0 +1,253 @@
+"""
+Compact sparse storage for gradebook cells
+"""
+import math
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+_NAN = float("nan")
+
+
+def _format_number(value: float) -> str:
+    """Format a float the way a teacher would type it ("45", "45.5")."""
+    if value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def encode_grade(grade_text: str) -> Tuple[float, float]:
+    """Split grade text into (score, total); total is NaN for plain numbers, both are NaN if invalid.
+
+    Infinite or NaN numbers ("inf", "1e999", "nan/10") are invalid too.
+    """
+    try:
+        if "/" in grade_text:
+            score_text, total_text = grade_text.split("/", 1)
+            score = float(score_text) if score_text else 0.0
+            total = float(total_text) if total_text else 1.0
+            if math.isfinite(score) and math.isfinite(total):
+                return score, total
+            return _NAN, _NAN
+        score = float(grade_text)
+        return (score, _NAN) if math.isfinite(score) else (_NAN, _NAN)
+    except ValueError:
+        return _NAN, _NAN
+
+
+def decode_grade(score: float, total: float) -> str:
+    if total != total:
+        return _format_number(score)
+    return f"{_format_number(score)}/{_format_number(total)}"
+
+
+class GradeMatrix:
+    """Sparse student x component grade matrix.
+
+    Students and components are mapped to row and column indices. Each row stores only
+    its filled cells: the sorted column indices in one packed int array and the matching
+    (score, total) pairs in one packed float array, so an empty cell costs nothing and a
+    filled one 20 bytes. Lookups bisect the column array of a row in place. Texts that do
+    not round-trip through (score, total), such as "7/" or "abc", are kept verbatim in a
+    small side table.
+    """
+
+    def __init__(self, component_keys: Iterable[str] = ()):
+        self.component_keys: List[str] = []
+        self.component_index: Dict[str, int] = {}
+        self.student_ids: List[str] = []
+        self.student_index: Dict[str, int] = {}
+        # Per row: sorted column indices ("i") and (score, total) pairs ("d"), None until filled.
+        self._columns: List[Optional[array]] = []
+        self._rows: List[Optional[array]] = []
+        self._texts: Dict[Tuple[int, int], str] = {}
+        for key in component_keys:
+            self.add_component(key)
+
+    # --- Structure ---
+    def add_component(self, component_key: str) -> int:
+        """Register a component column and return its index."""
+        column = self.component_index.get(component_key)
+        if column is None:
+            column = len(self.component_keys)
+            self.component_keys.append(component_key)
+            self.component_index[component_key] = column
+        return column
+
+    def add_student(self, student_id: str) -> int:
+        """Register a student row and return its index."""
+        row = self.student_index.get(student_id)
+        if row is None:
+            row = len(self.student_ids)
+            self.student_ids.append(student_id)
+            self.student_index[student_id] = row
+            # The row arrays are allocated on the first filled cell.
+            self._columns.append(None)
+            self._rows.append(None)
+        return row
+
+    def has_student(self, student_id: str) -> bool:
+        return student_id in self.student_index
+
+    def clear(self) -> None:
+        """Remove all students and grades, keeping the component columns."""
+        self.student_ids = []
+        self.student_index = {}
+        self._columns = []
+        self._rows = []
+        self._texts = {}
+
+    def __len__(self) -> int:
+        return len(self.student_ids)
+
+    def copy(self) -> "GradeMatrix":
+        """Independent copy of the matrix, e.g. for reading it on another thread."""
+        other = GradeMatrix()
+        other.component_keys = list(self.component_keys)
+        other.component_index = dict(self.component_index)
+        other.student_ids = list(self.student_ids)
+        other.student_index = dict(self.student_index)
+        other._columns = [None if columns is None else array("i", columns) for columns in self._columns]
+        other._rows = [None if cells is None else array("d", cells) for cells in self._rows]
+        other._texts = dict(self._texts)
+        return other
+
+    # --- Cell Access ---
+    @staticmethod
+    def _find(columns: Optional[array], column: int) -> Tuple[int, bool]:
+        """Position of column in a row's column array (or where it would be inserted) and whether it exists."""
+        if columns is None:
+            return 0, False
+        position = bisect_left(columns, column)
+        return position, position < len(columns) and columns[position] == column
+
+    def _lookup(self, student_id: str, component_key: str) -> Tuple[Optional[int], Optional[int], int]:
+        """Return (row, column, offset) of a filled cell's score in the row's value array; offset is -1 if empty."""
+        row = self.student_index.get(student_id)
+        column = self.component_index.get(component_key)
+        if row is None or column is None:
+            return row, column, -1
+        position, found = self._find(self._columns[row], column)
+        return row, column, position * 2 if found else -1
+
+    def get(self, student_id: str, component_key: str) -> str:
+        """Grade text of a cell, or "" if the cell is empty or unknown."""
+        row, column, offset = self._lookup(student_id, component_key)
+        if offset < 0:
+            return ""
+        text = self._texts.get((row, column))
+        if text is not None:
+            return text
+        cells = self._rows[row]
+        return decode_grade(cells[offset], cells[offset + 1])
+
+    def set(self, student_id: str, component_key: str, grade_text: str) -> bool:
+        """Set a cell's grade text ("" clears it); returns False for unknown students."""
+        row = self.student_index.get(student_id)
+        if row is None:
+            return False
+        column = self.add_component(component_key)
+        columns = self._columns[row]
+        cells = self._rows[row]
+        position, found = self._find(columns, column)
+        offset = position * 2
+        if not grade_text:
+            if found:
+                del columns[position]
+                del cells[offset:offset + 2]
+                self._texts.pop((row, column), None)
+            return True
+
+        score, total = encode_grade(grade_text)
+        if score != score or decode_grade(score, total) != grade_text:
+            self._texts[(row, column)] = grade_text
+        else:
+            self._texts.pop((row, column), None)
+        if found:
+            cells[offset] = score
+            cells[offset + 1] = total
+        elif columns is None:
+            self._columns[row] = array("i", (column,))
+            self._rows[row] = array("d", (score, total))
+        else:
+            columns.insert(position, column)
+            cells.insert(offset, total)
+            cells.insert(offset, score)
+        return True
+
+    @staticmethod
+    def _percentage(score: float, total: float) -> Optional[float]:
+        if score != score:
+            return None
+        if total != total:
+            return score
+        if total == 0:
+            return 0
+        percentage = score / total * 100
+        # Extreme but finite scores can still overflow, e.g. "1e308/1e-308".
+        return percentage if math.isfinite(percentage) else None
+
+    def percentage(self, student_id: str, component_key: str) -> Optional[float]:
+        """Cell value as a percentage, or None if empty or invalid."""
+        row, _, offset = self._lookup(student_id, component_key)
+        if offset < 0:
+            return None
+        cells = self._rows[row]
+        return self._percentage(cells[offset], cells[offset + 1])
+
+    # --- Row and Column Iteration ---
+    def _triples(self, row: int) -> Iterator[Tuple[int, float, float]]:
+        cells = self._rows[row]
+        if cells is None:
+            return iter(())
+        return zip(self._columns[row], cells[0::2], cells[1::2])
+
+    def _text(self, row: int, column: int, score: float, total: float) -> str:
+        text = self._texts.get((row, column)) if self._texts else None
+        return text if text is not None else decode_grade(score, total)
+
+    def row_items(self, student_id: str) -> Iterator[Tuple[str, str]]:
+        """Yield (component_key, grade_text) for the filled cells of a student."""
+        row = self.student_index.get(student_id)
+        if row is None:
+            return
+        for column, score, total in list(self._triples(row)):
+            yield self.component_keys[column], self._text(row, column, score, total)
+
+    def column_items(self, component_key: str) -> Iterator[Tuple[str, str]]:
+        """Yield (student_id, grade_text) for the filled cells of a component."""
+        column = self.component_index.get(component_key)
+        if column is None:
+            return
+        for row, student_id in enumerate(self.student_ids):
+            position, found = self._find(self._columns[row], column)
+            if found:
+                cells = self._rows[row]
+                yield student_id, self._text(row, column, cells[position * 2], cells[position * 2 + 1])
+
+    def percentage_row(self, student_id: str, component_keys: Optional[List[str]] = None) -> List[Optional[float]]:
+        """Dense list of percentages for a student, aligned with component_keys (default: all columns)."""
+        row = self.student_index.get(student_id)
+        if component_keys is None or component_keys == self.component_keys:
+            values: List[Optional[float]] = [None] * len(self.component_keys)
+            if row is not None:
+                percentage = self._percentage
+                for column, score, total in self._triples(row):
+                    values[column] = percentage(score, total)
+            return values
+        return [self.percentage(student_id, key) for key in component_keys]
+
+    def text_row(self, student_id: str, component_keys: Optional[List[str]] = None) -> List[str]:
+        """Dense list of grade texts for a student, aligned with component_keys (default: all columns)."""
+        row = self.student_index.get(student_id)
+        if component_keys is None or component_keys == self.component_keys:
+            texts = [""] * len(self.component_keys)
+            if row is not None:
+                for column, score, total in self._triples(row):
+                    texts[column] = self._text(row, column, score, total)
+            return texts
+        return [self.get(student_id, key) for key in component_keys]
+
+    def filled_count(self) -> int:
+        """Number of non-empty cells."""
+        return sum(len(columns) for columns in self._columns if columns is not None)
@@ -0,0 +1,115 @@
+"""
+Process-wide cache of rasterised icons and pixmaps
+"""
+import os
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtGui import QGuiApplication, QIcon, QPixmap
+
+# Icons used by the classroom views, pre-warmed at startup as (file name, size).
+STARTUP_ICONS = (
+    ("document.svg", 24),
+    ("baseline-add.svg", None),
+)
+ICONS_DIR = os.path.join("frontend", "assets", "icons")
+
+Size = Union[None, int, Tuple[int, int], QSize]
+
+
+def icon_path(name: str) -> str:
+    """Path of an icon file in the assets directory."""
+    return os.path.join(ICONS_DIR, name)
+
+
+def _size_key(size: Size) -> Optional[Tuple[int, int]]:
+    if size is None:
+        return None
+    if isinstance(size, QSize):
+        return size.width(), size.height()
+    if isinstance(size, int):
+        return size, size
+    return int(size[0]), int(size[1])
+
+
+class IconCache:
+    """Rasterises each (path, size, device pixel ratio) once and shares the result.
+
+    Pixmaps are scaled to size x ratio device pixels and tagged with the ratio, so they
+    stay sharp on high-DPI screens. Missing files are cached as null pixmaps, so callers
+    keep their fallbacks without hitting the disk again. Use from the GUI thread only.
+    """
+
+    def __init__(self):
+        self._pixmaps: Dict[Tuple[str, Optional[Tuple[int, int]], float], QPixmap] = {}
+        self._icons: Dict[Tuple[str, float], QIcon] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._pixmaps) + len(self._icons)
+
+    @staticmethod
+    def device_pixel_ratio() -> float:
+        app = QGuiApplication.instance()
+        return app.devicePixelRatio() if app is not None else 1.0
+
+    def pixmap(self, path: str, size: Size = None, dpr: Optional[float] = None) -> QPixmap:
+        """The file at path scaled to size (keeping its aspect ratio), or at its own size if None."""
+        dpr = dpr or self.device_pixel_ratio()
+        key = (os.path.normpath(path), _size_key(size), dpr)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self.hits += 1
+            return pixmap
+        self.misses += 1
+        pixmap = QPixmap(path)
+        if not pixmap.isNull() and key[1] is not None:
+            width, height = key[1]
+            pixmap = pixmap.scaled(round(width * dpr), round(height * dpr), Qt.AspectRatioMode.KeepAspectRatio,
+                                   Qt.TransformationMode.SmoothTransformation)
+            pixmap.setDevicePixelRatio(dpr)
+        self._pixmaps[key] = pixmap
+        return pixmap
+
+    def icon(self, path: str, dpr: Optional[float] = None) -> QIcon:
+        """A QIcon of the file at path (a null icon if it does not exist)."""
+        dpr = dpr or self.device_pixel_ratio()
+        key = (os.path.normpath(path), dpr)
+        icon = self._icons.get(key)
+        if icon is not None:
+            self.hits += 1
+            return icon
+        # The miss is counted by the pixmap lookup.
+        icon = QIcon()
+        pixmap = self.pixmap(path, None, dpr)
+        if not pixmap.isNull():
+            icon.addPixmap(pixmap, QIcon.Mode.Normal, QIcon.State.Off)
+        self._icons[key] = icon
+        return icon
+
+    def prewarm(self, entries: Iterable[Tuple[str, Size]] = STARTUP_ICONS) -> int:
+        """Rasterise (file name or path, size) pairs ahead of use; returns how many were new."""
+        misses = self.misses
+        for name, size in entries:
+            path = name if os.path.dirname(name) else icon_path(name)
+            self.pixmap(path, size)
+        return self.misses - misses
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        self._pixmaps.clear()
+        self._icons.clear()
+        self.hits = self.misses = 0
+
+
+# The cache shared by every view in the process.
+icon_cache = IconCache()
@@ -0,0 +1,105 @@
+"""
+Least-recently-used cache of navigation views, bounded by count and estimated memory
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from PyQt6.QtWidgets import QWidget
+
+# Rough per-object costs used to estimate what a cached view keeps alive.
+WIDGET_BYTES = 4 * 1024
+ROW_BYTES = 1024
+
+
+def estimate_view_bytes(view: QWidget) -> int:
+    """A view's own estimate if it has one, else its widget count times WIDGET_BYTES."""
+    estimate = getattr(view, "estimated_memory", None)
+    if estimate is not None:
+        return estimate()
+    return (1 + len(view.findChildren(QWidget))) * WIDGET_BYTES
+
+
+class ViewCache:
+    """Keeps recently shown views alive so navigating back to them is instant.
+
+    At most max_views views are kept, and no more than max_bytes of them by
+    estimate_view_bytes(); the least recently used ones are evicted first and
+    handed to release(view), which must detach and delete them. Views grow
+    while they are used, so the bounds are checked again on every put() and
+    evict(), never evicting the protected (currently shown) view.
+    """
+
+    def __init__(self, release: Callable[[QWidget], Any], max_views: int = 4,
+                 max_bytes: int = 64 * 1024 * 1024):
+        self.release = release
+        self.max_views = max_views
+        self.max_bytes = max_bytes
+        self._views: "OrderedDict[Hashable, QWidget]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._views
+
+    def keys(self) -> List[Hashable]:
+        """Cached keys, least recently used first."""
+        return list(self._views)
+
+    def get(self, key: Hashable) -> Optional[QWidget]:
+        view = self._views.get(key)
+        if view is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._views.move_to_end(key)
+        return view
+
+    def put(self, key: Hashable, view: QWidget) -> List[Hashable]:
+        """Cache a view as the most recently used; returns the keys evicted to make room."""
+        old = self._views.pop(key, None)
+        if old is not None and old is not view:
+            self.release(old)
+        self._views[key] = view
+        return self.evict(protect=key)
+
+    def pop(self, key: Hashable) -> Optional[QWidget]:
+        """Remove a view from the cache without releasing it."""
+        return self._views.pop(key, None)
+
+    def estimated_bytes(self) -> int:
+        return sum(estimate_view_bytes(view) for view in self._views.values())
+
+    def evict(self, protect: Optional[Hashable] = None) -> List[Hashable]:
+        """Release least recently used views until the cache is within its bounds."""
+        sizes: Dict[Hashable, int] = {key: estimate_view_bytes(view) for key, view in self._views.items()}
+        total = sum(sizes.values())
+        evicted = []
+        for key in list(self._views):
+            if len(self._views) <= self.max_views and total <= self.max_bytes:
+                break
+            if key == protect:
+                continue
+            view = self._views.pop(key)
+            total -= sizes[key]
+            evicted.append(key)
+            self.evictions += 1
+            self.release(view)
+        return evicted
+
+    def clear(self) -> None:
+        for view in self._views.values():
+            self.release(view)
+        self._views.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "views": len(self._views),
+            "estimated_bytes": self.estimated_bytes(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -2,18 +2,50 @@
 from PyQt6.QtWidgets import (
     QWidget, QApplication, QVBoxLayout, QHBoxLayout, QMainWindow,
     QLabel, QPushButton, QHeaderView, QSpacerItem, QSizePolicy,
-    QFrame, QComboBox, QTreeWidget, QTreeWidgetItem, QLineEdit,
-    QMenu, QCheckBox, QToolButton
+    QFrame, QComboBox, QLineEdit,
+    QMenu, QCheckBox, QToolButton, QFileDialog, QMessageBox, QGridLayout,
+    QTableView, QAbstractItemView, QStyledItemDelegate, QStyle
 )
 # Import core Qt functionalities for signals, enums, and objects
-from PyQt6.QtCore import Qt, QSize, pyqtSignal, QObject
+from PyQt6.QtCore import Qt, QSize, pyqtSignal, pyqtSlot, QObject, QTimer, QThread, QAbstractTableModel, QModelIndex
 # Import GUI utilities for colors, palettes, fonts, icons, actions, painters, and pens
 from PyQt6.QtGui import QColor, QPalette, QFont, QIcon, QAction, QPainter, QPen
 # Import system module for accessing command-line arguments
 import sys
+# Import csv module to recognise malformed import files
+import csv
+# Import time module for timestamping audited grade changes
+import time
+# Import the rubric service that compiles grading rubrics into evaluation plans
+from frontend.services.rubric_service import Rubric, RubricService
+# Import the export service that streams grade sheets to CSV/XLSX files
+from frontend.services.grade_export_service import GradeExportService, ExportCancelled
+# Import the import service that parses and validates grade CSV files
+from frontend.services.grade_import_service import GradeImportService
+# Import the grade service that persists gradebooks per class
+from frontend.services.grade_service import GradeService
+# Import the statistics service that keeps running class-wide aggregates
+from frontend.services.grade_statistics_service import GradeStatisticsService
+# Import the aggregation service that rolls grades up across course sections
+from frontend.services.grade_aggregation_service import GradeAggregationService
+# Import the audit service that keeps an append-only log of grade changes
+from frontend.services.grade_audit_service import GradeAuditService, current_user
+# Import the sparse matrix that stores the grade cells
+from frontend.utils.grade_matrix import GradeMatrix
+# Import the catalog that resolves component keys, terms and columns once
+from frontend.utils.component_catalog import ComponentCatalog, DEFAULT_COMPONENTS, TERMS
 
 # --- Controller and Data Model Layer ---
 
+# Rubric filter names (as listed in the rubrics dropdown) mapped to the component they show.
+# None shows every component.
+COMPONENT_FILTERS = {
+    "Overall Lecture": None,
+    "Performance Task": 'performance_task',
+    "Quiz": 'quiz',
+    "Exam": 'exam',
+}
+
 # --- GradeDataModel Class ---
 # This class manages the application's data independently of the UI.
 # It acts as the single source of truth for all grade-related information.
@@ -24,12 +56,16 @@ class GradeDataModel(QObject):
     """
     # --- Signals ---
     # Define Qt signals to notify the UI when data changes occur.
-    # data_reset: Emitted when the entire dataset is reloaded (e.g., new data).
+    # data_reset: Emitted when the entire dataset is reloaded (e.g., new data or a bulk import).
     data_reset = pyqtSignal()
     # data_updated: Emitted when individual grades are modified.
     data_updated = pyqtSignal()
+    # grade_changed: Emitted with (student_id, component_key, old_text, new_text) for each single edit.
+    grade_changed = pyqtSignal(str, str, str, str)
     # columns_changed: Emitted when the state of columns (expanded/collapsed) changes.
     columns_changed = pyqtSignal()
+    # column_filter_changed: Emitted when the visible component filter changes (no structure change).
+    column_filter_changed = pyqtSignal()
 
     # --- Constructor ---
     # Initializes the model's attributes and data structures.
@@ -38,11 +74,11 @@ class GradeDataModel(QObject):
         # List to store student information: [{'id': '101', 'name': 'Castro, Carlos Fidel'}, ...]
         self.students = []
         # Dictionary defining the available grade components and their items.
-        self.components = {
-            'performance_tasks': ['PT1', 'PT2', 'PT3'],
-            'quizzes': ['Quiz 1', 'Quiz 2', 'Quiz 3', 'Quiz 4'],
-            'exams': ['Prelim Exam', 'Final Exam']
-        }
+        # Assigning a new structure (see the components property) regenerates the catalog.
+        # e.g. {'performance_tasks': ['PT1', 'PT2', 'PT3'], 'quizzes': ['Quiz 1', ...], 'exams': [...]}
+        self._components = {category: list(items) for category, items in DEFAULT_COMPONENTS.items()}
+        # Every component key with its term, category, column index and label, built once.
+        self.catalog = ComponentCatalog(self._components)
         # Dictionary to track the expanded/collapsed state of various column groups.
         self.column_states = {
             'midterm_expanded': False,
@@ -53,10 +89,48 @@ class GradeDataModel(QObject):
             'performance_task_finalterm_expanded': False,
             'quiz_finalterm_expanded': False,
             'exam_finalterm_expanded': False,
+            # Optional calculated column with the score each student needs to pass.
+            'needed_to_pass_visible': False,
         }
-        # Nested dictionary to store actual grade values: {student_id: {component_key: grade_str}}.
+        # Component whose columns are shown ('quiz', ...); None shows all components.
+        self.column_filter = None
+        # Sparse matrix of grade values indexed by student id and component key.
         # Example component_key: 'pt1_midterm', 'quiz1_finalterm'.
-        self.grades = {}
+        # Columns follow the catalog order, matching the rubric evaluation plans.
+        self.grades = GradeMatrix(self.catalog.keys)
+        # Class whose gradebook is loaded (None for sample data that is never saved).
+        self.class_id = None
+        # Cells changed since the last save: {(student_id, component_key)}.
+        self.dirty_cells = set()
+        # User recorded as the author of grade changes in the audit log.
+        self.audit_user = current_user()
+        # Grade changes not yet written to the audit log:
+        # [(timestamp, user, student_id, component_key, old_text, new_text)].
+        self.audit_records = []
+
+    # --- Component Structure ---
+    # The component structure; read-only so that every change goes through the setter.
+    @property
+    def components(self):
+        return self._components
+
+    # Replaces the component structure and regenerates the catalog if it actually changed.
+    @components.setter
+    def components(self, components):
+        self.set_components(components)
+
+    def set_components(self, components):
+        """Sets the component structure, rebuilding the catalog only when it differs."""
+        # Copy the lists so later edits to the caller's dict cannot bypass the catalog.
+        components = {category: list(items) for category, items in components.items()}
+        if self.catalog.matches(components):
+            return
+        self._components = components
+        self.catalog = ComponentCatalog(components)
+        # Existing grades keep their columns; new components get new ones.
+        for key in self.catalog.keys:
+            self.grades.add_component(key)
+        self.columns_changed.emit()
 
     # --- Data Loading ---
     # Loads sample student data into the model for demonstration purposes.
@@ -69,12 +143,35 @@ class GradeDataModel(QObject):
             {'id': '103', 'name': "Garcia, Juan Pablo"},
             {'id': '104', 'name': "Rodriguez, Ana Sofia"}
         ]
-        # Initialize an empty grades dictionary for each student.
+        # Initialize an empty grade row for each student.
+        self.grades.clear()
         for student in self.students:
-            self.grades[student['id']] = {}
+            self.grades.add_student(student['id'])
         # Emit the data_reset signal to inform the UI that the data structure is ready.
         self.data_reset.emit()
 
+    # Loads a saved gradebook for a class into the model.
+    def load_gradebook(self, class_id, students, grades):
+        """Replaces the roster and grades with a loaded gradebook."""
+        self.class_id = class_id
+        self.students = list(students)
+        # Every student gets a grade row, even if nothing was saved for them yet.
+        self.grades.clear()
+        for student in self.students:
+            self.grades.add_student(student['id'])
+            for component_key, grade_text in grades.get(student['id'], {}).items():
+                self.grades.set(student['id'], component_key, grade_text)
+        # Freshly loaded data has nothing to save.
+        self.dirty_cells.clear()
+        self.audit_records = []
+        self.data_reset.emit()
+
+    # Returns the changed cells as (student_id, component_key, grade_text) and marks them clean.
+    def take_dirty_cells(self):
+        cells = [(student_id, key, self.get_grade(student_id, key)) for student_id, key in self.dirty_cells]
+        self.dirty_cells.clear()
+        return cells
+
     # --- State Accessors/Mutators ---
     # Retrieves the current state (True/False) of a specific column group.
     def get_column_state(self, key):
@@ -90,39 +187,74 @@ class GradeDataModel(QObject):
             # Emit the columns_changed signal to trigger UI updates.
             self.columns_changed.emit()
 
+    # Updates which component's columns are visible; the column structure itself is unchanged.
+    def set_column_filter(self, component):
+        """Sets the component filter and emits a signal if it changed."""
+        if self.column_filter != component:
+            self.column_filter = component
+            self.column_filter_changed.emit()
+
     # Sets or updates a specific grade for a student and component, then notifies the UI.
     def set_grade(self, student_id, component_key, grade_text):
         """Sets a grade for a student and component."""
-        # Check if the student ID exists in the grades dictionary.
-        if student_id in self.grades:
+        # Check if the student ID exists in the grade matrix.
+        if self.grades.has_student(student_id):
+            # Skip the update (and the signal) if the grade did not actually change.
+            old_text = self.grades.get(student_id, component_key)
+            if old_text == grade_text:
+                return
             # Update the grade for the specific student and component.
-            self.grades[student_id][component_key] = grade_text
+            self.grades.set(student_id, component_key, grade_text)
+            # Remember the cell so only it is written back on the next save.
+            self.dirty_cells.add((student_id, component_key))
+            # Record the change for the audit log.
+            self.record_change(student_id, component_key, old_text, grade_text)
+            # Report exactly which cell changed so listeners can update incrementally.
+            self.grade_changed.emit(student_id, component_key, old_text, grade_text)
             # Emit the data_updated signal to inform the UI of the change.
             self.data_updated.emit()
 
+    # Applies many grades at once and notifies the UI a single time.
+    def set_grades(self, updates):
+        """Sets grades in bulk from {student_id: {component_key: grade_text}}."""
+        changed = False
+        for student_id, student_updates in updates.items():
+            # Ignore students that are not part of the roster.
+            if not self.grades.has_student(student_id):
+                continue
+            for component_key, grade_text in student_updates.items():
+                old_text = self.grades.get(student_id, component_key)
+                if old_text != grade_text:
+                    self.grades.set(student_id, component_key, grade_text)
+                    self.dirty_cells.add((student_id, component_key))
+                    self.record_change(student_id, component_key, old_text, grade_text)
+                    changed = True
+        # Emit one data_reset for the whole batch instead of one data_updated per cell.
+        if changed:
+            self.data_reset.emit()
+        return changed
+
+    # Queues a grade change for the audit log; sample data without a class is not audited.
+    def record_change(self, student_id, component_key, old_text, new_text):
+        if self.class_id is not None:
+            self.audit_records.append((time.time(), self.audit_user, student_id, component_key, old_text, new_text))
+
+    # Returns the queued audit records and starts a new batch.
+    def take_audit_records(self):
+        records = self.audit_records
+        self.audit_records = []
+        return records
+
     # Retrieves a specific grade for a student and component.
     def get_grade(self, student_id, component_key):
         """Gets a grade for a student and component."""
         # Safely retrieve the grade, returning an empty string if not found.
-        return self.grades.get(student_id, {}).get(component_key, "")
+        return self.grades.get(student_id, component_key)
 
-    # Generates a list of all possible component keys based on the defined structure.
+    # Returns every component key of the current structure, term by term.
     def get_all_component_keys(self):
-        """Generates a list of all possible component keys based on structure."""
-        keys = []
-        # Iterate through Performance Tasks for both terms.
-        for pt in self.components['performance_tasks']:
-            keys.append(f"{pt.lower().replace(' ', '')}_midterm")
-            keys.append(f"{pt.lower().replace(' ', '')}_finalterm")
-        # Iterate through Quizzes for both terms.
-        for q in self.components['quizzes']:
-            keys.append(f"{q.lower().replace(' ', '')}_midterm")
-            keys.append(f"{q.lower().replace(' ', '')}_finalterm")
-        # Iterate through Exams for both terms.
-        for e in self.components['exams']:
-            keys.append(f"{e.lower().replace(' ', '')}_midterm")
-            keys.append(f"{e.lower().replace(' ', '')}_finalterm")
-        return keys
+        """Returns the precomputed list of all component keys."""
+        return self.catalog.keys
 
 # --- GradeController Class ---
 # This class handles the application's business logic.
@@ -140,33 +272,90 @@ class GradeController(QObject):
     # columns_changed: Emitted when column structure/expansion state changes.
     columns_changed = pyqtSignal()
 
+    # data_reloaded: Emitted when grades were replaced wholesale and input fields must be re-read.
+    data_reloaded = pyqtSignal()
+    # rubric_changed: Emitted with the rubric name when a different grading rubric is selected.
+    rubric_changed = pyqtSignal(str)
+    # statistics_changed: Emitted after the class statistics were updated.
+    statistics_changed = pyqtSignal()
+    # save_requested: Sends (class_id, dirty cells) to the write-back thread.
+    save_requested = pyqtSignal(object, object)
+    # audit_requested: Sends (class_id, audit records) to the write-back thread.
+    audit_requested = pyqtSignal(object, object)
+    # write_back_stop_requested: Asks the write-back thread to finish after queued saves.
+    write_back_stop_requested = pyqtSignal()
+    # sections_aggregated: Emitted with the department report of a background rollup.
+    sections_aggregated = pyqtSignal(object)
+    # aggregation_failed: Emitted with an error message when a background rollup fails.
+    aggregation_failed = pyqtSignal(str)
+
+    # Milliseconds after the last change before dirty cells are written back.
+    AUTOSAVE_MS = 1500
+    # Final grade that counts as passing, used as the default projection target.
+    PASSING_GRADE = 75.0
+
     # --- Constructor ---
     # Initializes the controller and establishes connections with the model.
-    def __init__(self, model: GradeDataModel):
+    def __init__(self, model: GradeDataModel, rubric_service: RubricService = None):
         super().__init__()
         # Store a reference to the GradeDataModel instance.
         self.model = model
+        # Service holding the rubric definitions and their compiled evaluation plans.
+        self.rubric_service = rubric_service or RubricService()
+        # The active rubric; the default reproduces equal averaging and the 1/3 - 2/3 term split.
+        self.rubric = self.rubric_service.get_rubric(RubricService.DEFAULT_RUBRIC)
+        # Class statistics; created on first use and then maintained incrementally.
+        self.statistics = None
+        # Persistence: grade and audit services, write-back thread/worker and the autosave timer.
+        self.grade_service = None
+        self.audit_service = None
+        self.write_back_thread = None
+        self.write_back_worker = None
+        # Background department rollup thread and worker (None while no rollup is running), and
+        # the rollup service, kept so its worker processes are reused by later rollups.
+        self.aggregation_thread = None
+        self.aggregation_worker = None
+        self.aggregation_service = None
+        self._autosave_timer = QTimer(self)
+        self._autosave_timer.setSingleShot(True)
+        self._autosave_timer.setInterval(self.AUTOSAVE_MS)
+        self._autosave_timer.timeout.connect(self.flush_saves)
         # Connect the model's signals to the controller's internal handler methods.
         # This ensures the controller reacts to changes in the model.
         self.model.data_reset.connect(self.on_model_data_reset)
         self.model.data_updated.connect(self.on_model_data_updated)
         self.model.columns_changed.connect(self.on_model_columns_changed)
+        self.model.grade_changed.connect(self.on_model_grade_changed)
 
     # --- Model Signal Handlers ---
     # Internal methods that respond to signals emitted by the GradeDataModel.
     # They re-emit controller-specific signals to the UI.
     def on_model_data_reset(self):
-        # When the model emits data_reset, the controller emits data_changed.
+        # When the model emits data_reset, the controller emits data_reloaded and data_changed.
+        self.data_reloaded.emit()
         self.data_changed.emit()
+        # A reset can change any cell, so the statistics are rebuilt.
+        self.rebuild_statistics()
+        # Bulk changes (e.g., an import) are autosaved like single edits.
+        self.schedule_save()
 
     def on_model_data_updated(self):
         # When the model emits data_updated, the controller emits data_changed.
         self.data_changed.emit()
+        # Schedule an autosave of the edited cells.
+        self.schedule_save()
 
     def on_model_columns_changed(self):
         # When the model emits columns_changed, the controller emits columns_changed.
         self.columns_changed.emit()
 
+    def on_model_grade_changed(self, student_id, component_key, old_text, new_text):
+        # Update the running statistics with just the edited cell.
+        if self.statistics is not None:
+            if self.statistics.update_cell(student_id, component_key,
+                                           self.model.grades.percentage(student_id, component_key)):
+                self.statistics_changed.emit()
+
     # --- UI Interaction Handler ---
     # Processes user actions related to header expansion/collapse.
     def handle_header_expand_clicked(self, column_info):
@@ -206,6 +395,91 @@ class GradeController(QObject):
             # The model's set_column_state method will emit columns_changed if the state changes.
             self.model.set_column_state(key, not current_state)
 
+    # Applies a rubric filter selected in the rubrics dropdown.
+    def set_rubric_filter(self, filter_name):
+        """Shows only the columns of the component named by filter_name."""
+        if filter_name in COMPONENT_FILTERS:
+            self.model.set_column_filter(COMPONENT_FILTERS[filter_name])
+
+    # --- Persistence ---
+    # Loads a class gradebook through the grade service and starts background write-back.
+    def load_class(self, class_id, grade_service: GradeService = None, audit_service: GradeAuditService = None):
+        """Loads the saved grades for a class; only dirty cells are written back afterwards."""
+        self.grade_service = grade_service or GradeService()
+        self.audit_service = audit_service or GradeAuditService()
+        students, grades = self.grade_service.load_gradebook(class_id)
+        # Students enrolled in the classroom data but not in the gradebook yet (a journal can hold
+        # grades saved before the roster existed) are shown too; nothing is written for them.
+        known = {student['id'] for student in students}
+        students = students + [student for student in self.grade_service.get_roster_by_class_id(class_id)
+                               if student['id'] not in known]
+        # A class without any roster starts with an empty gradebook.
+        self.model.load_gradebook(class_id, students, grades)
+        self.start_write_back()
+
+    # Starts the thread that appends dirty cells to the gradebook.
+    def start_write_back(self):
+        if self.write_back_thread is not None:
+            return
+        self.write_back_thread = QThread(self)
+        self.write_back_worker = GradeWriteBackWorker(self.grade_service, self.audit_service)
+        self.write_back_worker.moveToThread(self.write_back_thread)
+        # Queued connections: saves and audit records are written in order on the write-back thread.
+        self.save_requested.connect(self.write_back_worker.write)
+        self.audit_requested.connect(self.write_back_worker.write_audit)
+        self.write_back_stop_requested.connect(self.write_back_worker.stop)
+        self.write_back_thread.start()
+
+    # Restarts the autosave timer if there is something to save.
+    def schedule_save(self):
+        if self.write_back_thread is not None and (self.model.dirty_cells or self.model.audit_records):
+            self._autosave_timer.start()
+
+    # Sends the current batch of dirty cells to the write-back thread.
+    def flush_saves(self):
+        self._autosave_timer.stop()
+        if self.write_back_thread is None or self.model.class_id is None:
+            return
+        cells = self.model.take_dirty_cells()
+        if cells:
+            self.save_requested.emit(self.model.class_id, cells)
+        records = self.model.take_audit_records()
+        if records:
+            self.audit_requested.emit(self.model.class_id, records)
+
+    # Flushes remaining edits and waits until every queued save has been written.
+    def shutdown_write_back(self):
+        if self.write_back_thread is None:
+            return
+        self.flush_saves()
+        self.write_back_stop_requested.emit()
+        self.write_back_thread.wait()
+        self.write_back_thread = None
+        self.write_back_worker = None
+
+    # --- Rubric Selection ---
+    # Returns the names of the rubrics the user can choose from.
+    def get_rubric_names(self):
+        return self.rubric_service.get_rubric_names()
+
+    # Switches the active rubric and triggers a recalculation of every student.
+    def set_rubric(self, rubric_name):
+        """Activates a rubric by name and notifies the UI."""
+        rubric = self.rubric_service.get_rubric(rubric_name)
+        # Ignore unknown rubrics and re-selections of the active one.
+        if rubric is None or (self.rubric is not None and rubric.name == self.rubric.name):
+            return
+        self.rubric = rubric
+        self.rubric_changed.emit(rubric.name)
+        self.data_changed.emit()
+        # Term and final grade statistics depend on the rubric.
+        self.rebuild_statistics()
+
+    # Returns the evaluation plan for the active rubric and current component structure.
+    # The service compiles it once and reuses it until the rubric or components change.
+    def get_evaluation_plan(self):
+        return self.rubric_service.compile(self.rubric, self.model.catalog)
+
     # --- Calculation Logic ---
     # Performs calculations for student grades based on the data in the model.
     def calculate_grades_for_student(self, student_id):
@@ -213,60 +487,342 @@ class GradeController(QObject):
         Calculates midterm, finalterm, and final grades for a student.
         Returns a dictionary of calculated grades.
         """
-        # Initialize accumulators for midterm and final term grades.
-        midterm_total = 0
-        midterm_count = 0
-        finalterm_total = 0
-        finalterm_count = 0
-
-        # Iterate through all possible component keys.
-        for component_key in self.model.get_all_component_keys():
-            # Get the grade text for the current student and component.
-            grade_text = self.model.get_grade(student_id, component_key)
-            # Skip empty grades.
-            if not grade_text:
-                continue
-
-            try:
-                # Determine the term (midterm or finalterm) based on the component key.
-                term = 'midterm' if '_midterm' in component_key else 'finalterm'
-                # Parse the grade text. If it's in "score/total" format, calculate percentage.
-                if '/' in grade_text:
-                    parts = grade_text.split('/', 1)
-                    score = float(parts[0]) if parts[0] else 0
-                    total = float(parts[1]) if parts[1] else 1
-                    # Calculate percentage, avoiding division by zero.
-                    grade = score / total * 100 if total != 0 else 0
-                else:
-                    # If not in "score/total" format, treat as a direct numerical grade.
-                    grade = float(grade_text) if grade_text else 0
-
-                # Accumulate grades based on the term.
-                if term == 'midterm':
-                    midterm_total += grade
-                    midterm_count += 1
-                elif term == 'finalterm':
-                    finalterm_total += grade
-                    finalterm_count += 1
-            # Handle cases where the grade text is not a valid number.
-            except ValueError:
-                continue
-
-        # Calculate average grades for midterm and final term.
-        # Avoid division by zero by checking the count.
-        midterm_avg = midterm_total / midterm_count if midterm_count > 0 else 0
-        finalterm_avg = finalterm_total / finalterm_count if finalterm_count > 0 else 0
-        # Calculate the overall final grade using a weighted average.
-        # Midterm contributes 1/3, Final Term contributes 2/3.
-        final_grade = (midterm_avg * 1/3) + (finalterm_avg * 2/3) if (midterm_count > 0 or finalterm_count > 0) else 0
-
-        # Return the calculated grades formatted as strings with two decimal places.
+        plan = self.get_evaluation_plan()
+        # Read the student's percentages aligned with the plan's columns.
+        values = self.model.grades.percentage_row(student_id, plan.keys)
+        return self.format_calculated_grades(plan.evaluate_row(values))
+
+    # Calculates grades for every student in a single pass over the grade matrix.
+    def calculate_all_grades(self):
+        """Returns {student_id: calculated grades} for all students in the model."""
+        plan = self.get_evaluation_plan()
+        results = plan.evaluate_matrix(self.build_parsed_rows(plan))
+        return {student_id: self.format_calculated_grades(result) for student_id, result in results.items()}
+
+    # Builds one row of percentages per student, in plan column order.
+    # The matrix keeps scores numerically, so no grade text is parsed here.
+    def build_parsed_rows(self, plan):
+        keys = plan.keys
+        percentage_row = self.model.grades.percentage_row
+        return {student['id']: percentage_row(student['id'], keys) for student in self.model.students}
+
+    # Formats a plan result as the strings shown in the calculated columns.
+    # Terms without any valid grade are shown as 0.00, as before.
+    def format_calculated_grades(self, result):
+        midterm_avg = result.get('midterm') or 0
+        finalterm_avg = result.get('finalterm') or 0
+        final_grade = result.get('final_grade') or 0
         return {
             'midterm_avg': f"{midterm_avg:.2f}",
             'finalterm_avg': f"{finalterm_avg:.2f}",
             'final_grade': f"{final_grade:.2f}"
         }
 
+    # --- What-If Projection ---
+    # Returns the score a student needs on each remaining component to reach a target final grade,
+    # each solved with the other remaining components still ungraded.
+    # component_keys names the components still to be graded (e.g. ['finalexam_finalterm']);
+    # by default every empty component counts as remaining.
+    def project_required_score(self, student_id, target=None, component_keys=None):
+        """Returns {component key: required percentage}; values above 100 are unreachable."""
+        plan = self.get_evaluation_plan()
+        values = self.model.grades.percentage_row(student_id, plan.keys)
+        target = self.PASSING_GRADE if target is None else target
+        return plan.project_matrix({student_id: values}, target, component_keys)[student_id]
+
+    # Solves the "needed to pass" scores for the whole class in one pass over the grade matrix.
+    def calculate_needed_to_pass(self, target=None):
+        """Returns {student_id: {component key: required percentage}} for every student."""
+        plan = self.get_evaluation_plan()
+        target = self.PASSING_GRADE if target is None else target
+        return plan.project_matrix(self.build_parsed_rows(plan), target)
+
+    # Formats a projection as the (text, tooltip) of a "Needed to Pass" cell.
+    # The cell shows the lowest requirement; the tooltip lists every remaining component.
+    def format_projection(self, required):
+        if not required:
+            return "N/A", "Nothing left to grade"
+
+        def text(score):
+            return "Unreachable" if score > 100 else f"{score:.2f}"
+
+        lines = []
+        for key, score in sorted(required.items(), key=lambda item: item[1]):
+            entry = self.model.catalog.get(key)
+            lines.append(f"{entry.label if entry else key}: {text(score)}")
+        return text(min(required.values())), "\n".join(lines)
+
+    # --- Export Rows ---
+    # Column titles of the exported grade sheet, laid out like the fully expanded table.
+    def get_export_header(self):
+        header = ['No.', 'Name']
+        term_titles = {'midterm': 'Midterm Grade', 'finalterm': 'Final Term Grade'}
+        for term in TERMS:
+            header.extend(entry.label for entry in self.model.catalog.for_term(term))
+            header.append(term_titles[term])
+        header.append('Final Grade')
+        return header
+
+    # --- Class Statistics ---
+    # Returns the statistics service, building it from the current grades on first use.
+    def get_statistics(self):
+        if self.statistics is None:
+            self.statistics = GradeStatisticsService()
+            self.rebuild_statistics()
+        return self.statistics
+
+    # Recomputes all statistics from scratch (after bulk changes or a rubric switch).
+    def rebuild_statistics(self):
+        if self.statistics is None:
+            return
+        plan = self.get_evaluation_plan()
+        self.statistics.reset(plan, self.build_parsed_rows(plan))
+        self.statistics_changed.emit()
+
+    # Returns [(column key, display label)] for every column the statistics cover.
+    def get_statistics_columns(self):
+        columns = [('final_grade', 'Final Grade'), ('midterm', 'Midterm Grade'), ('finalterm', 'Final Term Grade')]
+        columns.extend((entry.key, entry.label) for entry in self.model.catalog)
+        return columns
+
+    # --- Department Rollup ---
+    # Computes final grades for many sections using the active rubric, blocking until done.
+    # Sections are read straight from their saved gradebooks; this model is left untouched.
+    def aggregate_sections(self, class_ids, aggregation_service: GradeAggregationService = None, max_workers=None):
+        service = aggregation_service or self.get_aggregation_service()
+        return service.aggregate(class_ids, self.rubric, self.model.components, max_workers)
+
+    # Returns the shared rollup service, creating it on first use.
+    def get_aggregation_service(self):
+        if self.aggregation_service is None:
+            self.aggregation_service = GradeAggregationService()
+        return self.aggregation_service
+
+    # Runs the same rollup on a background thread; the report arrives through sections_aggregated.
+    # Returns False if a rollup is already running.
+    def start_section_aggregation(self, class_ids, aggregation_service: GradeAggregationService = None,
+                                  max_workers=None):
+        if self.aggregation_thread is not None:
+            return False
+        # The worker gets copies of the rubric and components, so later edits do not reach it.
+        self.aggregation_thread = QThread(self)
+        self.aggregation_worker = GradeAggregationWorker(
+            aggregation_service or self.get_aggregation_service(),
+            list(class_ids),
+            Rubric.from_dict(self.rubric.to_dict()),
+            {category: list(items) for category, items in self.model.components.items()},
+            max_workers,
+        )
+        self.aggregation_worker.moveToThread(self.aggregation_thread)
+        self.aggregation_thread.started.connect(self.aggregation_worker.run)
+        self.aggregation_worker.finished.connect(self.on_aggregation_finished)
+        self.aggregation_worker.failed.connect(self.on_aggregation_failed)
+        self.aggregation_thread.start()
+        return True
+
+    def on_aggregation_finished(self, report):
+        self.wait_for_aggregation()
+        self.sections_aggregated.emit(report)
+
+    def on_aggregation_failed(self, message):
+        self.wait_for_aggregation()
+        self.aggregation_failed.emit(message)
+
+    # Waits for a running rollup to end and releases its thread.
+    def wait_for_aggregation(self):
+        if self.aggregation_thread is None:
+            return
+        self.aggregation_thread.quit()
+        self.aggregation_thread.wait()
+        self.aggregation_thread.deleteLater()
+        self.aggregation_worker.deleteLater()
+        self.aggregation_thread = None
+        self.aggregation_worker = None
+
+    # Waits for a running rollup, then stops the shared service's worker processes.
+    def shutdown_aggregation(self):
+        self.wait_for_aggregation()
+        if self.aggregation_service is not None:
+            self.aggregation_service.close()
+            self.aggregation_service = None
+
+    # --- Import Columns ---
+    # Maps accepted CSV header text (lower-cased) to component keys.
+    # Both raw keys ("quiz1_midterm") and the exported labels ("Quiz 1 (M)") are accepted.
+    def get_import_columns(self):
+        columns = {}
+        for entry in self.model.catalog:
+            columns[entry.key] = entry.key
+            columns[entry.label.lower()] = entry.key
+        return columns
+
+    # Captures everything an export reads, on the GUI thread: the compiled plan, a copy of the
+    # grade matrix and the roster. Returns (header, rows, total); the rows read only the copies,
+    # so they can be written out on a worker thread while grades keep being edited.
+    def snapshot_export(self):
+        plan = self.get_evaluation_plan()
+        students = [dict(student) for student in self.model.students]
+        rows = self.iter_export_rows(plan, self.model.grades.copy(), students)
+        return self.get_export_header(), rows, len(students)
+
+    # Yields one export row per student: raw component scores followed by the calculated grades.
+    # Rows are produced lazily so the export never holds the whole sheet in memory.
+    def iter_export_rows(self, plan=None, grades=None, students=None):
+        if plan is None:
+            plan = self.get_evaluation_plan()
+        # Column ranges of each term in the plan, in plan order.
+        term_columns = []
+        start = 0
+        for term, _, groups in plan.term_plans:
+            width = sum(len(entries) for _, _, entries in groups)
+            term_columns.append((term, start, start + width))
+            start += width
+        # Iterate over a snapshot of the roster; grades are read row by row.
+        if grades is None:
+            grades = self.model.grades
+        if students is None:
+            students = list(self.model.students)
+        for student in students:
+            raw = grades.text_row(student['id'], plan.keys)
+            result = plan.evaluate_row(grades.percentage_row(student['id'], plan.keys))
+            row = [student['id'], student['name']]
+            for term, first, last in term_columns:
+                row.extend(raw[first:last])
+                row.append(round(result[term] or 0, 2))
+            row.append(round(result['final_grade'] or 0, 2))
+            yield row
+
+
+# --- GradeWriteBackWorker Class ---
+# Appends batches of dirty cells to the gradebook, and grade changes to the audit log, on a background thread.
+class GradeWriteBackWorker(QObject):
+    # saved: Emitted with the number of cells written in a batch.
+    saved = pyqtSignal(int)
+    # failed: Emitted with the class id when a batch could not be written.
+    failed = pyqtSignal(object)
+
+    def __init__(self, grade_service: GradeService, audit_service: GradeAuditService = None):
+        super().__init__()
+        self.grade_service = grade_service
+        self.audit_service = audit_service
+
+    @pyqtSlot(object, object)
+    def write(self, class_id, cells):
+        if self.grade_service.save_grades(class_id, cells):
+            self.saved.emit(len(cells))
+        else:
+            self.failed.emit(class_id)
+
+    # Appends a batch of grade changes to the class audit log.
+    @pyqtSlot(object, object)
+    def write_audit(self, class_id, records):
+        if self.audit_service is not None and not self.audit_service.append(class_id, records):
+            self.failed.emit(class_id)
+
+    # Runs after all previously queued batches, then ends the thread's event loop.
+    @pyqtSlot()
+    def stop(self):
+        QThread.currentThread().quit()
+
+
+# --- GradeImportWorker Class ---
+# Parses and validates a grade CSV on a background thread.
+# The parsed grades are applied on the GUI thread in one batch.
+class GradeImportWorker(QObject):
+    # progress: Emitted with the number of rows read so far.
+    progress = pyqtSignal(int)
+    # finished: Emitted with the GradeImportResult when parsing completes.
+    finished = pyqtSignal(object)
+    # failed: Emitted with an error message if the file cannot be read.
+    failed = pyqtSignal(str)
+
+    def __init__(self, path, student_ids, columns, import_service: GradeImportService = None):
+        super().__init__()
+        self.path = path
+        # Snapshots taken on the GUI thread so the worker never touches the model.
+        self.student_ids = list(student_ids)
+        self.columns = dict(columns)
+        self.import_service = import_service or GradeImportService()
+
+    def run(self):
+        try:
+            result = self.import_service.parse(self.path, self.student_ids, self.columns,
+                                               progress=self.progress.emit)
+            self.finished.emit(result)
+        except (OSError, csv.Error, ValueError) as e:
+            # Unreadable files, bad encodings (UnicodeDecodeError is a ValueError) and malformed CSV.
+            self.failed.emit(f"Import failed: {e}")
+        except Exception as e:
+            # Anything else must still end the import, or the import button stays disabled.
+            self.failed.emit(f"Import failed unexpectedly: {e}")
+
+
+# --- GradeExportWorker Class ---
+# Runs a grade sheet export on a background thread and reports progress to the UI.
+class GradeExportWorker(QObject):
+    # progress: Emitted with (rows written, total rows) while exporting.
+    progress = pyqtSignal(int, int)
+    # finished: Emitted with (file path, rows written) when the export succeeds.
+    finished = pyqtSignal(str, int)
+    # failed: Emitted with an error message when the export fails or is cancelled.
+    failed = pyqtSignal(str)
+
+    # header, rows and total come from GradeController.snapshot_export(), taken on the GUI thread.
+    def __init__(self, header, rows, total, path, export_service: GradeExportService = None):
+        super().__init__()
+        self.header = header
+        self.rows = rows
+        self.total = total
+        self.path = path
+        self.export_service = export_service or GradeExportService()
+        self._cancelled = False
+
+    # Requests the export to stop at the next progress checkpoint.
+    def cancel(self):
+        self._cancelled = True
+
+    # Streams the snapshot rows into the export file.
+    def run(self):
+        try:
+            written = self.export_service.export(
+                self.path,
+                self.header,
+                self.rows,
+                self.total,
+                progress=self.progress.emit,
+                is_cancelled=lambda: self._cancelled,
+            )
+            self.finished.emit(self.path, written)
+        except ExportCancelled:
+            self.failed.emit("Export cancelled")
+        except Exception as e:
+            self.failed.emit(f"Export failed: {e}")
+
+
+# --- GradeAggregationWorker Class ---
+# Rolls grades up across course sections on a background thread.
+class GradeAggregationWorker(QObject):
+    # finished: Emitted with the department report.
+    finished = pyqtSignal(object)
+    # failed: Emitted with an error message if the rollup fails.
+    failed = pyqtSignal(str)
+
+    def __init__(self, aggregation_service: GradeAggregationService, class_ids, rubric, components, max_workers=None):
+        super().__init__()
+        self.aggregation_service = aggregation_service
+        self.class_ids = class_ids
+        self.rubric = rubric
+        self.components = components
+        self.max_workers = max_workers
+
+    def run(self):
+        try:
+            report = self.aggregation_service.aggregate(self.class_ids, self.rubric, self.components,
+                                                        self.max_workers)
+            self.finished.emit(report)
+        except Exception as e:
+            self.failed.emit(f"Aggregation failed: {e}")
+
 
 # --- UI Layer ---
 
@@ -274,6 +830,14 @@ class GradeController(QObject):
 # A custom header view that handles painting for expandable columns
 # and manages their expanded/collapsed states visually.
 class ExpandableHeaderView(QHeaderView):
+    # --- Shared Paint Resources ---
+    # Colors, pens and fonts are created once instead of on every paint.
+    DEFAULT_BG_COLOR = QColor("#084924")        # Base header color.
+    EXPANDED_MAIN_BG_COLOR = QColor("#036800")  # Background for expanded main headers & components.
+    SUB_HEADER_TEXT_COLOR = QColor("#FFC000")   # Text color for component headers (Quiz, PT).
+    WHITE_TEXT_COLOR = QColor("white")          # Default text color.
+    BORDER_PEN = QPen(QColor("#0A5A2A"), 1)     # Dark green right border.
+
     # --- Constructor ---
     # Initializes the header view and sets up basic configurations.
     def __init__(self, orientation, parent=None):
@@ -281,6 +845,12 @@ class ExpandableHeaderView(QHeaderView):
         # Dictionary to store information about expandable columns.
         # Key: visual index, Value: {'info': column_info_dict, 'expanded': bool}.
         self.expandable_columns = {}
+        # Precomputed paint layout per logical index: (bg_color, text_color, indicator or None).
+        # Rebuilt only when the column structure changes.
+        self.section_layout = {}
+        self._layout_dirty = True
+        # Bold font for the expand/collapse indicator.
+        self.indicator_font = QFont("Arial", 10, QFont.Weight.Bold)
         # Connect the internal section clicked signal to a handler for repainting.
         self.sectionClicked.connect(self._on_section_clicked_internally)
 
@@ -290,7 +860,12 @@ class ExpandableHeaderView(QHeaderView):
         self.updateSection(logical_index) # Update only the clicked section.
         self.viewport().update() # Ensure the viewport updates correctly.
 
-    # --- Public Method for Setting Column Info ---
+    # --- Public Methods for Setting Column Info ---
+    # Removes all registered expandable columns (called before the structure is rebuilt).
+    def clear_expandable_columns(self):
+        self.expandable_columns = {}
+        self._layout_dirty = True
+
     # Allows the parent widget (CollapsibleGradesTable) to register expandable columns.
     def set_expandable_column(self, visual_index, column_info, is_expanded=False):
         # Store the column information and its expanded state.
@@ -298,11 +873,50 @@ class ExpandableHeaderView(QHeaderView):
             'info': column_info,
             'expanded': is_expanded
         }
+        # The paint layout is recomputed once, on the next paint.
+        self._layout_dirty = True
         # Get the logical index and trigger an update for that section.
         logical_index = self.logicalIndex(visual_index)
         if logical_index >= 0:
             self.updateSection(logical_index)
 
+    # --- Layout Cache ---
+    # Works out the colors and indicator of every expandable section in one pass.
+    def _rebuild_section_layout(self):
+        # Terms whose main header ("Midterm Grade", "Final Term Grade") is expanded.
+        expanded_terms = {
+            data['info'].get('target')
+            for data in self.expandable_columns.values()
+            if data['info'].get('type') == 'expandable_main' and data['expanded']
+        }
+
+        self.section_layout = {}
+        for visual_index, data in self.expandable_columns.items():
+            col_info = data['info']
+            col_type = col_info.get('type')
+            col_term = col_info.get('term') # Term for sub-components and grade inputs.
+            target_term = col_info.get('target') # Target term for main headers.
+            # Determine if this column belongs to an expanded main section.
+            is_in_expanded_main_section = (col_term in expanded_terms) or (target_term in expanded_terms)
+
+            bg_color = self.DEFAULT_BG_COLOR
+            text_color = self.WHITE_TEXT_COLOR
+            # 1. Main Header: expanded background when its own section is open.
+            # 2. Sub-Header: yellow text on the expanded background inside an open section.
+            # 3. Grade Input: expanded background inside an open section.
+            if is_in_expanded_main_section:
+                bg_color = self.EXPANDED_MAIN_BG_COLOR
+                if col_type == 'expandable_component':
+                    text_color = self.SUB_HEADER_TEXT_COLOR
+
+            # Expand/collapse indicator: ">" for collapsed, "<" for expanded.
+            indicator = None
+            if col_type in ['expandable_main', 'expandable_component']:
+                indicator = " >" if not data['expanded'] else " <"
+
+            self.section_layout[self.logicalIndex(visual_index)] = (bg_color, text_color, indicator)
+        self._layout_dirty = False
+
     # --- Mouse Event Handling ---
     # Overrides the default mouse press event to handle clicks on expandable columns.
     def mousePressEvent(self, event):
@@ -324,124 +938,50 @@ class ExpandableHeaderView(QHeaderView):
     # --- Custom Painting ---
     # Overrides the default painting for header sections to provide custom visuals.
     def paintSection(self, painter, rect, logicalIndex):
-        # Get the visual index of the section being painted.
-        visual_index = self.visualIndex(logicalIndex)
-        # Retrieve the stored information for this expandable column.
-        column_data = self.expandable_columns.get(visual_index)
+        # Recompute the cached layout if the column structure changed.
+        if self._layout_dirty:
+            self._rebuild_section_layout()
+        # Look up the precomputed colors and indicator for this section.
+        section = self.section_layout.get(logicalIndex)
 
         # --- Default Painting for Non-Expandable Columns ---
         # If there's no custom data for this section, fall back to default painting.
-        if not column_data:
+        if section is None:
             # Save the painter's current state.
             painter.save()
             # Set the brush to the default background color.
-            painter.setBrush(QColor("#084924"))
+            painter.setBrush(self.DEFAULT_BG_COLOR)
             # Set the pen to NoPen to avoid drawing borders here.
             painter.setPen(Qt.PenStyle.NoPen)
             # Draw the background rectangle.
             painter.drawRect(rect)
-            # Restore the painter's state.
-            painter.restore()
-
             # Draw a right border for the section.
-            painter.save()
-            painter.setPen(QPen(QColor("#0A5A2A"), 1))
+            painter.setPen(self.BORDER_PEN)
             painter.drawLine(rect.topRight(), rect.bottomRight())
+            # Restore the painter's state.
             painter.restore()
 
             # Let Qt draw the standard header text on top.
             super().paintSection(painter, rect, logicalIndex)
             return # Exit early for non-expandable columns.
 
-        # --- Extract Column Information ---
-        # Get the details of the column being painted.
-        col_info = column_data['info']
-        is_expanded = column_data['expanded']
-        col_type = col_info.get('type')
-        col_term = col_info.get('term') # Term for sub-components and grade inputs.
-        target_term = col_info.get('target') # Target term for main headers.
-
-        # --- Determine Visual Context ---
-        # Determine if this column belongs to an expanded main section.
-        is_in_expanded_main_section = False
-        is_main_header_expanded = False
-        expanded_term = None
-
-        # Check all registered expandable columns to find expanded main headers.
-        for check_visual_index, data in self.expandable_columns.items():
-            info = data['info']
-            # Look for expandable_main columns that are currently expanded.
-            if info.get('type') == 'expandable_main' and data['expanded']:
-                main_target = info.get('target')
-                # Check if this column's term matches the expanded main header's target.
-                if (col_term and col_term == main_target) or \
-                   (target_term and target_term == main_target) or \
-                   (col_type == 'expandable_main' and target_term == main_target):
-                    is_in_expanded_main_section = True
-                    expanded_term = main_target
-                    # Special case: if this column is the main header itself.
-                    if col_type == 'expandable_main' and target_term == main_target:
-                        is_main_header_expanded = True
-                    break # Found the relevant main header.
-
-        # --- Define Visual Colors ---
-        # Define the color palette used for painting.
-        default_bg_color = QColor("#084924")      # Base header color.
-        expanded_main_bg_color = QColor("#036800") # Background for expanded main headers & components.
-        sub_header_text_color = QColor("#FFC000")  # Text color for component headers (Quiz, PT).
-        white_text_color = QColor("white")         # Default text color.
-
-        # --- Determine Final Painting Colors ---
-        # Decide the background and text colors based on the column's state and type.
-        bg_color = default_bg_color
-        text_color = white_text_color
-
-        # 1. Main Header (Expandable Main) - e.g., "Midterm Grade", "Final Term Grade"
-        if col_type == 'expandable_main':
-            if is_main_header_expanded:
-                # Use the expanded background color if this main header is expanded.
-                bg_color = expanded_main_bg_color
-            # Text color for main headers is always white.
-
-        # 2. Sub-Header (Expandable Component) - e.g., "Performance Task", "Quiz"
-        elif col_type == 'expandable_component':
-            if is_in_expanded_main_section:
-                # Change text color to yellow/orange if it's under an expanded main section.
-                text_color = sub_header_text_color
-                # Also give it the expanded background color.
-                bg_color = expanded_main_bg_color
-            # Else, use default colors.
-
-        # 3. Grade Input Component Columns - e.g., "PT1 (M)", "Quiz 1 (F)"
-        elif col_type == 'grade_input':
-            if is_in_expanded_main_section:
-                # Give grade input columns the expanded background color.
-                bg_color = expanded_main_bg_color
-                # Text color for grade inputs is always white when in an expanded section.
-            # Else, default background, white text.
+        bg_color, text_color, indicator = section
 
         # --- Painting Sequence ---
-        # 1. Draw Background
-        # Save painter state, set brush to the determined background color, and draw the rectangle.
         painter.save()
+        # 1. Draw Background
         painter.setBrush(bg_color)
         painter.setPen(Qt.PenStyle.NoPen) # No border for the fill.
         painter.drawRect(rect)
-        painter.restore()
 
         # 2. Draw Right Border
-        # Save painter state, set pen for the border, and draw the vertical line.
-        painter.save()
-        painter.setPen(QPen(QColor("#0A5A2A"), 1)) # Dark green border.
+        painter.setPen(self.BORDER_PEN)
         painter.drawLine(rect.topRight(), rect.bottomRight())
-        painter.restore()
 
         # 3. Draw Text
-        # Save painter state, set pen to the determined text color and font, then draw the text.
-        painter.save()
+        # Set pen to the determined text color and font, then draw the text.
         painter.setPen(text_color)
         painter.setFont(self.font())
-
         # Get the text to draw from the model's header data.
         text = self.model().headerData(logicalIndex, self.orientation(), Qt.ItemDataRole.DisplayRole)
         if text is not None:
@@ -449,30 +989,258 @@ class ExpandableHeaderView(QHeaderView):
             text_rect = rect.adjusted(4, 0, -25, 0)
             # Draw the text aligned to the left and vertically centered.
             painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, str(text))
-        painter.restore()
 
         # 4. Draw Expand/Collapse Indicator (only for expandable columns)
-        # Check if the column type qualifies for an expand/collapse indicator.
-        if col_type in ['expandable_main', 'expandable_component']:
-            # Save painter state, set pen to white for the indicator.
-            painter.save()
-            painter.setPen(white_text_color)
-            # Set a bold Arial font for the indicator.
-            painter.setFont(QFont("Arial", 10, QFont.Weight.Bold))
-
-            # Determine the indicator character: ">" for collapsed, "<" for expanded.
-            indicator = " >" if not is_expanded else " <"
+        if indicator is not None:
+            painter.setPen(self.WHITE_TEXT_COLOR)
+            painter.setFont(self.indicator_font)
             # Define the rectangle for the indicator on the right side of the section.
             indicator_rect = rect.adjusted(rect.width() - 20, 0, -5, 0)
             # Draw the indicator text centered in its rectangle.
             painter.drawText(indicator_rect, Qt.AlignmentFlag.AlignCenter, indicator)
+        painter.restore() # Restore painter state.
+
+
+# --- GradeGridModel Class ---
+# Adapts the GradeDataModel to Qt's model/view framework for the grade grid.
+# Views only ask for the cells they are about to paint, so no per-cell widgets are created.
+class GradeGridModel(QAbstractTableModel):
+    """
+    Serves one row per student and one column per entry of the table's column structure.
+    """
+    # Calculated result shown by each calculated column, looked up by column name.
+    RESULT_KEYS = (
+        ('Midterm Grade', 'midterm_avg'),
+        ('Final Term Grade', 'finalterm_avg'),
+        ('Final Grade', 'final_grade'),
+    )
+
+    # --- Constructor ---
+    def __init__(self, model: GradeDataModel, parent=None):
+        super().__init__(parent)
+        # The grade data model that holds students and grades.
+        self.model = model
+        # Column structure built by the table: [{'name': ..., 'type': ..., 'component_key': ...}, ...].
+        self.columns = []
+        # Result key per column ('midterm_avg', ...), None for columns without a calculated value.
+        self.result_keys = []
+        # Formatted calculated grades per student: {student_id: {'midterm_avg': '85.00', ...}}.
+        self.calculated = {}
+        # Formatted "Needed to Pass" (text, tooltip) per student.
+        self.projections = {}
+        # Row of each student id, rebuilt whenever the roster list changes.
+        self.row_by_id = {}
+        self.row_source = None
+        # Shared text color for every cell.
+        self.text_color = QColor("#000000")
+
+    # --- Structure ---
+    # Replaces the column structure (and with it every row) in one model reset.
+    def set_columns(self, columns):
+        self.beginResetModel()
+        self.columns = columns
+        self.result_keys = []
+        for col in columns:
+            result_key = None
+            if col['type'] in ['calculated', 'expandable_main', 'expandable_component'] and not col.get('projection'):
+                # Component headers keep the "0.00" placeholder they always showed.
+                result_key = next((key for name, key in self.RESULT_KEYS if name in col['name']), '')
+            self.result_keys.append(result_key)
+        self.endResetModel()
+
+    # Re-reads the roster after students were added or removed.
+    def reset_rows(self):
+        self.beginResetModel()
+        self.row_source = None
+        self.endResetModel()
+
+    # Returns the student id shown in a row.
+    def student_id(self, row):
+        return self.model.students[row]['id']
+
+    # Returns the rows of the given students, without scanning the roster on every call.
+    def rows_of(self, student_ids):
+        students = self.model.students
+        if self.row_source is not students or len(self.row_by_id) != len(students):
+            self.row_by_id = {student['id']: row for row, student in enumerate(students)}
+            self.row_source = students
+        return sorted(self.row_by_id[sid] for sid in student_ids if sid in self.row_by_id)
+
+    # --- Change Notifications ---
+    # Tells the views that every grade input cell may have changed (visible cells are repainted).
+    def notify_grades_changed(self):
+        grade_columns = [i for i, col in enumerate(self.columns) if col['type'] == 'grade_input']
+        if grade_columns and self.rowCount():
+            self.dataChanged.emit(self.index(0, grade_columns[0]),
+                                  self.index(self.rowCount() - 1, grade_columns[-1]))
+
+    # Replaces all calculated values and repaints the calculated columns.
+    def set_calculated(self, calculated, projections):
+        self.calculated = calculated
+        self.projections = projections
+        if self.columns and self.rowCount():
+            self.dataChanged.emit(self.index(0, 2), self.index(self.rowCount() - 1, len(self.columns) - 1))
+
+    # Updates the calculated values of a few students and repaints only their rows.
+    def update_calculated(self, calculated, projections, rows):
+        self.calculated.update(calculated)
+        self.projections.update(projections)
+        for row in rows:
+            self.dataChanged.emit(self.index(row, 2), self.index(row, len(self.columns) - 1))
+
+    # --- QAbstractTableModel Interface ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.model.students)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            if 0 <= section < len(self.columns):
+                return self.columns[section]['name']
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        # Only grade input cells can be edited.
+        if self.columns[index.column()]['type'] == 'grade_input':
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+        col = self.columns[column]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            student = self.model.students[index.row()]
+            col_type = col['type']
+            if col_type == 'fixed':
+                # Column 0 shows the student id, column 1 the name.
+                return student['id'] if column == 0 else student['name']
+            if col_type == 'grade_input':
+                return self.model.get_grade(student['id'], col['component_key'])
+            if col.get('projection'):
+                return self.projections.get(student['id'], ("", ""))[0]
+            result_key = self.result_keys[column]
+            grades = self.calculated.get(student['id'])
+            if not result_key or grades is None:
+                return "0.00"
+            return grades[result_key]
+        if role == Qt.ItemDataRole.ToolTipRole and col.get('projection'):
+            # Required score per remaining component.
+            return self.projections.get(self.model.students[index.row()]['id'], ("", ""))[1] or None
+        if role == Qt.ItemDataRole.TextAlignmentRole and col['type'] != 'fixed':
+            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self.text_color
+        return None
+
+
+# --- GradeCellDelegate Class ---
+# Paints grade inputs and calculated grades as boxed cells and creates an editor only for the cell being edited.
+class GradeCellDelegate(QStyledItemDelegate):
+    # Cell box colors, matching the former QLineEdit/QLabel styling.
+    INPUT_BORDER_COLOR = QColor("#E0E0E0")
+    INPUT_BG_COLOR = QColor("white")
+    DISPLAY_BG_COLOR = QColor("#F8F9FA")
+    PLACEHOLDER_COLOR = QColor("#9E9E9E")
+    TEXT_COLOR = QColor("#000000")
+    PLACEHOLDER_TEXT = "e.g., 50/100"
+    # Gap between the cell edge and its box.
+    BOX_MARGIN = 3
+
+    def __init__(self, table, parent=None):
+        super().__init__(parent)
+        # The table that owns the pending-edit debounce logic.
+        self.table = table
+        # Fonts created once instead of per painted cell.
+        self.input_font = QFont()
+        self.input_font.setPointSize(9)
+        self.display_font = QFont(self.input_font)
+        self.display_font.setBold(True)
+        self.border_pen = QPen(self.INPUT_BORDER_COLOR, 1)
+
+    # --- Painting ---
+    def paint(self, painter, option, index):
+        col_type = self.table.column_info_map.get(index.column(), {}).get('type')
+        # Fixed columns (id, name) use the default item painting.
+        if col_type not in ['grade_input', 'calculated', 'expandable_main', 'expandable_component']:
+            super().paint(painter, option, index)
+            return
+        painter.save()
+        # Keep the selection/hover background from the style.
+        self.initStyleOption(option, index)
+        option.text = ""
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, option, painter, option.widget)
+
+        box = option.rect.adjusted(self.BOX_MARGIN, self.BOX_MARGIN, -self.BOX_MARGIN, -self.BOX_MARGIN)
+        text = index.data(Qt.ItemDataRole.DisplayRole) or ""
+        painter.setPen(self.border_pen)
+        if col_type == 'grade_input':
+            # A white input box; empty cells show the placeholder like the old QLineEdit.
+            painter.setBrush(self.INPUT_BG_COLOR)
+            painter.drawRoundedRect(box, 3, 3)
+            painter.setFont(self.input_font)
+            painter.setPen(self.TEXT_COLOR if text else self.PLACEHOLDER_COLOR)
+            painter.drawText(box, Qt.AlignmentFlag.AlignCenter, text or self.PLACEHOLDER_TEXT)
+        else:
+            # A grey box with bold text for calculated grades.
+            painter.setBrush(self.DISPLAY_BG_COLOR)
+            painter.drawRoundedRect(box, 3, 3)
+            painter.setFont(self.display_font)
+            painter.setPen(self.TEXT_COLOR)
+            painter.drawText(box, Qt.AlignmentFlag.AlignCenter, text)
+        painter.restore()
 
-            painter.restore() # Restore painter state.
+    # --- Editing ---
+    # Creates the QLineEdit used while a grade cell is being edited.
+    def createEditor(self, parent, option, index):
+        col_info = self.table.column_info_map.get(index.column(), {})
+        editor = self.table.create_grade_input()
+        editor.setParent(parent)
+        # Capture the student ID and component key for this cell.
+        sid = self.table.grid_model.student_id(index.row())
+        key = col_info['component_key']
+        # Keystrokes are queued and committed once typing pauses, as before.
+        editor.textChanged.connect(
+            lambda text, s_id=sid, c_key=key: self.table.on_grade_input_changed(s_id, c_key, text)
+        )
+        # Commit immediately when the user presses Enter or leaves the field.
+        editor.editingFinished.connect(self.table.commit_pending_edits)
+        return editor
+
+    # Loads the cell's grade into the editor without it counting as typing.
+    def setEditorData(self, editor, index):
+        text = index.data(Qt.ItemDataRole.EditRole) or ""
+        if editor.text() != text:
+            editor.blockSignals(True)
+            editor.setText(text)
+            editor.blockSignals(False)
+
+    # The typed text is already queued by textChanged; closing the editor just commits it.
+    def setModelData(self, editor, model, index):
+        self.table.commit_pending_edits()
+
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(option.rect.adjusted(self.BOX_MARGIN, self.BOX_MARGIN, -self.BOX_MARGIN, -self.BOX_MARGIN))
 
 
 # --- CollapsibleGradesTable Class ---
 # The main table widget that displays student grades and manages the UI logic.
-class CollapsibleGradesTable(QTreeWidget):
+# Rows are virtual: only the visible cells are painted and only the cell being edited has a widget.
+class CollapsibleGradesTable(QTableView):
+    # Milliseconds of typing inactivity before pending grade edits are committed to the model.
+    INPUT_DEBOUNCE_MS = 300
+    # Number of leading columns (No., Name) that stay frozen while the grades scroll horizontally.
+    FROZEN_COLUMN_COUNT = 2
+    # Fixed row height; uniform rows let the view position any row without measuring the others.
+    ROW_HEIGHT = 44
+
     # --- Constructor ---
     # Initializes the table, sets up the custom header, and connects signals.
     def __init__(self, model: GradeDataModel, controller: GradeController, parent=None):
@@ -482,30 +1250,60 @@ class CollapsibleGradesTable(QTreeWidget):
         self.controller = controller
         # Dictionary mapping logical column indices to their information dictionaries.
         self.column_info_map = {}
+        # Grade edits typed but not yet committed: {(student_id, component_key): grade_text}.
+        self._pending_edits = {}
+        # Logical indices of the columns belonging to each component ('quiz': [5, 6, ...]).
+        # Rebuilt with the structure so a filter switch only toggles these columns.
+        self.component_columns = {}
+        # Students whose grades changed since the last refresh (only their rows are recalculated).
+        self._stale_students = set()
+        # Whether the next refresh must recalculate every student (bulk loads, rubric switches).
+        self._full_refresh = True
+        # Qt item model serving the grid's cells on demand.
+        self.grid_model = GradeGridModel(model, self)
+
+        # Timer that commits pending edits once typing pauses (restarted on every keystroke).
+        self._commit_timer = QTimer(self)
+        self._commit_timer.setSingleShot(True)
+        self._commit_timer.setInterval(self.INPUT_DEBOUNCE_MS)
+        self._commit_timer.timeout.connect(self.commit_pending_edits)
+        # Zero-interval timer that runs at most one recalculation per event-loop pass.
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self.refresh_data_display)
 
         # Perform initial table setup.
         self.setup_table()
         # Connect controller signals to UI update methods.
-        self.controller.data_changed.connect(self.refresh_data_display)
+        self.controller.data_changed.connect(self.schedule_refresh)
+        self.controller.data_reloaded.connect(self.sync_grade_inputs)
+        self.controller.rubric_changed.connect(self.request_full_refresh)
+        self.model.grade_changed.connect(self.mark_student_stale)
         self.controller.columns_changed.connect(self.rebuild_table_structure)
+        self.model.column_filter_changed.connect(self.apply_column_filter)
 
-        # Load initial data into the model and build the initial table structure/UI.
-        self.model.load_sample_data()
+        # Build the initial table structure/UI from the data already loaded into the model.
         self.rebuild_table_structure()
 
     # --- Table Setup ---
-    # Configures the table's appearance, header, and initial styles.
+    # Configures the table's appearance, header, frozen columns and initial styles.
     def setup_table(self):
+        # Attach the grid model and the delegate that paints and edits the grade cells.
+        self.setModel(self.grid_model)
+        self.cell_delegate = GradeCellDelegate(self, self)
+        self.setItemDelegate(self.cell_delegate)
+
         # Create an instance of our custom header view.
         self.custom_header = ExpandableHeaderView(Qt.Orientation.Horizontal, self)
         # Set the custom header as the table's header.
-        self.setHeader(self.custom_header)
+        self.setHorizontalHeader(self.custom_header)
         # Connect the custom header's sectionClicked signal to the table's handler.
         self.custom_header.sectionClicked.connect(self.on_header_section_clicked)
 
         # Apply general styling to the table using CSS-like syntax.
-        self.setStyleSheet("""
-            QTreeWidget {
+        self.table_style = """
+            QTableView {
                 background-color: white;
                 alternate-background-color: #F8F9FA;
                 border: none;
@@ -513,29 +1311,40 @@ class CollapsibleGradesTable(QTreeWidget):
                 gridline-color: #E0E0E0;
                 color: #000000;
             }
-            QTreeWidget::item {
+            QTableView::item {
                 padding: 8px 4px;
                 border-bottom: 1px solid #E0E0E0;
-                min-height: 35px;
                 color: #000000;
             }
-            QTreeWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #E8F5E8;
                 color: #000000;
             }
-            QTreeWidget::item:hover {
+            QTableView::item:hover {
                 background-color: #F0F8F0;
                 color: #000000;
             }
-        """)
+        """
+        self.setStyleSheet(self.table_style)
 
         # Configure table properties.
-        self.setRootIsDecorated(False) # Hide root decoration (tree lines).
+        self.verticalHeader().hide() # Rows are identified by the No. column.
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.verticalHeader().setDefaultSectionSize(self.ROW_HEIGHT)
+        self.setShowGrid(False) # Rows are separated by the item border instead.
         self.setAlternatingRowColors(True) # Alternate row background colors.
         self.setSortingEnabled(False) # Disable sorting for simplicity.
+        self.setWordWrap(False)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectItems)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        # Editing starts as soon as a grade cell is clicked, focused or typed into.
+        self.setEditTriggers(QAbstractItemView.EditTrigger.AllEditTriggers)
+        # Scroll smoothly by pixel instead of jumping whole cells.
+        self.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
 
         # Apply styling specifically to the header.
-        self.custom_header.setStyleSheet("""
+        self.header_style = """
             QHeaderView::section {
                 background-color: #084924; /* Enforce default background */
                 color: white;
@@ -547,7 +1356,76 @@ class CollapsibleGradesTable(QTreeWidget):
                 min-height: 40px;
                 text-align: left;
             }
-        """)
+        """
+        self.custom_header.setStyleSheet(self.header_style)
+
+        # --- Frozen Columns ---
+        # A second view over the same model shows only the No. and Name columns on top of the grid.
+        self.frozen_view = QTableView(self)
+        self.frozen_view.setModel(self.grid_model)
+        # Share the selection so a selected cell is highlighted in both views.
+        self.frozen_view.setSelectionModel(self.selectionModel())
+        self.frozen_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.frozen_view.verticalHeader().hide()
+        self.frozen_view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.frozen_view.verticalHeader().setDefaultSectionSize(self.ROW_HEIGHT)
+        self.frozen_view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.frozen_view.horizontalHeader().setStyleSheet(self.header_style)
+        self.frozen_view.setStyleSheet(self.table_style + "QTableView { border-right: 1px solid #E0E0E0; }")
+        self.frozen_view.setShowGrid(False)
+        self.frozen_view.setAlternatingRowColors(True)
+        self.frozen_view.setWordWrap(False)
+        self.frozen_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.frozen_view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.frozen_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        # Keep the grid's viewport underneath the frozen view.
+        self.viewport().stackUnder(self.frozen_view)
+        # Scroll both views together vertically.
+        self.verticalScrollBar().valueChanged.connect(self.frozen_view.verticalScrollBar().setValue)
+        self.frozen_view.verticalScrollBar().valueChanged.connect(self.verticalScrollBar().setValue)
+        # Follow width changes of the frozen columns.
+        self.custom_header.sectionResized.connect(self.on_section_resized)
+        self.frozen_view.show()
+
+    # --- Frozen Column Geometry ---
+    # Total width of the frozen columns.
+    def frozen_width(self):
+        return sum(self.columnWidth(i) for i in range(min(self.FROZEN_COLUMN_COUNT, self.grid_model.columnCount())))
+
+    # Positions the frozen view over the left edge of the grid, header included.
+    def update_frozen_geometry(self):
+        self.frozen_view.setGeometry(
+            self.verticalHeader().width() + self.frameWidth(),
+            self.frameWidth(),
+            self.frozen_width(),
+            self.viewport().height() + self.horizontalHeader().height()
+        )
+        self.frozen_view.horizontalHeader().setFixedHeight(self.horizontalHeader().height())
+
+    # Mirrors width changes of the frozen columns into the frozen view.
+    def on_section_resized(self, logical_index, old_size, new_size):
+        if logical_index < self.FROZEN_COLUMN_COUNT:
+            self.frozen_view.setColumnWidth(logical_index, new_size)
+            self.update_frozen_geometry()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.update_frozen_geometry()
+
+    # Keeps keyboard navigation from moving the current cell underneath the frozen columns.
+    def moveCursor(self, cursor_action, modifiers):
+        current = super().moveCursor(cursor_action, modifiers)
+        if (cursor_action == QAbstractItemView.CursorAction.MoveLeft
+                and current.column() >= self.FROZEN_COLUMN_COUNT
+                and self.visualRect(current).left() < self.frozen_width()):
+            offset = self.visualRect(current).left() - self.frozen_width()
+            self.horizontalScrollBar().setValue(self.horizontalScrollBar().value() + offset)
+        return current
+
+    # Scrolls horizontally only for cells outside the frozen columns.
+    def scrollTo(self, index, hint=QAbstractItemView.ScrollHint.EnsureVisible):
+        if index.column() >= self.FROZEN_COLUMN_COUNT:
+            super().scrollTo(index, hint)
 
     # --- Header Click Handler ---
     # Responds to clicks on the custom header sections.
@@ -572,7 +1450,10 @@ class CollapsibleGradesTable(QTreeWidget):
     # Clears the table and rebuilds its columns and data based on the model's current state.
     def rebuild_table_structure(self):
         """Rebuilds the table columns based on model state."""
-        self.clear() # Clear existing items and data.
+        self.commit_pending_edits() # Save edits from the input fields about to be destroyed.
+        # Close any open cell editor; its cell may not exist in the new structure.
+        if self.state() == QAbstractItemView.State.EditingState:
+            self.closeEditor(self.indexWidget(self.currentIndex()), QStyledItemDelegate.EndEditHint.NoHint)
         self.build_column_structure() # Build the column structure.
         self.populate_table_with_data() # Populate the table with student data.
 
@@ -608,14 +1489,14 @@ class CollapsibleGradesTable(QTreeWidget):
             # Check if the Performance Task component is expanded.
             if self.model.get_column_state('performance_task_midterm_expanded'):
                 # Add individual Performance Task columns (PT1 (M), PT2 (M), etc.).
-                for pt in self.model.components['performance_tasks']:
+                for entry in self.model.catalog.items('midterm', 'performance_tasks'):
                     columns.append({
-                        'name': f'{pt} (M)', # Display name.
+                        'name': entry.label, # Display name.
                         'type': 'grade_input', # Type of column.
                         'width': 80, # Width in pixels.
                         'term': 'midterm', # Term it belongs to.
                         'component': 'performance_task', # Component group.
-                        'component_key': f"{pt.lower().replace(' ', '')}_midterm" # Unique key.
+                        'component_key': entry.key # Unique key.
                     })
 
             # Add "Quiz" component header.
@@ -629,14 +1510,14 @@ class CollapsibleGradesTable(QTreeWidget):
             # Check if the Quiz component is expanded.
             if self.model.get_column_state('quiz_midterm_expanded'):
                 # Add individual Quiz columns (Quiz 1 (M), Quiz 2 (M), etc.).
-                for quiz in self.model.components['quizzes']:
+                for entry in self.model.catalog.items('midterm', 'quizzes'):
                     columns.append({
-                        'name': f'{quiz} (M)',
+                        'name': entry.label,
                         'type': 'grade_input',
                         'width': 80,
                         'term': 'midterm',
                         'component': 'quiz',
-                        'component_key': f"{quiz.lower().replace(' ', '')}_midterm"
+                        'component_key': entry.key
                     })
 
             # Add "Exam" component header.
@@ -650,14 +1531,14 @@ class CollapsibleGradesTable(QTreeWidget):
             # Check if the Exam component is expanded.
             if self.model.get_column_state('exam_midterm_expanded'):
                 # Add individual Exam columns (Prelim Exam (M), Final Exam (M), etc.).
-                for exam in self.model.components['exams']:
+                for entry in self.model.catalog.items('midterm', 'exams'):
                     columns.append({
-                        'name': f'{exam} (M)',
+                        'name': entry.label,
                         'type': 'grade_input',
                         'width': 100,
                         'term': 'midterm',
                         'component': 'exam',
-                        'component_key': f"{exam.lower().replace(' ', '')}_midterm"
+                        'component_key': entry.key
                     })
 
         # --- Final Term Section ---
@@ -682,14 +1563,14 @@ class CollapsibleGradesTable(QTreeWidget):
             # Check if the Performance Task component is expanded.
             if self.model.get_column_state('performance_task_finalterm_expanded'):
                 # Add individual Performance Task columns (PT1 (F), PT2 (F), etc.).
-                for pt in self.model.components['performance_tasks']:
+                for entry in self.model.catalog.items('finalterm', 'performance_tasks'):
                     columns.append({
-                        'name': f'{pt} (F)',
+                        'name': entry.label,
                         'type': 'grade_input',
                         'width': 80,
                         'term': 'finalterm',
                         'component': 'performance_task',
-                        'component_key': f"{pt.lower().replace(' ', '')}_finalterm"
+                        'component_key': entry.key
                     })
 
             # Add "Quiz" component header for final term.
@@ -703,14 +1584,14 @@ class CollapsibleGradesTable(QTreeWidget):
             # Check if the Quiz component is expanded.
             if self.model.get_column_state('quiz_finalterm_expanded'):
                 # Add individual Quiz columns (Quiz 1 (F), Quiz 2 (F), etc.).
-                for quiz in self.model.components['quizzes']:
+                for entry in self.model.catalog.items('finalterm', 'quizzes'):
                     columns.append({
-                        'name': f'{quiz} (F)',
+                        'name': entry.label,
                         'type': 'grade_input',
                         'width': 80,
                         'term': 'finalterm',
                         'component': 'quiz',
-                        'component_key': f"{quiz.lower().replace(' ', '')}_finalterm"
+                        'component_key': entry.key
                     })
 
             # Add "Exam" component header for final term.
@@ -724,35 +1605,46 @@ class CollapsibleGradesTable(QTreeWidget):
             # Check if the Exam component is expanded.
             if self.model.get_column_state('exam_finalterm_expanded'):
                 # Add individual Exam columns (Prelim Exam (F), Final Exam (F), etc.).
-                for exam in self.model.components['exams']:
+                for entry in self.model.catalog.items('finalterm', 'exams'):
                     columns.append({
-                        'name': f'{exam} (F)',
+                        'name': entry.label,
                         'type': 'grade_input',
                         'width': 100,
                         'term': 'finalterm',
                         'component': 'exam',
-                        'component_key': f"{exam.lower().replace(' ', '')}_finalterm"
+                        'component_key': entry.key
                     })
 
         # Add the "Final Grade" column for the overall calculated grade.
         columns.append({'name': 'Final Grade', 'type': 'calculated', 'width': 100})
+        # Add the optional "Needed to Pass" projection column.
+        if self.model.get_column_state('needed_to_pass_visible'):
+            columns.append({'name': 'Needed to Pass', 'type': 'calculated', 'width': 110, 'projection': True})
 
-        # --- Apply Structure to QTreeWidget ---
-        # Set the number of columns in the table.
-        self.setColumnCount(len(columns))
+        # --- Apply Structure to the Grid ---
         # Create a map from logical index to column information.
         self.column_info_map = {i: col for i, col in enumerate(columns)}
-        # Extract column labels.
-        labels = [col['name'] for col in columns]
-        # Set the width for each column.
+        # Hand the columns to the grid model; header labels and cells are read from it.
+        self.grid_model.set_columns(columns)
+        # Set the width for each column; the frozen view shows only the leading fixed columns.
         for i, col in enumerate(columns):
             self.setColumnWidth(i, col['width'])
-        # Set the header labels for all columns.
-        self.setHeaderLabels(labels)
+            self.frozen_view.setColumnWidth(i, col['width'])
+            self.frozen_view.setColumnHidden(i, i >= self.FROZEN_COLUMN_COUNT)
+        self.update_frozen_geometry()
+        # Group component headers and grade inputs by component, then apply the active filter.
+        # Hidden flags belong to logical indices, so stale ones from the old structure are cleared first.
+        self.component_columns = {}
+        for i, col in enumerate(columns):
+            if self.isColumnHidden(i):
+                self.setColumnHidden(i, False)
+            if col.get('component'):
+                self.component_columns.setdefault(col['component'], []).append(i)
+        self.apply_column_filter()
 
         # --- Update Custom Header with Column Info ---
         # Reset the expandable columns dictionary in the custom header.
-        self.custom_header.expandable_columns = {}
+        self.custom_header.clear_expandable_columns()
 
         # Iterate through the defined columns to register expandable ones with the header.
         for i, col in enumerate(columns):
@@ -782,103 +1674,112 @@ class CollapsibleGradesTable(QTreeWidget):
                 # Register the column with the custom header view.
                 self.custom_header.set_expandable_column(visual_index, col, is_expanded)
 
+    # --- Column Filtering ---
+    # Shows only the filtered component's columns by toggling header visibility.
+    # No rows or cell widgets are created or destroyed, so the cost does not depend on the roster size.
+    def apply_column_filter(self):
+        """Hides the columns of every component except the one selected by the model's filter."""
+        component_filter = self.model.column_filter
+        for component, indices in self.component_columns.items():
+            hidden = component_filter is not None and component != component_filter
+            for i in indices:
+                if self.isColumnHidden(i) != hidden:
+                    self.setColumnHidden(i, hidden)
+
     # --- Data Population ---
-    # Fills the table with student data and creates input/display widgets for each cell.
+    # Points the grid at the model's current roster; rows are painted on demand, so nothing is created per row.
     def populate_table_with_data(self):
         """Populates the table with student data from the model."""
-        # Iterate through the list of students in the model.
-        for i, student in enumerate(self.model.students):
-            # Create a new tree widget item (representing a row) for the student.
-            item = QTreeWidgetItem(self)
-            # Set the student's ID and name in the first two columns.
-            item.setText(0, student['id'])
-            item.setText(1, student['name'])
-            # Set the text color for the ID and name columns.
-            item.setForeground(0, QColor("#000000"))
-            item.setForeground(1, QColor("#000000"))
-
-            # Iterate through the remaining columns (starting from index 2).
-            for col_index in range(2, self.columnCount()):
-                # Get the information for the current column.
-                col_info = self.column_info_map.get(col_index, {})
-                # Get the column type.
-                col_type = col_info.get('type', '')
-                # Get the unique component key for grade input columns.
-                component_key = col_info.get('component_key', '')
-
-                # --- Grade Input Columns ---
-                # If the column is for grade input...
-                if col_type == 'grade_input':
-                    # Create a QLineEdit widget for grade entry.
-                    input_field = self.create_grade_input()
-                    # Get the existing grade value from the model for this student and component.
-                    grade_value = self.model.get_grade(student['id'], component_key)
-                    # Set the text of the input field to the existing grade value.
-                    input_field.setText(grade_value)
-                    # --- Signal Connection ---
-                    # Capture the student ID and component key in default arguments
-                    # to avoid closure issues in the lambda function.
-                    sid, key = student['id'], component_key
-                    # Connect the textChanged signal of the input field to the handler method.
-                    # The lambda captures the specific sid and key for this iteration.
-                    input_field.textChanged.connect(
-                        lambda text, s_id=sid, c_key=key: self.on_grade_input_changed(s_id, c_key, text)
-                    )
-                    # Set the input field as the widget for this specific cell.
-                    self.setItemWidget(item, col_index, input_field)
-
-                # --- Calculated/Expandable Header Columns ---
-                # If the column is for calculated grades or expandable headers...
-                elif col_type in ['calculated', 'expandable_main', 'expandable_component']:
-                    # Create a QLabel widget for displaying calculated grades or header text.
-                    label = self.create_grade_display()
-                    # Set the label as the widget for this specific cell.
-                    self.setItemWidget(item, col_index, label)
-
+        # Re-read the roster (the grid model serves ids, names and grades from the model).
+        self.grid_model.reset_rows()
         # Refresh the display to show calculated grades for all students.
+        self.request_full_refresh()
         self.refresh_data_display()
 
     # --- Grade Input Handler ---
     # Handles changes made in the grade input fields.
     def on_grade_input_changed(self, student_id, component_key, text):
         """Handle grade input changes."""
-        # Delegate the task of setting the grade to the model.
-        # The model will update its internal state and emit a signal if the data changes.
-        self.model.set_grade(student_id, component_key, text)
+        # Record the latest text for this cell; earlier keystrokes are simply overwritten.
+        self._pending_edits[(student_id, component_key)] = text
+        # Restart the debounce timer so the edit is committed once typing pauses.
+        self._commit_timer.start()
+
+    # Pushes all pending grade edits to the model.
+    def commit_pending_edits(self):
+        """Commits debounced grade edits to the model."""
+        self._commit_timer.stop()
+        if not self._pending_edits:
+            return
+        # Swap out the pending edits before committing so re-entrant edits are kept.
+        edits = self._pending_edits
+        self._pending_edits = {}
+        for (student_id, component_key), text in edits.items():
+            # The model updates its internal state and emits a signal if the data changes.
+            self.model.set_grade(student_id, component_key, text)
+
+    # --- Input Synchronisation ---
+    # Re-reads the grade cells from the model after a bulk change (e.g., an import).
+    def sync_grade_inputs(self):
+        """Updates the grade cells to match the model without re-creating anything per row."""
+        if self.grid_model.rowCount() != len(self.model.students):
+            # The roster itself changed (e.g., a class was loaded).
+            self.grid_model.reset_rows()
+        else:
+            # Visible cells and any open editor re-read their grade.
+            self.grid_model.notify_grades_changed()
+        # Every calculated grade may have changed.
+        self.request_full_refresh()
+
+    # Remembers a student whose grade changed so the next refresh recalculates only their row.
+    def mark_student_stale(self, student_id, component_key="", old_text="", new_text=""):
+        self._stale_students.add(student_id)
+
+    # Makes the next refresh recalculate every student.
+    def request_full_refresh(self, *args):
+        self._full_refresh = True
+
+    # --- Refresh Scheduling ---
+    # Coalesces data change notifications into a single recalculation per event-loop pass.
+    def schedule_refresh(self):
+        # A change that did not come from single grade edits affects everyone.
+        if not self._stale_students:
+            self._full_refresh = True
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
 
     # --- Data Display Refresh ---
-    # Updates the calculated grade displays for all students.
-    def refresh_data_display(self):
-        """Refreshes the calculated grade displays for all students."""
-        # Iterate through all top-level items (student rows) in the table.
-        for i in range(self.topLevelItemCount()):
-            # Get the current item (student row).
-            item = self.topLevelItem(i)
-            # Get the student ID from the first column of the row.
-            student_id = item.text(0)
-            # Ask the controller to calculate grades for this specific student.
-            calculated_grades = self.controller.calculate_grades_for_student(student_id)
-
-            # Iterate through all columns in the row.
-            for col_index in range(self.columnCount()):
-                # Get the column information.
-                col_info = self.column_info_map.get(col_index, {})
-                # Get the column name.
-                col_name = col_info.get('name', '')
-                # Get the widget currently set for this cell.
-                widget = self.itemWidget(item, col_index)
-                # If the widget is a QLabel (used for displaying calculated grades)...
-                if isinstance(widget, QLabel):
-                    # Update the label's text based on the column name.
-                    if 'Midterm Grade' in col_name:
-                        widget.setText(calculated_grades['midterm_avg'])
-                    elif 'Final Term Grade' in col_name:
-                        widget.setText(calculated_grades['finalterm_avg'])
-                    elif 'Final Grade' in col_name:
-                        widget.setText(calculated_grades['final_grade'])
+    # Updates the calculated grades shown in the grid.
+    def refresh_data_display(self, full=False):
+        """Refreshes the calculated grade displays (all students, or only those with changed grades)."""
+        # A direct refresh satisfies any refresh that was still scheduled.
+        self._refresh_timer.stop()
+        stale, self._stale_students = self._stale_students, set()
+        full = full or self._full_refresh or not stale
+        self._full_refresh = False
+        # The projection column is solved only when it is shown.
+        show_projection = self.model.get_column_state('needed_to_pass_visible')
+        format_projection = self.controller.format_projection
+
+        if full:
+            # Ask the controller to calculate grades for all students in one pass.
+            calculated = self.controller.calculate_all_grades()
+            projections = {}
+            if show_projection:
+                projections = {sid: format_projection(value)
+                               for sid, value in self.controller.calculate_needed_to_pass().items()}
+            self.grid_model.set_calculated(calculated, projections)
+            return
+
+        # Only recalculate (and repaint) the rows of students whose grades changed.
+        calculated = {sid: self.controller.calculate_grades_for_student(sid) for sid in stale}
+        projections = {}
+        if show_projection:
+            projections = {sid: format_projection(self.controller.project_required_score(sid)) for sid in stale}
+        self.grid_model.update_calculated(calculated, projections, self.grid_model.rows_of(stale))
 
     # --- Widget Creation Helpers ---
-    # Helper methods to create standardized input and display widgets.
+    # Helper method to create the standardized grade input editor.
     def create_grade_input(self, value=""):
         # Create a QLineEdit widget.
         input_field = QLineEdit()
@@ -910,24 +1811,137 @@ class CollapsibleGradesTable(QTreeWidget):
         """)
         return input_field
 
-    def create_grade_display(self, value="0.00"):
-        # Create a QLabel widget.
-        label = QLabel(value)
-        # Align the text in the center.
-        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        # Apply styling using CSS-like syntax.
-        label.setStyleSheet("""
+
+# --- HistogramWidget Class ---
+# A small bar chart of how many students fall into each grade range.
+class HistogramWidget(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Student count per bin (0-10, 10-20, ..., 90-100).
+        self.bins = []
+        # Paint resources are created once and reused.
+        self.bar_color = QColor("#084924")
+        self.axis_pen = QPen(QColor("#E0E0E0"), 1)
+        self.setMinimumHeight(120)
+
+    # Replaces the histogram data and schedules a repaint.
+    def set_bins(self, bins):
+        if bins != self.bins:
+            self.bins = list(bins)
+            self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        rect = self.rect().adjusted(2, 2, -2, -2)
+        # Draw the baseline.
+        painter.setPen(self.axis_pen)
+        painter.drawLine(rect.bottomLeft(), rect.bottomRight())
+        if not self.bins or not max(self.bins):
+            return
+        # Scale bars to the tallest bin and draw them side by side.
+        tallest = max(self.bins)
+        bar_width = rect.width() / len(self.bins)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self.bar_color)
+        for i, count in enumerate(self.bins):
+            height = int(rect.height() * count / tallest)
+            painter.drawRect(int(rect.left() + i * bar_width) + 1, rect.bottom() - height,
+                             max(int(bar_width) - 2, 1), height)
+
+
+# --- GradeStatisticsPanel Class ---
+# Shows class-wide statistics for a selected component or term.
+# The numbers come from running aggregates kept up to date by the controller.
+class GradeStatisticsPanel(QFrame):
+    def __init__(self, controller: GradeController, parent=None):
+        super().__init__(parent)
+        self.controller = controller
+        # Statistics are only maintained once the panel has been shown.
+        self.active = False
+        self.setFixedWidth(260)
+        self.setStyleSheet("""
+            QFrame {
+                background-color: #F8F9FA;
+                border-radius: 5px;
+            }
             QLabel {
                 color: #000000;
-                font-weight: bold;
                 font-size: 11px;
-                padding: 6px;
-                background-color: #F8F9FA;
-                border-radius: 3px;
-                border: 1px solid #E0E0E0;
             }
         """)
-        return label
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(12, 12, 12, 12)
+
+        # Title of the panel.
+        title = QLabel("Class Statistics")
+        title.setStyleSheet("QLabel { color: #084924; font-weight: bold; font-size: 13px; }")
+        layout.addWidget(title)
+
+        # Selector for the component or term being summarised.
+        self.column_combo = QComboBox()
+        self.column_combo.setStyleSheet("QComboBox { background-color: white; color: #084924; padding: 4px; }")
+        self.column_combo.currentIndexChanged.connect(self.refresh)
+        layout.addWidget(self.column_combo)
+
+        # Grid of statistic names and values.
+        grid = QGridLayout()
+        self.value_labels = {}
+        fields = [('mean', 'Mean'), ('median', 'Median'), ('stdev', 'Std. Deviation'),
+                  ('min', 'Min'), ('max', 'Max'), ('pass_rate', 'Pass Rate'), ('count', 'Graded')]
+        for row, (field, text) in enumerate(fields):
+            grid.addWidget(QLabel(text), row, 0)
+            value_label = QLabel("-")
+            value_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            grid.addWidget(value_label, row, 1)
+            self.value_labels[field] = value_label
+        layout.addLayout(grid)
+
+        # Distribution of grades.
+        self.histogram = HistogramWidget()
+        layout.addWidget(self.histogram)
+        layout.addStretch()
+
+        # Repaint the numbers whenever the controller reports new statistics.
+        self.controller.statistics_changed.connect(self.refresh)
+
+    # Starts maintaining statistics and fills the column selector.
+    def activate(self):
+        if self.active:
+            return
+        self.active = True
+        self.column_combo.blockSignals(True)
+        self.column_combo.clear()
+        for key, label in self.controller.get_statistics_columns():
+            self.column_combo.addItem(label, key)
+        self.column_combo.blockSignals(False)
+        self.controller.get_statistics()
+        self.refresh()
+
+    # Shows the summary of the selected column.
+    def refresh(self):
+        if not self.active or not self.isVisible():
+            return
+        key = self.column_combo.currentData()
+        summary = self.controller.get_statistics().summary(key) if key else None
+        if not summary:
+            return
+        for field, label in self.value_labels.items():
+            value = summary[field]
+            if value is None:
+                label.setText("-")
+            elif field == 'count':
+                label.setText(str(value))
+            elif field == 'pass_rate':
+                label.setText(f"{value:.1f}%")
+            else:
+                label.setText(f"{value:.2f}")
+        self.histogram.set_bins(summary['histogram'])
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.activate()
+        self.refresh()
 
 
 # --- MainWindow Class ---
@@ -935,7 +1949,7 @@ class CollapsibleGradesTable(QTreeWidget):
 class MainWindow(QMainWindow):
     # --- Constructor ---
     # Initializes the main window, its layout, and child widgets.
-    def __init__(self):
+    def __init__(self, class_id=None):
         super().__init__()
 
         # Set window properties.
@@ -947,6 +1961,11 @@ class MainWindow(QMainWindow):
         # Create instances of the data model and controller.
         self.grade_model = GradeDataModel()
         self.grade_controller = GradeController(self.grade_model)
+        # Load the class gradebook if a class is given; otherwise show unsaved sample data.
+        if class_id is not None:
+            self.grade_controller.load_class(class_id)
+        else:
+            self.grade_model.load_sample_data()
 
         # --- Main Container Setup ---
         # Create a central widget to hold the main layout.
@@ -972,13 +1991,10 @@ class MainWindow(QMainWindow):
         # --- Rubrics Dropdown ---
         # Create a combo box for selecting rubrics.
         self.rubrics_combo = QComboBox()
-        # Add items to the combo box.
-        self.rubrics_combo.addItems([
-            "Overall Lecture",
-            "Performance Task",
-            "Quiz",
-            "Exam"
-        ])
+        # Add items to the combo box ("Overall Lecture", "Performance Task", "Quiz", "Exam").
+        self.rubrics_combo.addItems(list(COMPONENT_FILTERS))
+        # Selecting an entry filters the table columns without rebuilding it.
+        self.rubrics_combo.currentTextChanged.connect(self.grade_controller.set_rubric_filter)
         # Set a fixed width for the combo box.
         self.rubrics_combo.setFixedWidth(150)
         # Apply styling to the combo box.
@@ -1018,26 +2034,49 @@ class MainWindow(QMainWindow):
             }
         """)
 
-        # --- Grading System Label ---
-        # Create a label for the grading system.
-        grading_label = QLabel("Grading System")
-        # Apply styling to the grading system label.
-        grading_label.setStyleSheet("""
-            QLabel {
+        # --- Grading System Button ---
+        # Create a button whose menu selects the rubric used to calculate grades.
+        self.grading_button = QToolButton()
+        self.grading_button.setText("Grading System")
+        self.grading_button.setPopupMode(QToolButton.ToolButtonPopupMode.InstantPopup)
+        # Apply styling to the grading system button.
+        self.grading_button.setStyleSheet("""
+            QToolButton {
                 background-color: #FDC601;
                 color: white;
+                border: none;
                 border-radius: 3px;
                 padding: 8px 12px;
                 font-weight: bold;
                 font-size: 12px;
             }
+            QToolButton::menu-indicator {
+                image: none;
+                width: 0px;
+            }
         """)
+        # Build the rubric menu with one checkable action per available rubric.
+        rubric_menu = QMenu(self.grading_button)
+        self.rubric_actions = {}
+        for rubric_name in self.grade_controller.get_rubric_names():
+            action = QAction(rubric_name, rubric_menu)
+            action.setCheckable(True)
+            action.triggered.connect(lambda checked, name=rubric_name: self.grade_controller.set_rubric(name))
+            rubric_menu.addAction(action)
+            self.rubric_actions[rubric_name] = action
+        self.grading_button.setMenu(rubric_menu)
+        # Keep the menu check marks and tooltip in sync with the active rubric.
+        self.grade_controller.rubric_changed.connect(self.on_rubric_changed)
+        if self.grade_controller.rubric is not None:
+            self.on_rubric_changed(self.grade_controller.rubric.name)
 
         # --- Download Button ---
         # Create a download button.
-        download_button = QPushButton("📥 Download")
+        self.download_button = QPushButton("📥 Download")
+        # Export the grade sheet when the button is clicked.
+        self.download_button.clicked.connect(self.on_download_clicked)
         # Apply styling to the download button.
-        download_button.setStyleSheet("""
+        self.download_button.setStyleSheet("""
             QPushButton {
                 background-color: #084924;
                 color: white;
@@ -1050,7 +2089,36 @@ class MainWindow(QMainWindow):
             QPushButton:hover {
                 background-color: #0A5A2A;
             }
+            QPushButton:disabled {
+                background-color: #6B8F7A;
+            }
         """)
+        # --- Import Button ---
+        # Create a button for importing grades from a CSV file.
+        self.import_button = QPushButton("📤 Import")
+        self.import_button.clicked.connect(self.on_import_clicked)
+        # Reuse the download button styling.
+        self.import_button.setStyleSheet(self.download_button.styleSheet())
+        # --- Statistics Button ---
+        # Create a checkable button that shows or hides the class statistics panel.
+        self.statistics_button = QPushButton("📊 Statistics")
+        self.statistics_button.setCheckable(True)
+        self.statistics_button.setStyleSheet(self.download_button.styleSheet())
+        # --- Needed to Pass Button ---
+        # Create a checkable button that shows or hides the "Needed to Pass" projection column.
+        self.projection_button = QPushButton("🎯 Needed to Pass")
+        self.projection_button.setCheckable(True)
+        self.projection_button.setStyleSheet(self.download_button.styleSheet())
+        self.projection_button.toggled.connect(
+            lambda checked: self.grade_model.set_column_state('needed_to_pass_visible', checked)
+        )
+        # Background import thread and worker (None while no import is running).
+        self.import_thread = None
+        self.import_worker = None
+
+        # Background export thread and worker (None while no export is running).
+        self.export_thread = None
+        self.export_worker = None
 
         # --- Add Header Elements to Layout ---
         # Add the rubrics combo box to the header layout.
@@ -1059,20 +2127,32 @@ class MainWindow(QMainWindow):
         header_layout.addItem(spacer)
         # Add the info label to the header layout.
         header_layout.addWidget(info_label)
-        # Add the grading system label to the header layout.
-        header_layout.addWidget(grading_label)
-        # Add the download button to the header layout.
-        header_layout.addWidget(download_button)
+        # Add the grading system button to the header layout.
+        header_layout.addWidget(self.grading_button)
+        # Add the projection, statistics, import and download buttons to the header layout.
+        header_layout.addWidget(self.projection_button)
+        header_layout.addWidget(self.statistics_button)
+        header_layout.addWidget(self.import_button)
+        header_layout.addWidget(self.download_button)
 
         # --- Create Grades Table ---
         # Create an instance of the main table widget, passing the model and controller.
         self.grades_table = CollapsibleGradesTable(self.grade_model, self.grade_controller)
 
+        # --- Create Statistics Panel ---
+        # The panel is hidden until the statistics button is checked.
+        self.statistics_panel = GradeStatisticsPanel(self.grade_controller)
+        self.statistics_panel.setVisible(False)
+        self.statistics_button.toggled.connect(self.statistics_panel.setVisible)
+
         # --- Add Elements to Main Layout ---
         # Add the header layout to the main vertical layout.
         main_layout.addLayout(header_layout)
-        # Add the grades table to the main vertical layout.
-        main_layout.addWidget(self.grades_table)
+        # Place the grades table and the statistics panel side by side.
+        content_layout = QHBoxLayout()
+        content_layout.addWidget(self.grades_table)
+        content_layout.addWidget(self.statistics_panel)
+        main_layout.addLayout(content_layout)
 
         # --- Finalize Window Setup ---
         # Set the main layout on the container widget.
@@ -1080,6 +2160,140 @@ class MainWindow(QMainWindow):
         # Set the container widget as the central widget of the main window.
         self.setCentralWidget(container)
 
+    # --- Rubric Change Handler ---
+    # Reflects the active rubric in the grading system menu.
+    def on_rubric_changed(self, rubric_name):
+        for name, action in self.rubric_actions.items():
+            action.setChecked(name == rubric_name)
+        self.grading_button.setToolTip(f"Grading System: {rubric_name}")
+
+    # --- Import Handlers ---
+    # Asks for a CSV file and parses it on a background thread.
+    def on_import_clicked(self):
+        if self.import_thread is not None:
+            return
+        path, _ = QFileDialog.getOpenFileName(self, "Import Grades", "", "CSV Files (*.csv)")
+        if not path:
+            return
+        # Commit typed edits first so the import is applied on top of them.
+        self.grades_table.commit_pending_edits()
+
+        self.import_thread = QThread(self)
+        self.import_worker = GradeImportWorker(
+            path,
+            [student['id'] for student in self.grade_model.students],
+            self.grade_controller.get_import_columns()
+        )
+        self.import_worker.moveToThread(self.import_thread)
+        self.import_thread.started.connect(self.import_worker.run)
+        self.import_worker.progress.connect(self.on_import_progress)
+        self.import_worker.finished.connect(self.on_import_finished)
+        self.import_worker.failed.connect(self.on_import_failed)
+        self.import_button.setEnabled(False)
+        self.import_button.setText("📤 Importing...")
+        self.import_thread.start()
+
+    def on_import_progress(self, rows_read):
+        self.import_button.setText(f"📤 {rows_read} rows")
+
+    # Applies the valid grades in one batch and reports row-level errors.
+    def on_import_finished(self, result):
+        self.cleanup_import()
+        self.grade_model.set_grades(result.grades)
+        summary = (f"Imported {result.cells_accepted} grades for {len(result.grades)} students "
+                   f"from {result.rows_read} rows.")
+        if result.errors:
+            message = QMessageBox(self)
+            message.setIcon(QMessageBox.Icon.Warning)
+            message.setWindowTitle("Import Grades")
+            message.setText(f"{summary}\n{len(result.errors)} problems were skipped.")
+            message.setDetailedText("\n".join(f"Row {row}: {error}" for row, error in result.errors))
+            message.exec()
+        else:
+            QMessageBox.information(self, "Import Grades", summary)
+
+    def on_import_failed(self, message):
+        self.cleanup_import()
+        QMessageBox.warning(self, "Import Grades", message)
+
+    # Stops the import thread and restores the import button.
+    def cleanup_import(self):
+        if self.import_thread is not None:
+            self.import_thread.quit()
+            self.import_thread.wait()
+            self.import_thread.deleteLater()
+            self.import_worker.deleteLater()
+        self.import_thread = None
+        self.import_worker = None
+        self.import_button.setEnabled(True)
+        self.import_button.setText("📤 Import")
+
+    # --- Export Handlers ---
+    # Asks for a destination file and starts the export on a background thread.
+    def on_download_clicked(self):
+        if self.export_thread is not None:
+            return
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Download Grades", "grades.csv",
+            "CSV Files (*.csv);;Excel Workbook (*.xlsx)"
+        )
+        if not path:
+            return
+        # Make sure edits still waiting on the debounce timer are included.
+        self.grades_table.commit_pending_edits()
+
+        self.export_thread = QThread(self)
+        header, rows, total = self.grade_controller.snapshot_export()
+        self.export_worker = GradeExportWorker(header, rows, total, path)
+        self.export_worker.moveToThread(self.export_thread)
+        self.export_thread.started.connect(self.export_worker.run)
+        self.export_worker.progress.connect(self.on_export_progress)
+        self.export_worker.finished.connect(self.on_export_finished)
+        self.export_worker.failed.connect(self.on_export_failed)
+        self.download_button.setEnabled(False)
+        self.download_button.setText("📥 Exporting...")
+        self.export_thread.start()
+
+    # Shows export progress on the download button.
+    def on_export_progress(self, written, total):
+        percent = int(written * 100 / total) if total else 100
+        self.download_button.setText(f"📥 Exporting {percent}%")
+
+    def on_export_finished(self, path, written):
+        self.cleanup_export()
+        QMessageBox.information(self, "Download Grades", f"Exported {written} students to {path}.")
+
+    def on_export_failed(self, message):
+        self.cleanup_export()
+        QMessageBox.warning(self, "Download Grades", message)
+
+    # Stops the export thread and restores the download button.
+    def cleanup_export(self):
+        if self.export_thread is not None:
+            self.export_thread.quit()
+            self.export_thread.wait()
+            self.export_thread.deleteLater()
+            self.export_worker.deleteLater()
+        self.export_thread = None
+        self.export_worker = None
+        self.download_button.setEnabled(True)
+        self.download_button.setText("📥 Download")
+
+    # Cancels a running export, waits for a running import or rollup and saves pending edits before the window closes.
+    def closeEvent(self, event):
+        if self.import_thread is not None:
+            self.import_thread.quit()
+            self.import_thread.wait()
+        if self.export_worker is not None:
+            self.export_worker.cancel()
+            self.export_thread.quit()
+            self.export_thread.wait()
+        # Save edits still waiting on the debounce or autosave timers.
+        self.grades_table.commit_pending_edits()
+        self.grade_controller.shutdown_write_back()
+        self.grade_controller.shutdown_aggregation()
+        super().closeEvent(event)
+
 
 # --- Application Entry Point ---
 # The standard Python idiom for running the application.
@@ -1087,7 +2301,8 @@ if __name__ == "__main__":
     # Create the QApplication instance (required for any Qt application).
     app = QApplication(sys.argv)
     # Create an instance of the main window.
-    window = MainWindow()
+    # An optional class id argument loads and saves that class's gradebook.
+    window = MainWindow(class_id=int(sys.argv[1]) if len(sys.argv) > 1 else None)
     # Show the main window.
     window.show()
     # Execute the application's event loop.
@@ -1,10 +1,13 @@
 # classroom_classworks.py
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QComboBox, QDialog, QLineEdit, QTextEdit, QPushButton, QMenu, QToolButton
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
-from PyQt6.QtGui import QAction, QPixmap, QIcon
+from PyQt6.QtCore import Qt, pyqtSignal, QSize, QTimer
+from PyQt6.QtGui import QAction, QIcon
 from frontend.widgets.classroom_classworks_content_ui import Ui_ClassroomClassworksContent
 from frontend.widgets.topic_widget import TopicWidget
-import os
+from frontend.widgets.topic_frame import TopicFrame
+from frontend.widgets.widget_pool import WidgetPool
+from frontend.widgets.classwork_item_model import ClassworkItemModel, ClassworkFilterProxy, UNTITLED
+from frontend.utils.icon_cache import icon_cache, icon_path
 
 class ClassroomClassworks(QWidget):
     post_selected = pyqtSignal(dict)
@@ -26,12 +29,17 @@ class ClassroomClassworks(QWidget):
         self.controller = controller
         self.controller.set_class(cls["id"])
         self.topic_widgets = []
-        self.untitled_frames = []
+        # Items without a topic, shown first in a section without a header
+        self.untitled_section = None
+        self.collapsed_topics = set()
         
+        self.setup_model()
         self.setup_role_based_ui()
         self.setup_filter()
         self.connect_signals()
         self.initialize_layout()
+        self.setup_pools()
+        self.setup_lazy_sections()
         self.load_posts()
 
     def initialize_layout(self):
@@ -47,12 +55,94 @@ class ClassroomClassworks(QWidget):
                 if item.widget():
                     item.widget().deleteLater()
 
-    def _load_icon(self, path):
-        icon = QIcon()
-        full_path = os.path.join("frontend", "assets", "icons", path)
-        if os.path.exists(full_path):
-            icon.addPixmap(QPixmap(full_path), QIcon.Mode.Normal, QIcon.State.Off)
+    def setup_model(self):
+        """Every classwork item of the class, in the service's topic-grouped order, filtered by a proxy"""
+        self.item_model = ClassworkItemModel(self)
+        self.proxy = ClassworkFilterProxy(self)
+        self.proxy.setSourceModel(self.item_model)
+
+    def setup_pools(self):
+        """Recycle topic widgets and frames across reloads instead of rebuilding them"""
+        holder = self.ui.scrollAreaWidgetContents
+        self.frame_pool = WidgetPool(self.create_frame, holder)
+        self.topic_pool = WidgetPool(self.create_topic_widget, holder)
+
+    def create_frame(self, post):
+        frame = TopicFrame(post, self.controller, self.user_role)
+        # Connected once; the frame keeps the connection while it is recycled
+        frame.post_clicked.connect(self.post_selected.emit)
+        return frame
+
+    def create_topic_widget(self, group):
+        topic_title, topic_posts = group
+        topic_widget = TopicWidget(topic_title, topic_posts, self.controller, self.user_role,
+                                   frame_pool=self.frame_pool, lazy=True)
+        topic_widget.toggled.connect(lambda expanded, widget=topic_widget: self.on_topic_toggled(widget, expanded))
+        return topic_widget
+
+    def create_untitled_section(self):
+        section = TopicWidget(UNTITLED, [], self.controller, self.user_role,
+                              frame_pool=self.frame_pool, lazy=True)
+        section.set_header_visible(False)
+        return section
+
+    def sections(self):
+        """Every section in layout order, the untitled one first."""
+        if self.untitled_section is None:
+            return list(self.topic_widgets)
+        return [self.untitled_section] + self.topic_widgets
+
+    def setup_lazy_sections(self):
+        """Build the frames of topic sections only once they are scrolled into view"""
+        self.build_timer = QTimer(self)
+        self.build_timer.setSingleShot(True)
+        self.build_timer.setInterval(0)
+        self.build_timer.timeout.connect(self.build_visible_sections)
+        scroll_bar = self.ui.topicScrollArea.verticalScrollBar()
+        # rangeChanged also fires when the view is first laid out or resized
+        scroll_bar.valueChanged.connect(self.schedule_build)
+        scroll_bar.rangeChanged.connect(self.schedule_build)
+
+    def schedule_build(self, *args):
+        # Coalesces scroll and resize bursts into one pass over the sections
+        self.build_timer.start()
+
+    def build_visible_sections(self):
+        viewport = self.ui.topicScrollArea.viewport()
+        if not viewport.isVisible():
+            return
+        content = self.ui.scrollAreaWidgetContents
+        if content.height() < content.minimumSizeHint().height():
+            # The scroll area has not resized the content to its new sections yet; try again after it has
+            self.build_timer.start()
+            return
+        # Sections within one screen above or below the viewport are built too
+        margin = viewport.height()
+        top = self.ui.topicScrollArea.verticalScrollBar().value() - margin
+        bottom = top + viewport.height() + 2 * margin
+        for topic_widget in self.sections():
+            if topic_widget.y() > bottom:
+                break
+            if (topic_widget.needs_frames() and topic_widget.isVisible()
+                    and topic_widget.y() + topic_widget.height() >= top):
+                topic_widget.ensure_frames()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Sections loaded while the view was hidden are built once it is shown
+        self.schedule_build()
+
+    def on_topic_toggled(self, topic_widget, expanded):
+        if expanded:
+            self.collapsed_topics.discard(topic_widget.topic_title)
+            topic_widget.ensure_frames()
         else:
+            self.collapsed_topics.add(topic_widget.topic_title)
+
+    def _load_icon(self, path):
+        full_path = icon_path(path)
+        icon = icon_cache.icon(full_path)
+        if icon.isNull():
             print(f"Icon file not found: {full_path}")
             icon = QIcon.fromTheme("list-add")
         return icon
@@ -245,133 +335,90 @@ class ClassroomClassworks(QWidget):
             print(f"Failed to create {type_}")
 
     def load_posts(self, filter_topic=None):
-        """Load posts using refactored MVC pattern."""
-        # Determine filter parameters
-        filter_type = None
-        topic_name = None
-        if filter_topic == "Material":
-            filter_type = "material"
-        elif filter_topic == "Assessment":
-            filter_type = "assessment"
-        elif filter_topic not in ["All", "Material", "Assessment"]:
-            topic_name = filter_topic
-        
-        # Use refactored controller method
-        self.controller.set_filter(filter_type=filter_type, topic_name=topic_name)
-        posts = self.controller.get_classwork_items()
-        
-        # Sort posts: latest first (assuming posts have a timestamp field like 'created_at')
-        try:
-            posts.sort(key=lambda x: x.get('created_at', ''), reverse=True)
-        except:
-            # If sorting fails, keep the original order (assuming it's already newest first)
-            pass
+        """Show the classwork index of the class through the filter proxy."""
+        self.item_model.set_index(self.controller.get_classwork_index())
+        if filter_topic is not None:
+            self.proxy.set_filter(*self.filter_for(filter_topic))
+        self.render_items()
+
+    @staticmethod
+    def filter_for(filter_text):
+        """(filter_type, topic_name) of a filter combo box entry"""
+        if filter_text in (None, "", "All"):
+            return None, None
+        if filter_text == "Material":
+            return "material", None
+        if filter_text == "Assessment":
+            return "assessment", None
+        return None, filter_text
+
+    def render_items(self):
+        """Lay out the items accepted by the proxy: untitled items first, then a section per topic."""
+        groups = self.proxy.grouped_posts()
+        untitled_posts = groups.pop(0)[1] if groups and groups[0][0] == UNTITLED else []
         
         # Get the layout
         scroll_widget = self.ui.scrollAreaWidgetContents
         layout = scroll_widget.layout()
         
-        # Clear previous content
+        # Take previous content out of the layout; the widgets are reused or go back to the pools
         while layout.count():
-            item = layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+            layout.takeAt(0)
         
-        # Clear references
-        self.topic_widgets.clear()
-        self.untitled_frames.clear()
+        # Sections whose topic is still shown keep their widget and built frames
+        sections = {topic_widget.topic_title: topic_widget for topic_widget in self.topic_widgets}
+        shown_topics = {topic_title for topic_title, _ in groups}
+        self.topic_pool.release_all(topic_widget for topic_title, topic_widget in reversed(list(sections.items()))
+                                    if topic_title not in shown_topics)
+        self.topic_widgets = []
         
-        # Add posts to layout
-        if posts:
-            grouped = {}
-            for post in posts:
-                topic_title = post.get("topic", "Untitled")
-                grouped.setdefault(topic_title, []).append(post)
-            
-            # Sort posts within each group by date (latest first)
-            for topic_title in grouped:
-                grouped[topic_title].sort(key=lambda x: x.get('created_at', ''), reverse=True)
-            
-            # Put Untitled group first, then alphabetical order for others
-            sorted_groups = sorted(grouped.items(), 
-                                key=lambda x: (x[0] != "Untitled", x[0] if x[0] != "Untitled" else ""))
-            
-            for topic_title, topic_posts in sorted_groups:
-                if topic_title == "Untitled":
-                    # Add untitled posts directly without TopicWidget container
-                    for post in topic_posts:
-                        from frontend.widgets.topic_frame import TopicFrame
-                        frame = TopicFrame(post, self.controller, self.user_role)
-                        frame.post_clicked.connect(self.post_selected.emit)
-                        layout.addWidget(frame)
-                        self.untitled_frames.append(frame)
-                else:
-                    # Use TopicWidget for posts with topics
-                    topic_widget = TopicWidget(topic_title, topic_posts, self.controller, self.user_role)
-                    
-                    # Connect post selection signal
-                    for frame in topic_widget.frames:
-                        frame.post_clicked.connect(self.post_selected.emit)
-                    
-                    layout.addWidget(topic_widget)
-                    self.topic_widgets.append(topic_widget)
+        # Untitled posts come first, in a section without a header whose frames are built lazily too
+        if self.untitled_section is None:
+            self.untitled_section = self.create_untitled_section()
+        self.untitled_section.set_posts(untitled_posts)
+        self.untitled_section.setVisible(bool(untitled_posts))
+        layout.addWidget(self.untitled_section)
+        
+        # Use TopicWidget for posts with topics; its frames come from the same pool
+        for topic_title, topic_posts in groups:
+            topic_widget = sections.get(topic_title)
+            if topic_widget is not None:
+                topic_widget.set_posts(topic_posts)
+            else:
+                topic_widget = self.topic_pool.acquire((topic_title, topic_posts))
+                topic_widget.set_expanded(topic_title not in self.collapsed_topics)
+            layout.addWidget(topic_widget)
+            self.topic_widgets.append(topic_widget)
         
         layout.addStretch()
+        self.schedule_build()
 
     def filter_posts(self, filter_text):
         """Filter posts based on selection"""
         if not filter_text:
             return
-        
-        # Show all first
-        for topic_widget in self.topic_widgets:
-            topic_widget.setVisible(True)
-            for frame in topic_widget.frames:
-                frame.setVisible(True)
-        
-        for frame in self.untitled_frames:
-            frame.setVisible(True)
-        
-        # Apply filters
-        if filter_text == "All":
-            return  # Already visible
-        
-        elif filter_text == "Material":
-            for frame in self.untitled_frames:
-                frame.setVisible(frame.post["type"] == "material")
-            
-            for widget in self.topic_widgets:
-                has_materials = any(f.post["type"] == "material" for f in widget.frames)
-                widget.setVisible(has_materials)
-                if widget.isVisible():
-                    for frame in widget.frames:
-                        frame.setVisible(frame.post["type"] == "material")
-        
-        elif filter_text == "Assessment":
-            for frame in self.untitled_frames:
-                frame.setVisible(frame.post["type"] == "assessment")
-            
-            for widget in self.topic_widgets:
-                has_assessments = any(f.post["type"] == "assessment" for f in widget.frames)
-                widget.setVisible(has_assessments)
-                if widget.isVisible():
-                    for frame in widget.frames:
-                        frame.setVisible(frame.post["type"] == "assessment")
-        
-        else:  # Topic filter
-            # Hide all untitled frames when filtering by topic
-            for frame in self.untitled_frames:
-                frame.setVisible(False)
-            
-            for widget in self.topic_widgets:
-                widget.setVisible(widget.title_label.text() == filter_text)
-                if widget.isVisible():
-                    for frame in widget.frames:
-                        frame.setVisible(True)
+        if self.proxy.set_filter(*self.filter_for(filter_text)):
+            self.render_items()
+
+    def refresh(self):
+        """Reload after the class data changed outside this view, keeping the selected filter"""
+        combo = self.ui.filterComboBox
+        selected = combo.currentText()
+        combo.blockSignals(True)
+        self.setup_filter()
+        combo.setCurrentIndex(max(combo.findText(selected), 0))
+        combo.blockSignals(False)
+        self.load_posts(combo.currentText())
 
     def clear(self):
         """Clean up method"""
         self.ui.filterComboBox.clear()
+        self.item_model.clear()
+        self.topic_widgets.clear()
+        # Deleted with the rest of the layout below
+        self.untitled_section = None
+        self.frame_pool.clear()
+        self.topic_pool.clear()
         layout = self.ui.scrollAreaWidgetContents.layout()
         if layout:
             while layout.count():
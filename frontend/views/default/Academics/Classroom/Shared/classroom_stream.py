@@ -1,11 +1,35 @@
 # classroom_stream.py
-from PyQt6.QtWidgets import QWidget, QLabel, QFrame, QVBoxLayout, QHBoxLayout, QPushButton,QSizePolicy
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtWidgets import QWidget, QLabel, QFrame, QVBoxLayout, QListView, QAbstractItemView
+from PyQt6.QtCore import pyqtSignal, pyqtSlot, Qt, QObject, QThread, QTimer
 from frontend.widgets.stream_post_ui import Ui_ClassroomStreamContent
+from frontend.widgets.stream_post_list import StreamPostModel, StreamPostDelegate, format_post_date
+
+class StreamLoadWorker(QObject):
+    """Fetches the posts of a class off the GUI thread"""
+    # (load generation, posts)
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, str)
+
+    def __init__(self, controller, generation):
+        super().__init__()
+        self.controller = controller
+        self.generation = generation
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            self.finished.emit(self.generation, self.controller.get_posts())
+        except Exception as e:
+            self.failed.emit(self.generation, str(e))
 
 class ClassroomStream(QWidget):
     post_selected = pyqtSignal(dict)
 
+    # Posts added to the feed per event-loop turn while a large feed fills in
+    RENDER_CHUNK = 200
+    # Load threads still running, kept alive until they finish even if their view closes first
+    _running_loads = set()
+
     def __init__(self, cls, controller, parent=None):
         super().__init__(parent)
         self.cls = cls
@@ -21,9 +45,27 @@ class ClassroomStream(QWidget):
         
         # Setup the existing template widgets
         self.setup_existing_widgets()
+
+        # Setup the list view that renders the posts
+        self.setup_post_list()
+
+        # Posts fetched in the background wait here until their chunk is rendered
+        self._load_generation = 0
+        self._loading = False
+        self._pending_posts = []
+        self._rendered = 0
+        # Posts deleted while a load is in flight; the fetched list may still contain them
+        self._deleted_while_loading = set()
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(0)
+        self._render_timer.timeout.connect(self.render_next_chunk)
         
         self.load_posts()
 
+        # Keep the feed current by patching single posts instead of reloading
+        self.subscribe_to_post_events()
+
     def setup_class_info(self):
         """Set the class information in the header"""
         self.ui.courseCode_label.setText(self.cls.get("code", ""))
@@ -55,36 +97,187 @@ class ClassroomStream(QWidget):
         if syllabus_posts:
             self.post_selected.emit(syllabus_posts[0])
 
+    def setup_post_list(self):
+        """Render the stream with a list view over a posts model; cards are painted, not built"""
+        self.post_model = StreamPostModel(self)
+        self.post_list = QListView()
+        self.post_list.setObjectName("stream_post_list")
+        self.post_delegate = StreamPostDelegate(self.post_list)
+        self.post_list.setModel(self.post_model)
+        self.post_list.setItemDelegate(self.post_delegate)
+        self.post_list.setFrameShape(QFrame.Shape.NoFrame)
+        self.post_list.setStyleSheet("QListView { border: none; background: transparent; }")
+        self.post_list.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.post_list.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.post_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.post_list.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        # Re-measure wrapped titles when the width changes; lay rows out in batches so big feeds open at once
+        self.post_list.setResizeMode(QListView.ResizeMode.Adjust)
+        self.post_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.post_list.setBatchSize(50)
+        self.post_list.setMouseTracking(True)
+        self.post_list.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+        self.post_list.clicked.connect(self.on_post_clicked)
+
+        self.no_posts_label = QLabel("No posts available")
+        self.no_posts_label.setStyleSheet("""
+            QLabel {
+                color: #666;
+                font-size: 14px;
+                padding: 20px;
+                text-align: center;
+            }
+        """)
+        self.no_posts_label.setVisible(False)
+
+        self.loading_label = QLabel("Loading posts...")
+        self.loading_label.setStyleSheet(self.no_posts_label.styleSheet())
+        self.loading_label.setVisible(False)
+
+        stream_layout = self.get_stream_layout()
+        stream_layout.addWidget(self.loading_label)
+        stream_layout.addWidget(self.no_posts_label)
+        stream_layout.addWidget(self.post_list, 1)
+        # The list scrolls itself, so it takes the height the spacers below it used to fill
+        if hasattr(self.ui, 'verticalLayout_6'):
+            self.ui.verticalLayout_6.setStretch(0, 1)
+        if hasattr(self.ui, 'verticalLayout_5'):
+            self.ui.verticalLayout_5.setStretch(0, 1)
+
     def load_posts(self):
-        posts = self.controller.get_posts()
+        """Fetch the posts on a worker thread; the view stays responsive and fills in as they arrive"""
+        self.stop_loading()
+        self.post_model.clear()
+        self.no_posts_label.setVisible(False)
+        self.loading_label.setText("Loading posts...")
+        self.loading_label.setVisible(True)
+        self._loading = True
+
+        thread = QThread()
+        worker = StreamLoadWorker(self.controller, self._load_generation)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.finished.connect(self.on_posts_loaded)
+        worker.failed.connect(self.on_posts_failed)
+        worker.finished.connect(thread.quit)
+        worker.failed.connect(thread.quit)
+        load = (thread, worker)
+        ClassroomStream._running_loads.add(load)
+        thread.finished.connect(lambda: ClassroomStream._running_loads.discard(load))
+        thread.start()
+
+    def stop_loading(self):
+        """Drop any load in progress; a late result is ignored by its generation"""
+        self._load_generation += 1
+        self._render_timer.stop()
+        self._pending_posts = []
+        self._rendered = 0
+        self._deleted_while_loading.clear()
+        self._loading = False
+        self.loading_label.setVisible(False)
+
+    def is_loading(self):
+        return self._loading
+
+    def on_posts_loaded(self, generation, posts):
+        if generation != self._load_generation:
+            return
         print(f"Loading {len(posts)} posts in stream")
-        
-        # Get the stream items layout - this is the correct layout from UI
-        stream_layout = self.get_stream_layout()
-        if not stream_layout:
-            print("Error: Could not find stream layout!")
+        self.no_posts_label.setVisible(not posts)
+        # Add regular posts (excluding syllabus which is handled separately)
+        deleted = self._deleted_while_loading
+        self._pending_posts = [p for p in posts if p.get("title") != "Syllabus" and p.get("id") not in deleted]
+        self._rendered = 0
+        self.render_next_chunk()
+
+    def on_posts_failed(self, generation, error):
+        if generation != self._load_generation:
             return
-        
-        # Clear existing posts (except the template)
-        self.clear_stream_layout(stream_layout)
-        
-        if not posts:
-            no_posts_label = QLabel("No posts available")
-            no_posts_label.setStyleSheet("""
-                QLabel {
-                    color: #666;
-                    font-size: 14px;
-                    padding: 20px;
-                    text-align: center;
-                }
-            """)
-            stream_layout.addWidget(no_posts_label)
+        print(f"Error loading posts: {error}")
+        self._loading = False
+        self.loading_label.setVisible(False)
+        self.no_posts_label.setVisible(True)
+
+    def render_next_chunk(self):
+        """Append the next chunk of fetched posts, then yield to the event loop"""
+        chunk = self._pending_posts[self._rendered:self._rendered + self.RENDER_CHUNK]
+        self._rendered += len(chunk)
+        self.post_model.append_posts(chunk)
+        if self._rendered < len(self._pending_posts):
+            self.loading_label.setText(f"Loading posts... {self._rendered} of {len(self._pending_posts)}")
+            self._render_timer.start()
+        else:
+            self._pending_posts = []
+            self._deleted_while_loading.clear()
+            self._loading = False
+            self.loading_label.setVisible(False)
+
+    def subscribe_to_post_events(self):
+        """Insert, patch or remove single cards when the service reports post changes"""
+        handlers = {
+            "post_added": self.on_post_added,
+            "post_updated": self.on_post_updated,
+            "post_deleted": self.on_post_deleted,
+        }
+        controller = self.controller
+        for event, handler in handlers.items():
+            controller.subscribe(event, handler)
+
+        # Unsubscribe when the view is cleared or destroyed so the service never calls into a
+        # discarded widget; a view can wait a while for deleteLater after being evicted
+        def unsubscribe():
+            for event, handler in handlers.items():
+                controller.unsubscribe(event, handler)
+            handlers.clear()
+        self.unsubscribe_post_events = unsubscribe
+        self.destroyed.connect(unsubscribe)
+
+    def is_stream_post(self, post):
+        """Whether a post belongs in this class's feed (the syllabus has its own card)"""
+        return post.get("class_id") == self.cls["id"] and post.get("title") != "Syllabus"
+
+    def on_post_added(self, post):
+        if post.get("class_id") != self.cls["id"]:
             return
-        
-        # Add regular posts (excluding syllabus which is handled separately)
-        regular_posts = [p for p in posts if p.get("title") != "Syllabus"]
-        for post in regular_posts:
-            self.create_post_widget(post, stream_layout)
+        self.no_posts_label.setVisible(False)
+        if self.is_stream_post(post):
+            self.post_model.insert_post(post)
+
+    def on_post_updated(self, post):
+        if self.post_model.contains(post.get("id")):
+            if self.is_stream_post(post):
+                self.post_model.update_post(post)
+            else:
+                self.post_model.remove_post(post.get("id"))
+        elif self.is_stream_post(post) and not self.is_loading():
+            # Posts still waiting to be rendered are rendered in their updated state
+            self.post_model.insert_post(post)
+
+    def on_post_deleted(self, post):
+        if not self.post_model.remove_post(post.get("id")) and self._loading:
+            # Not rendered yet: make sure the fetched posts do not bring it back
+            self._deleted_while_loading.add(post.get("id"))
+            self._pending_posts[self._rendered:] = [
+                p for p in self._pending_posts[self._rendered:] if p.get("id") != post.get("id")
+            ]
+
+    def refresh(self):
+        """Apply changes made to the class's posts outside this view, patching only the cards that changed"""
+        if self._loading:
+            self.load_posts()
+            return
+        posts = [p for p in self.controller.get_posts() if self.is_stream_post(p)]
+        shown = {p.get("id"): p for p in self.post_model.posts}
+        current_ids = {p.get("id") for p in posts}
+        for post_id in shown.keys() - current_ids:
+            self.post_model.remove_post(post_id)
+        for post in posts:
+            old = shown.get(post.get("id"))
+            if old is None:
+                self.post_model.insert_post(post)
+            elif old != post:
+                self.post_model.update_post(post)
+        self.no_posts_label.setVisible(not self.post_model.posts)
 
     def get_stream_layout(self):
         """Find the correct stream layout from the UI structure"""
@@ -114,248 +307,17 @@ class ClassroomStream(QWidget):
         self.ui.scrollArea.setWidget(fallback_widget)
         return fallback_layout
 
-    def clear_stream_layout(self, stream_layout):
-        """Clear the stream layout while preserving the template"""
-        if not stream_layout:
-            return
-            
-        # Remove all widgets except the template
-        for i in range(stream_layout.count() - 1, -1, -1):
-            item = stream_layout.itemAt(i)
-            if item and item.widget():
-                widget = item.widget()
-                # Don't remove the template post
-                if widget != getattr(self.ui, 'postTemplate', None):
-                    widget.setParent(None)
-                    widget.deleteLater()
-
-                    
-
-    def create_post_widget(self, post, stream_layout):
-        """Create a post widget based on the template with proper spacing and document icon"""
-        try:
-            # Use the template as a base if it exists
-            if hasattr(self.ui, 'postTemplate') and self.ui.postTemplate:
-                # Clone the template structure
-                post_frame = QFrame()
-                post_frame.setStyleSheet(self.ui.postTemplate.styleSheet())
-                post_frame.setFrameShape(self.ui.postTemplate.frameShape())
-                post_frame.setFrameShadow(self.ui.postTemplate.frameShadow())
-                
-                # Create the same layout structure with better spacing
-                layout = QHBoxLayout(post_frame)
-                layout.setContentsMargins(15, 12, 15, 12)  # Increased padding
-                layout.setSpacing(15)  # Increased spacing between icon and content
-                
-                # Icon with document.svg
-                icon_label = QLabel()
-                icon_label.setFixedSize(42, 42)  # Fixed size instead of maximum
-                icon_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #084924;
-                        border-radius: 23px;
-                        border: 2px solid white;
-                        min-width: 42px;
-                        min-height: 42px;
-                    }
-                """)
-                icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                
-                # Load and set the document icon
-                try:
-                    from PyQt6.QtGui import QPixmap
-                    icon_path = "frontend/assets/icons/document.svg"
-                    pixmap = QPixmap(icon_path)
-                    if not pixmap.isNull():
-                        # Scale the icon to fit within the circle
-                        scaled_pixmap = pixmap.scaled(24, 24, Qt.AspectRatioMode.KeepAspectRatio, 
-                                                    Qt.TransformationMode.SmoothTransformation)
-                        icon_label.setPixmap(scaled_pixmap)
-                    else:
-                        # Fallback: use text if icon not found
-                        icon_label.setText("📄")
-                        icon_label.setStyleSheet(icon_label.styleSheet() + """
-                            QLabel {
-                                color: white;
-                                font-size: 16px;
-                            }
-                        """)
-                except Exception as icon_error:
-                    print(f"Error loading icon: {icon_error}")
-                    # Fallback to text icon
-                    icon_label.setText("📄")
-                    icon_label.setStyleSheet(icon_label.styleSheet() + """
-                        QLabel {
-                            color: white;
-                            font-size: 16px;
-                        }
-                    """)
-                
-                layout.addWidget(icon_label)
-                
-                # Content area with proper spacing
-                content_layout = QVBoxLayout()
-                content_layout.setSpacing(8)  # Increased spacing between title and date
-                content_layout.setContentsMargins(0, 0, 0, 0)
-                
-                # Title ONLY - no author mentioned
-                title = post.get("title", "")
-                title_label = QLabel(title)
-                title_label.setStyleSheet("""
-                    QLabel {
-                        font-size: 16px;
-                        border: none;
-                        color: #333;
-                        margin: 0px;
-                        padding: 0px;
-                    }
-                """)
-                title_label.setWordWrap(True)
-                title_label.setMinimumHeight(20)  # Ensure minimum height
-                title_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-                content_layout.addWidget(title_label)
-                
-                # Date
-                date_text = self.format_date(post.get("date", ""))
-                date_label = QLabel(date_text)
-                date_label.setStyleSheet("""
-                    QLabel {
-                        font-size: 14px;
-                        border: none;
-                        color: #666;
-                        margin: 0px;
-                        padding: 0px;
-                    }
-                """)
-                date_label.setMinimumHeight(16)  # Ensure minimum height
-                content_layout.addWidget(date_label)
-                
-                # Add stretch to push content to top and prevent squishing
-                content_layout.addStretch()
-                
-                layout.addLayout(content_layout)
-                layout.addStretch()
-                
-                # Make clickable
-                post_frame.mousePressEvent = lambda event, p=post: self.handle_post_click(event, p)
-                post_frame.setCursor(Qt.CursorShape.PointingHandCursor)
-                
-                stream_layout.addWidget(post_frame)
-                
-            else:
-                # Fallback: simple widget
-                self.create_simple_post_widget(post, stream_layout)
-                
-        except Exception as e:
-            print(f"Error creating post widget: {e}")
-            # Fallback to simple widget
-            self.create_simple_post_widget(post, stream_layout)
-
-    def create_simple_post_widget(self, post, stream_layout):
-        """Create a simple post widget as fallback with proper spacing and icon"""
-        try:
-            # Create a frame instead of just a QLabel for better layout control
-            post_frame = QFrame()
-            post_frame.setStyleSheet("""
-                QFrame {
-                    background-color: white;
-                    border: 1px solid #ddd;
-                    border-radius: 5px;
-                    margin: 5px;
-                }
-            """)
-            
-            layout = QHBoxLayout(post_frame)
-            layout.setContentsMargins(12, 8, 12, 8)
-            layout.setSpacing(10)
-            
-            # Icon with document.svg
-            icon_label = QLabel()
-            icon_label.setFixedSize(30, 30)
-            icon_label.setStyleSheet("""
-                QLabel {
-                    background-color: #084924;
-                    border-radius: 15px;
-                    border: 2px solid white;
-                }
-            """)
-            icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            # Load and set the document icon
-            try:
-                from PyQt6.QtGui import QPixmap
-                icon_path = "frontend/assets/icons/document.svg"
-                pixmap = QPixmap(icon_path)
-                if not pixmap.isNull():
-                    scaled_pixmap = pixmap.scaled(18, 18, Qt.AspectRatioMode.KeepAspectRatio, 
-                                                Qt.TransformationMode.SmoothTransformation)
-                    icon_label.setPixmap(scaled_pixmap)
-                else:
-                    icon_label.setText("📄")
-                    icon_label.setStyleSheet(icon_label.styleSheet() + """
-                        QLabel {
-                            color: white;
-                            font-size: 12px;
-                        }
-                    """)
-            except Exception as icon_error:
-                icon_label.setText("📄")
-                icon_label.setStyleSheet(icon_label.styleSheet() + """
-                    QLabel {
-                        color: white;
-                        font-size: 12px;
-                    }
-                """)
-            
-            layout.addWidget(icon_label)
-            
-            # Content area
-            content_layout = QVBoxLayout()
-            content_layout.setSpacing(4)
-            content_layout.setContentsMargins(0, 0, 0, 0)
-            
-            # Title only
-            title_label = QLabel(post.get('title', ''))
-            title_label.setStyleSheet("font-size: 14px; font-weight: bold;")
-            title_label.setWordWrap(True)
-            title_label.setMinimumHeight(18)
-            content_layout.addWidget(title_label)
-            
-            # Date
-            date_label = QLabel(self.format_date(post.get('date', '')))
-            date_label.setStyleSheet("font-size: 12px; color: #666;")
-            date_label.setMinimumHeight(14)
-            content_layout.addWidget(date_label)
-            
-            layout.addLayout(content_layout, 1)  # Set stretch factor
-            layout.addStretch()
-            
-            post_frame.mousePressEvent = lambda event, p=post: self.handle_post_click(event, p)
-            post_frame.setCursor(Qt.CursorShape.PointingHandCursor)
-            stream_layout.addWidget(post_frame)
-            
-        except Exception as e:
-            print(f"Error creating simple post widget: {e}")
-
     def format_date(self, date_str):
         """Format date string for display"""
-        if not date_str:
-            return ""
-        try:
-            # Convert "2025-08-18 10:00:00" to "Aug 18"
-            from datetime import datetime
-            dt = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-            return dt.strftime("%b %d")
-        except:
-            return date_str.split(" ")[0] if " " in date_str else date_str
-
-    def handle_post_click(self, event, post):
-        if event.button() == Qt.MouseButton.LeftButton:
-            print(f"Stream post clicked: {post['title']}")
-            self.post_selected.emit(post)
+        return format_post_date(date_str)
+
+    def on_post_clicked(self, index):
+        post = self.post_model.post(index.row())
+        print(f"Stream post clicked: {post['title']}")
+        self.post_selected.emit(post)
 
     def clear(self):
-        """Clear the stream layout"""
-        stream_layout = self.get_stream_layout()
-        if stream_layout:
-            self.clear_stream_layout(stream_layout)
\ No newline at end of file
+        """Clear the stream"""
+        self.unsubscribe_post_events()
+        self.stop_loading()
+        self.post_model.clear()
@@ -0,0 +1,90 @@
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QSortFilterProxyModel
+
+from frontend.services.classwork_service import UNTITLED
+
+
+class ClassworkItemModel(QAbstractListModel):
+    """List model over every classwork item of a class, in the order of the service's classwork index."""
+
+    # The post dict of a row.
+    PostRole = Qt.ItemDataRole.UserRole
+    TypeRole = Qt.ItemDataRole.UserRole + 1
+    TopicRole = Qt.ItemDataRole.UserRole + 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.posts = []
+
+    def set_index(self, index):
+        """Load a classwork index of (topic_title, posts) groups."""
+        self.set_posts(post for _, posts in index for post in posts)
+
+    def set_posts(self, posts):
+        self.beginResetModel()
+        self.posts = list(posts)
+        self.endResetModel()
+
+    def clear(self):
+        self.set_posts([])
+
+    def post(self, row):
+        return self.posts[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.posts)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        post = self.posts[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return post.get("title", "")
+        if role == self.PostRole:
+            return post
+        if role == self.TypeRole:
+            return post.get("type")
+        if role == self.TopicRole:
+            return post.get("topic", UNTITLED)
+        return None
+
+
+class ClassworkFilterProxy(QSortFilterProxyModel):
+    """Filters classwork items by type or topic, keeping the grouped order of the source.
+
+    Changing the filter only re-runs filterAcceptsRow; nothing is fetched again.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.filter_type = None
+        self.topic_name = None
+
+    def set_filter(self, filter_type=None, topic_name=None):
+        """Returns whether the filter changed."""
+        if (filter_type, topic_name) == (self.filter_type, self.topic_name):
+            return False
+        self.filter_type = filter_type
+        self.topic_name = topic_name
+        self.invalidateRowsFilter()
+        return True
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        post = self.sourceModel().posts[source_row]
+        if self.filter_type and post.get("type") != self.filter_type:
+            return False
+        if self.topic_name and post.get("topic", UNTITLED) != self.topic_name:
+            return False
+        return True
+
+    def grouped_posts(self):
+        """The accepted items as [(topic_title, posts)], in display order."""
+        groups = []
+        post_role = ClassworkItemModel.PostRole
+        for row in range(self.rowCount()):
+            post = self.index(row, 0).data(post_role)
+            topic = post.get("topic", UNTITLED)
+            if groups and groups[-1][0] == topic:
+                groups[-1][1].append(post)
+            else:
+                groups.append((topic, [post]))
+        return groups
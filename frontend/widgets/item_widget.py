@@ -32,11 +32,8 @@ class ItemWidget(QWidget):
         layout.addWidget(icon_label)
 
         # Title Label
-        author = self.post.get("author", "")
-        type_ = self.post.get("type", "")
-        title_text = f"{author} posted new {type_}: {self.post.get('title', '')}" if author else self.post.get("title", "")
-        title_label = QLabel(title_text, self)
-        title_label.setStyleSheet("""
+        self.title_label = QLabel(self.title_text(), self)
+        self.title_label.setStyleSheet("""
             QLabel {
                 font-size: 14px;
                 font-weight: 400;
@@ -47,16 +44,15 @@ class ItemWidget(QWidget):
                 padding: 2px;          /* Added padding for text */
             }
         """)
-        layout.addWidget(title_label)
+        layout.addWidget(self.title_label)
 
         # Spacer
         spacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
         layout.addItem(spacer)
 
         # Date Label
-        date_text = self.post.get("date", "").split(" ")[0]  # e.g., "2025-08-18"
-        date_label = QLabel(date_text, self)
-        date_label.setStyleSheet("""
+        self.date_label = QLabel(self.date_text(), self)
+        self.date_label.setStyleSheet("""
             QLabel {
                 font-size: 11px;
                 color: #656d76;
@@ -66,8 +62,8 @@ class ItemWidget(QWidget):
                 padding: 2px;          /* Added padding for text */
             }
         """)
-        date_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        layout.addWidget(date_label)
+        self.date_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        layout.addWidget(self.date_label)
 
         # Menu Button (for faculty/admin)
         if self.user_role in ["faculty", "admin"]:
@@ -90,6 +86,20 @@ class ItemWidget(QWidget):
             layout.addWidget(self.menu_button)
             self.menu_button.clicked.connect(self.show_menu)
 
+    def title_text(self):
+        author = self.post.get("author", "")
+        type_ = self.post.get("type", "")
+        return f"{author} posted new {type_}: {self.post.get('title', '')}" if author else self.post.get("title", "")
+
+    def date_text(self):
+        return self.post.get("date", "").split(" ")[0]  # e.g., "2025-08-18"
+
+    def bind(self, post):
+        """Show another post in this widget, keeping the already styled labels."""
+        self.post = post
+        self.title_label.setText(self.title_text())
+        self.date_label.setText(self.date_text())
+
     def show_menu(self):
         menu = QMenu(self)
         menu.setStyleSheet("""
@@ -0,0 +1,250 @@
+from datetime import datetime
+from functools import lru_cache
+
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QRectF, QSize
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen
+
+from frontend.utils.icon_cache import icon_cache, icon_path
+
+
+@lru_cache(maxsize=4096)
+def format_post_date(date_str):
+    """Format a post date for display, e.g. "2025-08-18 10:00:00" -> "Aug 18"."""
+    if not date_str:
+        return ""
+    try:
+        dt = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
+        return dt.strftime("%b %d")
+    except ValueError:
+        return date_str.split(" ")[0] if " " in date_str else date_str
+
+
+class StreamPostModel(QAbstractListModel):
+    """List model over the stream posts of a class (newest first).
+
+    Single posts can be inserted, patched or removed in place, so a new announcement
+    does not rebuild the feed.
+    """
+
+    # The post dict of a row.
+    PostRole = Qt.ItemDataRole.UserRole
+    # The post date formatted for display.
+    DateRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.posts = []
+        self._by_id = {}
+
+    def set_posts(self, posts):
+        self.beginResetModel()
+        self.posts = list(posts)
+        self._by_id = {post.get("id"): post for post in self.posts}
+        self.endResetModel()
+
+    def append_posts(self, posts):
+        """Add older posts after the current rows, skipping any already in the feed."""
+        posts = [post for post in posts if post.get("id") not in self._by_id]
+        if not posts:
+            return
+        first = len(self.posts)
+        self.beginInsertRows(QModelIndex(), first, first + len(posts) - 1)
+        self.posts.extend(posts)
+        self._by_id.update((post.get("id"), post) for post in posts)
+        self.endInsertRows()
+
+    def contains(self, post_id):
+        return post_id in self._by_id
+
+    def row_of(self, post_id):
+        """Row of a post, or -1 if it is not in the feed."""
+        post = self._by_id.get(post_id)
+        if post is None:
+            return -1
+        # list.index checks identity before equality; new posts sit at the top, so this is usually immediate.
+        return self.posts.index(post)
+
+    def _insert_row(self, post):
+        # Posts are newest first; a new post normally lands on row 0 after one comparison.
+        date = post.get("date", "")
+        low, high = 0, len(self.posts)
+        while low < high:
+            middle = (low + high) // 2
+            if self.posts[middle].get("date", "") > date:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def insert_post(self, post):
+        """Add a post at its place in the feed; returns its row."""
+        if post.get("id") in self._by_id:
+            return self.update_post(post)
+        row = self._insert_row(post)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.posts.insert(row, post)
+        self._by_id[post.get("id")] = post
+        self.endInsertRows()
+        return row
+
+    def update_post(self, post):
+        """Replace a post with a newer version of it; returns its row (-1 if it is not in the feed)."""
+        row = self.row_of(post.get("id"))
+        if row < 0:
+            return row
+        date = post.get("date", "")
+        if ((row > 0 and self.posts[row - 1].get("date", "") < date)
+                or (row + 1 < len(self.posts) and self.posts[row + 1].get("date", "") > date)):
+            # A new date moved the post out of order; reinsert it at its new place.
+            self.remove_post(post.get("id"))
+            return self.insert_post(post)
+        self.posts[row] = post
+        self._by_id[post.get("id")] = post
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+        return row
+
+    def remove_post(self, post_id):
+        """Remove a post; returns whether it was in the feed."""
+        row = self.row_of(post_id)
+        if row < 0:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.posts[row]
+        del self._by_id[post_id]
+        self.endRemoveRows()
+        return True
+
+    def clear(self):
+        self.set_posts([])
+
+    def post(self, row):
+        return self.posts[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.posts)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        post = self.posts[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return post.get("title", "")
+        if role == self.DateRole:
+            return format_post_date(post.get("date", ""))
+        if role == self.PostRole:
+            return post
+        return None
+
+
+class StreamPostDelegate(QStyledItemDelegate):
+    """Paints a stream post as the card of the post template: icon badge, title and date.
+
+    Nothing is created per post; only the rows in view are painted. Word-wrapped title
+    heights are cached per view width.
+    """
+
+    # Card geometry, matching the layout of the post template.
+    CARD_SPACING = 10
+    PADDING_X = 15
+    PADDING_Y = 12
+    ICON_SIZE = 42
+    ICON_GLYPH_SIZE = 24
+    ICON_GAP = 15
+    LINE_GAP = 8
+    RADIUS = 8
+    ICON_PATH = icon_path("document.svg")
+
+    # Shared paint resources.
+    BORDER_COLOR = QColor("#084924")
+    HOVER_BORDER_COLOR = QColor("#e9ecef")
+    BADGE_COLOR = QColor("#084924")
+    TITLE_COLOR = QColor("#333")
+    DATE_COLOR = QColor("#666")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.title_font = QFont()
+        self.title_font.setPixelSize(16)
+        self.date_font = QFont()
+        self.date_font.setPixelSize(14)
+        self.glyph_font = QFont()
+        self.glyph_font.setPixelSize(16)
+        self.title_metrics = QFontMetrics(self.title_font)
+        self.date_height = max(QFontMetrics(self.date_font).height(), 16)
+        self._title_heights = {}
+        self._title_width = None
+
+    def icon_pixmap(self, dpr=None):
+        """The document icon scaled to the badge, or a null pixmap if it is missing."""
+        return icon_cache.pixmap(self.ICON_PATH, self.ICON_GLYPH_SIZE, dpr)
+
+    def text_width(self, card_width):
+        return max(card_width - 2 * self.PADDING_X - self.ICON_SIZE - self.ICON_GAP, 40)
+
+    def title_height(self, title, text_width):
+        # Cached heights are only valid for the width they were measured at.
+        if text_width != self._title_width:
+            self._title_heights.clear()
+            self._title_width = text_width
+        height = self._title_heights.get(title)
+        if height is None:
+            rect = self.title_metrics.boundingRect(QRect(0, 0, text_width, 100000),
+                                                   Qt.TextFlag.TextWordWrap, title)
+            height = self._title_heights[title] = max(rect.height(), 20)
+        return height
+
+    def card_width(self, option):
+        view = self.parent()
+        if view is not None and hasattr(view, "viewport"):
+            return view.viewport().width()
+        return option.rect.width()
+
+    def sizeHint(self, option, index):
+        width = self.card_width(option)
+        title = index.data(Qt.ItemDataRole.DisplayRole) or ""
+        content = self.title_height(title, self.text_width(width)) + self.LINE_GAP + self.date_height
+        return QSize(width, max(self.ICON_SIZE, content) + 2 * self.PADDING_Y + self.CARD_SPACING)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = option.rect
+        card = QRectF(rect).adjusted(0.5, 0.5, -0.5, -self.CARD_SPACING - 0.5)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        painter.setPen(QPen(self.HOVER_BORDER_COLOR if hovered else self.BORDER_COLOR, 1))
+        painter.setBrush(Qt.GlobalColor.white)
+        painter.drawRoundedRect(card, self.RADIUS, self.RADIUS)
+
+        # Icon badge, vertically centred like the fixed-size icon label of the template.
+        badge = QRectF(card.left() + self.PADDING_X, card.center().y() - self.ICON_SIZE / 2,
+                       self.ICON_SIZE, self.ICON_SIZE)
+        painter.setPen(QPen(Qt.GlobalColor.white, 2))
+        painter.setBrush(self.BADGE_COLOR)
+        painter.drawEllipse(badge.adjusted(1, 1, -1, -1))
+        icon = self.icon_pixmap(painter.device().devicePixelRatioF())
+        if not icon.isNull():
+            icon_size = icon.deviceIndependentSize()
+            painter.drawPixmap(int(badge.center().x() - icon_size.width() / 2),
+                               int(badge.center().y() - icon_size.height() / 2), icon)
+        else:
+            painter.setFont(self.glyph_font)
+            painter.drawText(badge, Qt.AlignmentFlag.AlignCenter, "📄")
+
+        # Title (word-wrapped) and date, top-aligned next to the badge.
+        text_left = int(badge.right()) + self.ICON_GAP
+        text_width = self.text_width(rect.width())
+        title = index.data(Qt.ItemDataRole.DisplayRole) or ""
+        title_height = self.title_height(title, text_width)
+        top = rect.top() + self.PADDING_Y
+        painter.setFont(self.title_font)
+        painter.setPen(self.TITLE_COLOR)
+        painter.drawText(QRect(text_left, top, text_width, title_height),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap, title)
+        painter.setFont(self.date_font)
+        painter.setPen(self.DATE_COLOR)
+        painter.drawText(QRect(text_left, top + title_height + self.LINE_GAP, text_width, self.date_height),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop,
+                         index.data(StreamPostModel.DateRole) or "")
+        painter.restore()
@@ -34,10 +34,15 @@ class TopicFrame(QFrame):
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)  # Remove spacing
-        item_widget = ItemWidget(self.post, self.controller, self.user_role)
-        layout.addWidget(item_widget)
+        self.item_widget = ItemWidget(self.post, self.controller, self.user_role)
+        layout.addWidget(self.item_widget)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
+    def bind(self, post):
+        """Rebind a recycled frame to another post."""
+        self.post = post
+        self.item_widget.bind(post)
+
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
             self.post_clicked.emit(self.post)
@@ -1,13 +1,27 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame
 from PyQt6.QtCore import pyqtSignal, Qt
 
 from .topic_frame import TopicFrame
 
+# Height a not yet built frame reserves (TopicFrame height plus layout spacing),
+# so the scroll range stays right while sections are filled in.
+FRAME_SLOT_HEIGHT = 78
+
+class TopicHeader(QWidget):
+    clicked = pyqtSignal()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.clicked.emit()
+        super().mousePressEvent(event)
+
 class TopicWidget(QWidget):
     # Define the signal that will be emitted when a post is clicked
     post_selected = pyqtSignal(dict)
-    
-    def __init__(self, topic_title, posts, controller, user_role, parent=None):
+    # Emitted with the expanded state when the header is clicked
+    toggled = pyqtSignal(bool)
+
+    def __init__(self, topic_title, posts, controller, user_role, parent=None, frame_pool=None, lazy=False):
         super().__init__(parent)
         print(f"TopicWidget init: title='{topic_title}', posts count={len(posts)}")
         self.topic_title = topic_title if topic_title is not None else "Untitled"
@@ -15,49 +29,169 @@ class TopicWidget(QWidget):
         self.controller = controller
         self.user_role = user_role
         self.frames = []  # Store frames for potential future filtering
+        self.frame_pool = frame_pool  # Recycles TopicFrames across reloads when given
+        self.expanded = True
+        self.built = False  # Whether the frames of the posts exist yet
         self.setup_ui()
+        if not lazy:
+            self.ensure_frames()
 
     def setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setSpacing(8)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        # Only show title if it's not empty (for untitled posts)
-        if self.topic_title:
-            # Topic Title
-            self.title_label = QLabel(self.topic_title, self)
-            self.title_label.setStyleSheet("""
-                QLabel {
-                    font-size: 40px;
-                    font-weight: 400;
-                    margin-left: 20px;
-                    margin-top: 20px;
-                    margin-bottom: -10px;
-                }
-            """)
-            layout.addWidget(self.title_label)
-
-            # Separator
-            separator = QFrame(self)
-            separator.setMinimumSize(800, 1)
-            separator.setMaximumHeight(1)
-            separator.setStyleSheet("""
-                QFrame {
-                    border: 1px solid #A9A9A9;
-                    background-color: transparent;
-                    margin-left: 20px;
-                }
-            """)
-            separator.setFrameShape(QFrame.Shape.HLine)
-            separator.setFrameShadow(QFrame.Shadow.Sunken)
-            layout.addWidget(separator)
-
-        # Add TopicFrame for each post
-        for post in self.posts:
-            topic_frame = TopicFrame(post, self.controller, self.user_role)
-            # Connect the frame's signal to this widget's signal
-            topic_frame.post_clicked.connect(self.post_selected.emit)
+        # Header: expand arrow, topic title and item count; clicking it collapses the section
+        self.header = TopicHeader(self)
+        self.header.setCursor(Qt.CursorShape.PointingHandCursor)
+        header_layout = QHBoxLayout(self.header)
+        header_layout.setContentsMargins(0, 0, 0, 0)
+        header_layout.setSpacing(0)
+
+        # Topic Title
+        self.title_label = QLabel(self.topic_title, self.header)
+        self.title_label.setStyleSheet("""
+            QLabel {
+                font-size: 40px;
+                font-weight: 400;
+                margin-left: 20px;
+                margin-top: 20px;
+                margin-bottom: -10px;
+            }
+        """)
+        header_layout.addWidget(self.title_label)
+
+        self.count_label = QLabel(self.header)
+        self.count_label.setStyleSheet("""
+            QLabel {
+                font-size: 14px;
+                color: #656d76;
+                margin-left: 12px;
+                margin-top: 30px;
+            }
+        """)
+        header_layout.addWidget(self.count_label)
+        header_layout.addStretch()
+
+        self.arrow_label = QLabel(self.header)
+        self.arrow_label.setStyleSheet("""
+            QLabel {
+                font-size: 20px;
+                color: #656d76;
+                margin-right: 20px;
+                margin-top: 24px;
+            }
+        """)
+        header_layout.addWidget(self.arrow_label)
+        layout.addWidget(self.header)
+        self.header.clicked.connect(self.toggle)
+
+        # Separator
+        separator = self.separator = QFrame(self)
+        separator.setMinimumSize(800, 1)
+        separator.setMaximumHeight(1)
+        separator.setStyleSheet("""
+            QFrame {
+                border: 1px solid #A9A9A9;
+                background-color: transparent;
+                margin-left: 20px;
+            }
+        """)
+        separator.setFrameShape(QFrame.Shape.HLine)
+        separator.setFrameShadow(QFrame.Shadow.Sunken)
+        layout.addWidget(separator)
+
+        # Body holding a TopicFrame for each post, filled in by ensure_frames()
+        self.body = QWidget(self)
+        self.body_layout = QVBoxLayout(self.body)
+        self.body_layout.setSpacing(8)
+        self.body_layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.body)
+        self.update_header()
+
+    def update_header(self):
+        count = len(self.posts)
+        self.count_label.setText(f"{count} item" if count == 1 else f"{count} items")
+        self.arrow_label.setText("▾" if self.expanded else "▸")
+        if not self.built:
+            # Reserve the space of the frames until they are built
+            self.body.setMinimumHeight(len(self.posts) * FRAME_SLOT_HEIGHT)
+
+    def set_header_visible(self, visible):
+        """Show or hide the title row and separator, e.g. for items without a topic."""
+        self.header.setVisible(visible)
+        self.separator.setVisible(visible)
+
+    def needs_frames(self):
+        return self.expanded and not self.built
+
+    def ensure_frames(self):
+        """Build the frames of the posts, once the section is expanded and in view."""
+        if not self.needs_frames():
+            return
+        self.built = True
+        self.body.setMinimumHeight(0)
+        self.add_frames(self.posts)
+
+    def set_expanded(self, expanded):
+        if expanded == self.expanded:
+            return
+        self.expanded = expanded
+        self.body.setVisible(expanded)
+        self.update_header()
+
+    def toggle(self):
+        self.set_expanded(not self.expanded)
+        self.toggled.emit(self.expanded)
+
+    def add_frames(self, posts):
+        for post in posts:
+            if self.frame_pool is not None:
+                # Pooled frames are connected once, by the pool's owner
+                topic_frame = self.frame_pool.acquire(post)
+            else:
+                topic_frame = TopicFrame(post, self.controller, self.user_role)
+                # Connect the frame's signal to this widget's signal
+                topic_frame.post_clicked.connect(self.post_selected.emit)
             self.frames.append(topic_frame)
-            layout.addWidget(topic_frame)
+            self.body_layout.addWidget(topic_frame)
+
+    def set_posts(self, posts):
+        """Show another list of posts; built frames are rebound in place, surplus ones go back to the pool."""
+        self.posts = posts
+        if self.built:
+            kept = min(len(self.frames), len(posts))
+            for frame, post in zip(self.frames, posts):
+                frame.bind(post)
+                frame.setVisible(True)
+            surplus = self.frames[kept:]
+            del self.frames[kept:]
+            for frame in surplus:
+                self.discard_frame(frame)
+            self.add_frames(posts[kept:])
+        self.update_header()
+
+    def bind(self, data):
+        """Reuse this widget for another (topic_title, posts) group."""
+        topic_title, posts = data
+        self.topic_title = topic_title if topic_title is not None else "Untitled"
+        self.title_label.setText(self.topic_title)
+        self.set_posts(posts)
+
+    def discard_frame(self, frame):
+        """Take a frame out of the body; it goes back to the pool, or is deleted without one."""
+        self.body_layout.removeWidget(frame)
+        if self.frame_pool is not None:
+            self.frame_pool.release(frame)
+        else:
+            frame.deleteLater()
+
+    def release_frames(self):
+        """Hand every frame back to the pool (or delete it without one)."""
+        for frame in self.frames:
+            self.discard_frame(frame)
+        self.frames.clear()
+        self.built = False
+        self.update_header()
 
-    # Remove the post_clicked method since we're connecting directly now
\ No newline at end of file
+    # Remove the post_clicked method since we're connecting directly now
@@ -0,0 +1,47 @@
+class WidgetPool:
+    """Keeps released widgets and hands them out again instead of building new ones.
+
+    factory(data) creates a widget; a recycled one is rebound with widget.bind(data),
+    so its children, stylesheets and signal connections are kept. Released widgets
+    are hidden and parked under holder (when given) so they outlive the container
+    they were released from.
+    """
+
+    def __init__(self, factory, holder=None, limit=2000):
+        self.factory = factory
+        self.holder = holder
+        self.limit = limit
+        self.free = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, data):
+        if self.free:
+            widget = self.free.pop()
+            widget.bind(data)
+            widget.setVisible(True)
+            self.reused += 1
+            return widget
+        self.created += 1
+        return self.factory(data)
+
+    def release(self, widget):
+        if len(self.free) >= self.limit:
+            widget.deleteLater()
+            return
+        widget.hide()
+        if self.holder is not None and widget.parent() is not self.holder:
+            widget.setParent(self.holder)
+        self.free.append(widget)
+
+    def release_all(self, widgets):
+        for widget in widgets:
+            self.release(widget)
+
+    def stats(self):
+        return {"free": len(self.free), "created": self.created, "reused": self.reused}
+
+    def clear(self):
+        for widget in self.free:
+            widget.deleteLater()
+        self.free.clear()
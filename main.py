@@ -1,5 +1,5 @@
 from PyQt6.QtWidgets import QWidget, QPushButton, QTabWidget, QVBoxLayout, QHBoxLayout,QButtonGroup,QMainWindow, QStackedWidget, QApplication
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import pyqtSignal, QTimer
 from frontend.views.default.Academics.Classroom.Shared.post_details import PostDetails
 from frontend.views.default.Academics.Classroom.Shared.classroom_home import ClassroomHome
 from frontend.views.default.Academics.Classroom.Shared.classroom_stream import ClassroomStream
@@ -10,16 +10,32 @@ from frontend.services.classwork_service import ClassworkService
 from frontend.controller.classroom_controller import ClassroomController
 from frontend.controller.stream_controller import StreamController
 from frontend.controller.classwork_controller import ClassworkController
+from frontend.utils.icon_cache import icon_cache
+from frontend.utils.view_cache import ViewCache, WIDGET_BYTES, ROW_BYTES
 
 # main.py - Fix the ClassroomView class
 class ClassroomView(QWidget):
     back_clicked = pyqtSignal()
     post_selected = pyqtSignal(dict)  # This should emit the post data
 
-    def __init__(self, cls, user_role, parent=None):
+    # Tabs in display order; each one is built the first time it is shown
+    TABS = ("STREAM", "CLASSWORKS", "STUDENTS", "ATTENDANCE", "GRADES")
+    # Idle time after a tab is shown before the next tab is built in the background
+    PREFETCH_DELAY_MS = 500
+
+    def __init__(self, cls, user_role, parent=None, stream_service=None, classwork_service=None, prefetch=True):
         super().__init__(parent)
         self.cls = cls
         self.user_role = user_role
+        # Services may be shared between views so each data file is parsed once;
+        # otherwise they are created with the tab that needs them
+        self.stream_service = stream_service
+        self.classwork_service = classwork_service
+        self.stream_view = None
+        self.classworks_view = None
+        self.tab_views = {}  # tab name -> built view
+        self.tab_versions = {}  # tab name -> version of the service data it shows
+        self.prefetch = prefetch
         self.setup_ui()
 
     def setup_ui(self):
@@ -72,32 +88,100 @@ class ClassroomView(QWidget):
             }
         """)
         
-        stream_service = StreamService("data/classroom_data.json")
-        classwork_service = ClassworkService("data/classroom_data.json")
-        stream_controller = StreamController(stream_service)
-        classwork_controller = ClassworkController(classwork_service)
-        
-        self.stream_view = ClassroomStream(self.cls, stream_controller)
-        self.classworks_view = ClassroomClassworks(self.cls, self.user_role, classwork_controller)
-        students_view = QWidget()
-        attendance_view = QWidget()
-        grades_view = QWidget()
+        # Lightweight empty pages until a tab is first shown
+        for name in self.TABS:
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            tabs.addTab(page, name)
+        self.tabs = tabs
+        tabs.currentChanged.connect(self.on_tab_changed)
         
-        tabs.addTab(self.stream_view, "STREAM")
-        tabs.addTab(self.classworks_view, "CLASSWORKS")
-        tabs.addTab(students_view, "STUDENTS")
-        tabs.addTab(attendance_view, "ATTENDANCE")
-        tabs.addTab(grades_view, "GRADES")
+        self.prefetch_timer = QTimer(self)
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.setInterval(self.PREFETCH_DELAY_MS)
+        self.prefetch_timer.timeout.connect(self.prefetch_next_tab)
         
+        layout.addWidget(tabs)
+        self.on_tab_changed(tabs.currentIndex())
+
+    def build_stream_tab(self):
+        if self.stream_service is None:
+            self.stream_service = StreamService("data/classroom_data.json")
+        else:
+            self.stream_service.reload_if_changed()
+        self.stream_view = ClassroomStream(self.cls, StreamController(self.stream_service))
         # FIX: Connect the signals properly - remove .emit from the connection
         self.stream_view.post_selected.connect(self.post_selected)
+        self.tab_versions["STREAM"] = self.stream_service.version
+        return self.stream_view
+
+    def build_classworks_tab(self):
+        if self.classwork_service is None:
+            self.classwork_service = ClassworkService("data/classroom_data.json")
+        else:
+            self.classwork_service.reload_if_changed()
+        self.classworks_view = ClassroomClassworks(self.cls, self.user_role, ClassworkController(self.classwork_service))
         self.classworks_view.post_selected.connect(self.post_selected)
-        
-        layout.addWidget(tabs)
+        self.tab_versions["CLASSWORKS"] = self.classwork_service.version
+        return self.classworks_view
+
+    def build_tab(self, name):
+        if name == "STREAM":
+            return self.build_stream_tab()
+        if name == "CLASSWORKS":
+            return self.build_classworks_tab()
+        # STUDENTS, ATTENDANCE and GRADES have no views yet
+        return QWidget()
+
+    def ensure_tab(self, index):
+        """Build the view of a tab into its page, if it is not built yet"""
+        name = self.TABS[index]
+        view = self.tab_views.get(name)
+        if view is None:
+            view = self.tab_views[name] = self.build_tab(name)
+            self.tabs.widget(index).layout().addWidget(view)
+        return view
+
+    def on_tab_changed(self, index):
+        if index < 0:
+            return
+        self.ensure_tab(index)
+        if self.prefetch:
+            self.prefetch_timer.start()
+
+    def prefetch_next_tab(self):
+        """Build the tab after the shown one while the user is still on it"""
+        index = self.tabs.currentIndex() + 1
+        if index < len(self.TABS) and self.TABS[index] not in self.tab_views:
+            self.ensure_tab(index)
+
+    def refresh(self):
+        """Bring a cached view up to date, reloading only built tabs whose data changed on disk"""
+        for name, service, view in (("STREAM", self.stream_service, self.stream_view),
+                                    ("CLASSWORKS", self.classwork_service, self.classworks_view)):
+            if view is None:
+                continue
+            service.reload_if_changed()
+            if service.version != self.tab_versions[name]:
+                view.refresh()
+                self.tab_versions[name] = service.version
+
+    def estimated_memory(self):
+        """Rough bytes kept alive by this view: its widgets plus the posts its models hold"""
+        rows = 0
+        if self.stream_view is not None:
+            rows += self.stream_view.post_model.rowCount()
+        if self.classworks_view is not None:
+            rows += self.classworks_view.item_model.rowCount()
+        return (1 + len(self.findChildren(QWidget))) * WIDGET_BYTES + rows * ROW_BYTES
 
     def clear(self):
-        self.stream_view.clear()
-        self.classworks_view.clear()
+        self.prefetch_timer.stop()
+        if self.stream_view is not None:
+            self.stream_view.clear()
+        if self.classworks_view is not None:
+            self.classworks_view.clear()
 
 # In your MainWindow class - fix the post navigation
 class MainWindow(QMainWindow):
@@ -106,11 +190,18 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Classroom App")
         self.setMinimumSize(940, 530)
         self.setStyleSheet("background-color: white;")
+
+        # Rasterise the shared post and toolbar icons once, before the first classroom opens
+        icon_cache.prewarm()
         
         self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
         
         self.classroom_controller = ClassroomController()
+        self.stream_service = StreamService("data/classroom_data.json")
+        self.classwork_service = ClassworkService("data/classroom_data.json")
+        # Recently opened classrooms stay alive so going back to one is instant
+        self.classroom_views = ViewCache(self.release_classroom_view)
         
         self.home_view = ClassroomHome(user_role="faculty")
         self.home_view.class_selected.connect(self.show_classroom)
@@ -122,15 +213,31 @@ class MainWindow(QMainWindow):
     def show_classroom(self, cls):
         print(f"Showing classroom: {cls['title']}")
         
-        if self.current_classroom_view:
-            self.stacked_widget.removeWidget(self.current_classroom_view)
-            self.current_classroom_view.deleteLater()
+        key = (cls["id"], "faculty")
+        view = self.classroom_views.get(key)
+        if view is None:
+            # Pick up changes made to the data file since the shared services read it
+            self.stream_service.reload_if_changed()
+            self.classwork_service.reload_if_changed()
+            view = ClassroomView(cls, user_role="faculty", stream_service=self.stream_service,
+                                 classwork_service=self.classwork_service)
+            view.back_clicked.connect(self.show_home)
+            view.post_selected.connect(self.show_post)
+            self.stacked_widget.addWidget(view)
+            self.classroom_views.put(key, view)
+        else:
+            view.refresh()
         
-        self.current_classroom_view = ClassroomView(cls, user_role="faculty")
-        self.current_classroom_view.back_clicked.connect(self.show_home)
-        self.current_classroom_view.post_selected.connect(self.show_post)
-        self.stacked_widget.addWidget(self.current_classroom_view)
-        self.stacked_widget.setCurrentWidget(self.current_classroom_view)
+        self.current_classroom_view = view
+        self.stacked_widget.setCurrentWidget(view)
+
+    def release_classroom_view(self, view):
+        """Detach and delete a classroom view evicted from the cache"""
+        if view is self.current_classroom_view:
+            self.current_classroom_view = None
+        self.stacked_widget.removeWidget(view)
+        view.clear()
+        view.deleteLater()
 
     def show_post(self, post):
         print(f"Showing post: {post['title']}")
@@ -154,10 +261,9 @@ class MainWindow(QMainWindow):
 
     def show_home(self):
         print("Showing home")
-        if self.current_classroom_view:
-            self.stacked_widget.removeWidget(self.current_classroom_view)
-            self.current_classroom_view.deleteLater()
-            self.current_classroom_view = None
+        # The classroom stays cached; views grow while used, so re-check the cache bounds
+        self.current_classroom_view = None
+        self.classroom_views.evict()
         self.stacked_widget.setCurrentWidget(self.home_view)
         
 if __name__ == "__main__":